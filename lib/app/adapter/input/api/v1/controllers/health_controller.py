@@ -0,0 +1,47 @@
+# lib/app/adapter/input/api/v1/controllers/health_controller.py
+
+import asyncio
+import os
+import time
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from lib.core.aws.neptune_client import NeptuneConnectionPool
+from lib.core.utils.container import get_connection_pool, graph_index, spec_index
+
+router = APIRouter()
+
+# How long a readiness probe may wait on Neptune, and how long its answer is reused,
+# so frequent probes from every replica do not turn into Neptune load
+READINESS_TIMEOUT_SECONDS = float(os.getenv("READINESS_TIMEOUT_SECONDS", 2))
+READINESS_CACHE_SECONDS = float(os.getenv("READINESS_CACHE_SECONDS", 5))
+
+_last_readiness = {"checked_at": 0.0, "neptune": False}
+
+# Liveness: the process is up and serving; never touches dependencies
+@router.get("/live")
+def live():
+    return {"status": "alive"}
+
+# Readiness: Neptune answers a trivial traversal; 503 until it does
+@router.get("/ready")
+async def ready(pool: NeptuneConnectionPool = Depends(get_connection_pool)):
+    now = time.monotonic()
+    if now - _last_readiness["checked_at"] >= READINESS_CACHE_SECONDS:
+        try:
+            reachable = await asyncio.wait_for(
+                asyncio.to_thread(pool.ping, READINESS_TIMEOUT_SECONDS), READINESS_TIMEOUT_SECONDS * 2
+            )
+        except asyncio.TimeoutError:
+            reachable = False
+        _last_readiness.update(checked_at=now, neptune=reachable)
+
+    checks = {
+        "neptune": _last_readiness["neptune"],
+        # Indexes only speed reads up (reads fall back to Neptune), so they do not gate readiness
+        "graph_index": graph_index.ready if graph_index else None,
+        "spec_index": spec_index.ready if spec_index else None,
+        "pool": pool.stats()
+    }
+    ready_now = checks["neptune"]
+    return JSONResponse(status_code=200 if ready_now else 503,
+                        content={"status": "ready" if ready_now else "not ready", "checks": checks})
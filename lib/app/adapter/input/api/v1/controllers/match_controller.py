@@ -1,18 +1,63 @@
 # lib/app/adapter/input/api/v1/controllers/match_controller.py
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
-from lib.app.domain.dtos.match_dto import MatchDTO
+import base64
+import json
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List, Optional, Tuple
+from lib.app.domain.dtos.match_dto import MatchDTO, MatchSearchBatchDTO
 from lib.app.domain.entities.match import Match
 from lib.app.application.use_cases.match_part_usecase import MatchPartUseCase
 from lib.core.utils.container import get_match_usecase
+from lib.app.adapter.input.api.v1.responses import EntityResponse, ndjson_response, MAX_PAGE_SIZE, EXPORT_BATCH_SIZE
 
 router = APIRouter()
 
+# Deepest match chain the replacements endpoint will follow
+MAX_REPLACEMENT_DEPTH = 5
+
+# Most part numbers a single batch search may ask for
+MAX_SEARCH_BATCH_PARTS = 1000
+
 # Create a match
 @router.post("/", response_model=MatchDTO)
 def create_match(match_dto: MatchDTO, usecase: MatchPartUseCase = Depends(get_match_usecase)):
-    return usecase.create_match(Match(**match_dto.dict()))
+    return EntityResponse(usecase.create_match(Match(**match_dto.dict())))
+
+# Fixed-prefix routes are declared before /{source}/{target}, which would otherwise capture them
+# Transitive replacements: chains of matches up to max_depth, ranked by path quality
+@router.get("/replacements/{part_number}")
+def find_replacements(
+    part_number: str,
+    max_depth: int = Query(3, ge=1, le=MAX_REPLACEMENT_DEPTH),
+    min_match_type: str = Query("Partial", pattern="^(Perfect|Partial|No Match)$"),
+    in_process: bool = False,
+    usecase: MatchPartUseCase = Depends(get_match_usecase)
+):
+    result = usecase.find_replacements(part_number, max_depth, min_match_type, in_process)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Part {part_number} not found")
+    return EntityResponse({"part_number": part_number, "replacements": result})
+
+# Search matches for a part
+@router.get("/search/{part_number}")
+def search_matches(part_number: str, usecase: MatchPartUseCase = Depends(get_match_usecase)):
+    result = usecase.get_matches_for_part(part_number)
+    if not result:
+        raise HTTPException(status_code=404, detail=f"No matches found for part {part_number}")
+    return EntityResponse(result)
+
+# Search matches for many parts in one call; unknown parts map to null and are listed in not_found
+@router.post("/search/batch")
+def search_matches_batch(batch: MatchSearchBatchDTO, usecase: MatchPartUseCase = Depends(get_match_usecase)):
+    if not batch.part_numbers:
+        raise HTTPException(status_code=400, detail="part_numbers must not be empty")
+    if len(batch.part_numbers) > MAX_SEARCH_BATCH_PARTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_SEARCH_BATCH_PARTS} part numbers per batch")
+    results = usecase.get_matches_for_parts(batch.part_numbers)
+    return EntityResponse({
+        "results": results,
+        "not_found": [part_number for part_number, result in results.items() if result is None]
+    })
 
 # Get a match
 @router.get("/{source}/{target}", response_model=MatchDTO)
@@ -20,14 +65,17 @@ def get_match(source: str, target: str, usecase: MatchPartUseCase = Depends(get_
     match = usecase.get_match(source, target)
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
-    return match
+    return EntityResponse(match)
 
 # Update a match
 @router.put("/{source}/{target}", response_model=MatchDTO)
 def update_match(source: str, target: str, match_dto: MatchDTO, usecase: MatchPartUseCase = Depends(get_match_usecase)):
     if source != match_dto.source or target != match_dto.target:
         raise HTTPException(status_code=400, detail="Source/Target mismatch")
-    return usecase.update_match(Match(**match_dto.dict()))
+    try:
+        return EntityResponse(usecase.update_match(Match(**match_dto.dict())))
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Match not found")
 
 # Delete a match
 @router.delete("/{source}/{target}")
@@ -35,15 +83,29 @@ def delete_match(source: str, target: str, usecase: MatchPartUseCase = Depends(g
     success = usecase.delete_match(source, target)
     return {"success": success}
 
-# List all matches
-@router.get("/", response_model=List[MatchDTO])
-def list_matches(usecase: MatchPartUseCase = Depends(get_match_usecase)):
-    return usecase.list_matches()
+def _encode_cursor(match: Match) -> str:
+    return base64.urlsafe_b64encode(json.dumps([match.source, match.target]).encode()).decode()
 
-# Search matches for a part
-@router.get("/search/{part_number}")
-def search_matches(part_number: str, usecase: MatchPartUseCase = Depends(get_match_usecase)):
-    result = usecase.get_matches_for_part(part_number)
-    if not result:
-        raise HTTPException(status_code=404, detail=f"No matches found for part {part_number}")
-    return result
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        source, target = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(source), str(target)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+# List matches: all, one page (limit/cursor, next cursor in X-Next-Cursor) or streamed as NDJSON.
+# The cursor is opaque: the last (source, target) pair of the previous page
+@router.get("/", response_model=List[MatchDTO])
+def list_matches(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+    usecase: MatchPartUseCase = Depends(get_match_usecase)
+):
+    if format == "ndjson":
+        return ndjson_response(usecase.iter_matches(EXPORT_BATCH_SIZE))
+    matches = usecase.list_matches(limit, _decode_cursor(cursor) if cursor else None)
+    headers = {}
+    if limit is not None and len(matches) == limit:
+        headers["X-Next-Cursor"] = _encode_cursor(matches[-1])
+    return EntityResponse(matches, headers=headers)
@@ -1,21 +1,38 @@
 # lib/app/adapter/input/api/v1/controllers/part_controller.py
 
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
-from typing import List
-from io import BytesIO
+import asyncio
+import os
+import shutil
+import tempfile
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Query
+from typing import List, Optional
 
-from lib.app.domain.dtos.part_number_dto import PartNumberDTO
+from lib.app.domain.dtos.part_number_dto import PartNumberDTO, PartProfileDTO
 from lib.app.domain.entities.part_number import PartNumber
 from lib.app.application.use_cases.crud_part_usecase import CrudPartUseCase
 from lib.app.application.use_cases.upload_file_usecase import UploadFileUseCase
-from lib.core.utils.container import get_part_usecase, get_file_usecase
+from lib.app.adapter.input.api.v1.responses import EntityResponse, ndjson_response, MAX_PAGE_SIZE, EXPORT_BATCH_SIZE
+from lib.core.utils.container import get_part_usecase, get_upload_queue
+from lib.core.utils.job_queue import Job, JobQueue
 
 router = APIRouter()
 
+UPLOAD_EXTENSIONS = (".xlsx", ".csv", ".parquet")
+
 # Create a part
 @router.post("/", response_model=PartNumberDTO)
 def create_part(part_dto: PartNumberDTO, usecase: CrudPartUseCase = Depends(get_part_usecase)):
-    return usecase.create_part(PartNumber(**part_dto.dict()))
+    return EntityResponse(usecase.create_part(PartNumber(**part_dto.dict())))
+
+# Similarity search: top-k parts closest to a spec/note profile
+@router.post("/similar")
+def find_similar_parts(
+    profile: PartProfileDTO,
+    k: int = Query(10, ge=1, le=100),
+    exclude: Optional[str] = None,
+    usecase: CrudPartUseCase = Depends(get_part_usecase)
+):
+    return EntityResponse(usecase.find_similar_parts(profile.dict(), k, exclude))
 
 # Get a part by part_number
 @router.get("/{part_number}", response_model=PartNumberDTO)
@@ -23,7 +40,7 @@ def get_part(part_number: str, usecase: CrudPartUseCase = Depends(get_part_useca
     part = usecase.get_part(part_number)
     if not part:
         raise HTTPException(status_code=404, detail="Part not found")
-    return part
+    return EntityResponse(part)
 
 # Update a part
 @router.put("/{part_number}", response_model=PartNumberDTO)
@@ -31,7 +48,7 @@ def update_part(part_number: str, part_dto: PartNumberDTO, usecase: CrudPartUseC
     # Ensure part_number matches
     if part_number != part_dto.part_number:
         raise HTTPException(status_code=400, detail="Part number mismatch")
-    return usecase.update_part(PartNumber(**part_dto.dict()))
+    return EntityResponse(usecase.update_part(PartNumber(**part_dto.dict())))
 
 # Delete a part
 @router.delete("/{part_number}")
@@ -39,15 +56,57 @@ def delete_part(part_number: str, usecase: CrudPartUseCase = Depends(get_part_us
     success = usecase.delete_part(part_number)
     return {"success": success}
 
-# List all parts
+# List parts: all, one page (limit/cursor, next cursor in X-Next-Cursor) or streamed as NDJSON
 @router.get("/", response_model=List[PartNumberDTO])
-def list_parts(usecase: CrudPartUseCase = Depends(get_part_usecase)):
-    return usecase.list_parts()
-
-# Upload Excel file
-@router.post("/upload")
-async def upload_parts(file: UploadFile = File(...), backup_to_s3: bool = True, file_usecase: UploadFileUseCase = Depends(get_file_usecase)):
-    if not file.filename.endswith(".xlsx"):
-        raise HTTPException(status_code=400, detail="Only XLSX files are supported")
-    file_content = await file.read()
-    return await file_usecase.execute(BytesIO(file_content), file.filename)
+def list_parts(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+    usecase: CrudPartUseCase = Depends(get_part_usecase)
+):
+    if format == "ndjson":
+        return ndjson_response(usecase.iter_parts(EXPORT_BATCH_SIZE))
+    parts = usecase.list_parts(limit, cursor)
+    headers = {}
+    if limit is not None and len(parts) == limit:
+        headers["X-Next-Cursor"] = parts[-1].part_number
+    return EntityResponse(parts, headers=headers)
+
+# Upload an XLSX, CSV or Parquet file: staged to disk and processed by a background job
+@router.post("/upload", status_code=202)
+async def upload_parts(
+    file: UploadFile = File(...),
+    backup_to_s3: bool = True,
+    ingest_mode: Optional[str] = Query(None, pattern="^(gremlin|bulk|auto)$"),
+    delta: bool = False,
+    delete_missing: bool = False,
+    upload_queue: JobQueue = Depends(get_upload_queue)
+):
+    if not file.filename.lower().endswith(UPLOAD_EXTENSIONS):
+        raise HTTPException(status_code=400, detail="Only XLSX, CSV and Parquet files are supported")
+    if delete_missing and not delta:
+        raise HTTPException(status_code=400, detail="delete_missing requires delta=true")
+    # The spooled upload is closed with the request; keep a copy the job (and its retries) can read
+    file_path = await asyncio.to_thread(_stage_upload, file.file, os.path.splitext(file.filename)[1])
+    job = upload_queue.submit(Job({
+        "file_path": file_path,
+        "filename": file.filename,
+        "backup_to_s3": backup_to_s3,
+        "ingest_mode": ingest_mode,
+        "delta": delta,
+        "delete_missing": delete_missing
+    }))
+    return {"job_id": job.id, "status": job.status}
+
+def _stage_upload(source, suffix: str) -> str:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(source, tmp)
+        return tmp.name
+
+# Status of a Neptune bulk load started by an upload
+@router.get("/upload/bulk-load/{load_id}")
+async def bulk_load_status(load_id: str):
+    try:
+        return await UploadFileUseCase.get_bulk_load_status(load_id)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=str(e))
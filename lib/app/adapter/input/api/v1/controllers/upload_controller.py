@@ -0,0 +1,54 @@
+# lib/app/adapter/input/api/v1/controllers/upload_controller.py
+
+import time
+from fastapi import APIRouter, HTTPException, Depends
+from lib.app.application.use_cases.upload_file_usecase import UploadFileUseCase
+from lib.core.utils.container import get_upload_queue
+from lib.core.utils.job_queue import Job, JobQueue
+
+router = APIRouter()
+
+async def _job_status(job: Job) -> dict:
+    progress = job.progress
+    started = job.started_at
+    elapsed = ((job.finished_at or time.time()) - started) if started else 0.0
+    status = {
+        "job_id": job.id,
+        "filename": job.payload["filename"],
+        "status": job.status,
+        "attempts": job.attempts,
+        "ingest_mode": progress.ingest_mode if progress else None,
+        "rows_parsed": progress.rows_parsed if progress else 0,
+        "rows_written": progress.rows_written if progress else 0,
+        "rows_per_second": round(progress.rows_written / elapsed, 1) if progress and elapsed else 0.0,
+        "elapsed_seconds": round(elapsed, 3),
+        "errors": (progress.errors if progress else []) or ([job.error] if job.error else []),
+        "bulk_load_id": progress.bulk_load_id if progress else None,
+        "bulk_load_status": None,
+        "result": job.result
+    }
+    if status["bulk_load_id"]:
+        try:
+            loader = await UploadFileUseCase.get_bulk_load_status(status["bulk_load_id"])
+            status["bulk_load_status"] = loader["status"]
+        except Exception as e:
+            status["bulk_load_status"] = f"unavailable: {e}"
+    return status
+
+# Progress of an upload job
+@router.get("/{job_id}")
+async def get_upload(job_id: str, upload_queue: JobQueue = Depends(get_upload_queue)):
+    job = upload_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Upload job not found")
+    return await _job_status(job)
+
+# Retry a failed upload job (writes are upserts, so re-running is safe)
+@router.post("/{job_id}/retry", status_code=202)
+async def retry_upload(job_id: str, upload_queue: JobQueue = Depends(get_upload_queue)):
+    if not upload_queue.get(job_id):
+        raise HTTPException(status_code=404, detail="Upload job not found")
+    job = upload_queue.retry(job_id)
+    if not job:
+        raise HTTPException(status_code=409, detail="Only failed upload jobs can be retried")
+    return {"job_id": job.id, "status": job.status}
@@ -0,0 +1,47 @@
+# lib/app/adapter/input/api/v1/responses.py
+
+import json
+from typing import Any, Iterable
+from fastapi.responses import Response, StreamingResponse
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback: same JSON, just slower
+    orjson = None
+
+# Page size limits for paginated list endpoints, and fetch size for NDJSON exports
+MAX_PAGE_SIZE = 1000
+EXPORT_BATCH_SIZE = 1000
+
+def _default(obj):
+    # Domain entities (PartNumber, Match) serialize through their to_dict()
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, default=_default, separators=(",", ":")).encode()
+
+class EntityResponse(Response):
+    """
+    JSON response that serializes domain entities (and dicts/lists of them) directly,
+    skipping FastAPI's response_model validation and jsonable_encoder passes. Endpoints
+    return it instead of the entities; response_model stays on the route for the OpenAPI schema.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def ndjson_response(items: Iterable) -> StreamingResponse:
+    """
+    Streams entities as newline-delimited JSON, one object per line, as the iterable
+    produces them, so exports never hold the whole result set in memory.
+    """
+    def lines():
+        for item in items:
+            yield dumps(item) + b"\n"
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
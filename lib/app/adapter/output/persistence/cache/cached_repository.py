@@ -0,0 +1,184 @@
+# lib/app/adapter/output/persistence/cache/cached_repository.py
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from lib.app.application.services.repository_interface import RepositoryInterface
+from lib.app.domain.entities.part_number import PartNumber
+from lib.app.domain.entities.match import Match
+from lib.core.cache.cache_backend import CacheBackend
+from lib.core.metrics import instrument_methods
+
+def _part_key(part_number: str) -> str:
+    return f"part:{part_number}"
+
+def _match_key(source: str, target: str) -> str:
+    return f"match:{source}:{target}"
+
+def _matches_for_key(part_number: str) -> str:
+    return f"matches_for:{part_number}"
+
+@instrument_methods
+class CachedRepository(RepositoryInterface):
+    """
+    Read-through cache in front of another repository.
+    get_part, get_match and get_matches_for_part are served from the cache backend when
+    possible; every write through this repository invalidates the keys it affects.
+    Lists are not cached.
+    """
+
+    def __init__(self, repository: RepositoryInterface, cache: CacheBackend):
+        self.repository = repository
+        self.cache = cache
+
+    def _read_through(self, key: str, load):
+        value = self.cache.get(key)
+        if value is None:
+            value = load()
+            if value is not None:
+                self.cache.set(key, value)
+        return value
+
+    def _neighbours(self, part_numbers: List[str]) -> Dict[str, set]:
+        """
+        Parts matched to each of part_numbers, read from the wrapped repository (plus any
+        cached search result): the cache alone misses neighbours whose part was never searched.
+        """
+        neighbours = {part_number: set() for part_number in part_numbers}
+        stored = self.repository.get_matches_for_parts(list(neighbours))
+        for part_number in neighbours:
+            for result in (stored.get(part_number), self.cache.get(_matches_for_key(part_number))):
+                if result:
+                    neighbours[part_number].update(m["replacement_part"].part_number for m in result["matches"])
+        return neighbours
+
+    def _invalidate_parts(self, neighbours: Dict[str, set]):
+        # Neighbours embed the part in their own search results, and its edges are cached
+        # under match keys; neighbours comes from _neighbours, read before the write
+        keys = []
+        for part_number, others in neighbours.items():
+            keys.extend([_part_key(part_number), _matches_for_key(part_number)])
+            for other in others:
+                keys.extend([
+                    _matches_for_key(other),
+                    _match_key(part_number, other),
+                    _match_key(other, part_number)
+                ])
+        if keys:
+            self.cache.delete(*keys)
+
+    def _invalidate_match(self, source: str, target: str):
+        self.cache.delete(_match_key(source, target), _matches_for_key(source), _matches_for_key(target))
+
+    # ---------- PART CRUD ----------
+    def create_part(self, part: PartNumber) -> PartNumber:
+        neighbours = self._neighbours([part.part_number])
+        created = self.repository.create_part(part)
+        self._invalidate_parts(neighbours)
+        return created
+
+    def get_part(self, part_number: str) -> Optional[PartNumber]:
+        return self._read_through(_part_key(part_number), lambda: self.repository.get_part(part_number))
+
+    def update_part(self, part: PartNumber) -> PartNumber:
+        neighbours = self._neighbours([part.part_number])
+        updated = self.repository.update_part(part)
+        self._invalidate_parts(neighbours)
+        return updated
+
+    def delete_part(self, part_number: str) -> bool:
+        neighbours = self._neighbours([part_number])
+        result = self.repository.delete_part(part_number)
+        self._invalidate_parts(neighbours)
+        return result
+
+    def list_parts(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[PartNumber]:
+        return self.repository.list_parts(limit, cursor)
+
+    def create_parts_bulk(self, parts: List[PartNumber], chunk_size: int) -> List[PartNumber]:
+        neighbours = self._neighbours([part.part_number for part in parts])
+        created = self.repository.create_parts_bulk(parts, chunk_size)
+        self._invalidate_parts(neighbours)
+        return created
+
+    def get_part_ids(self, part_numbers: List[str]) -> Dict[str, str]:
+        return self.repository.get_part_ids(part_numbers)
+
+    # ---------- MATCH CRUD ----------
+    def create_match(self, match: Match) -> Match:
+        created = self.repository.create_match(match)
+        self._invalidate_match(match.source, match.target)
+        return created
+
+    def get_match(self, source: str, target: str) -> Optional[Match]:
+        return self._read_through(_match_key(source, target), lambda: self.repository.get_match(source, target))
+
+    def update_match(self, match: Match) -> Match:
+        updated = self.repository.update_match(match)
+        self._invalidate_match(match.source, match.target)
+        return updated
+
+    def delete_match(self, source: str, target: str) -> bool:
+        result = self.repository.delete_match(source, target)
+        self._invalidate_match(source, target)
+        return result
+
+    def update_matches_bulk(self, matches: List[Match], chunk_size: int) -> List[Match]:
+        updated = self.repository.update_matches_bulk(matches, chunk_size)
+        for match in matches:
+            self._invalidate_match(match.source, match.target)
+        return updated
+
+    def delete_matches_bulk(self, pairs: List[Tuple[str, str]], chunk_size: int) -> int:
+        result = self.repository.delete_matches_bulk(pairs, chunk_size)
+        for source, target in pairs:
+            self._invalidate_match(source, target)
+        return result
+
+    def list_matches(self, limit: Optional[int] = None, cursor: Optional[Tuple[str, str]] = None) -> List[Match]:
+        return self.repository.list_matches(limit, cursor)
+
+    def create_matches_bulk(self, matches: List[Match], chunk_size: int) -> List[Match]:
+        created = self.repository.create_matches_bulk(matches, chunk_size)
+        for match in matches:
+            self._invalidate_match(match.source, match.target)
+        return created
+
+    # ---------- FINGERPRINTS ----------
+    # Never cached: a delta upload must compare against what is actually stored
+    def get_part_fingerprints(self, part_numbers: List[str]) -> Dict[str, Optional[str]]:
+        return self.repository.get_part_fingerprints(part_numbers)
+
+    def get_match_fingerprints(self, sources: List[str]) -> Dict[Tuple[str, str], Optional[str]]:
+        return self.repository.get_match_fingerprints(sources)
+
+    # ---------- TRANSITIVE REPLACEMENTS ----------
+    def find_replacements(self, part_number: str, max_depth: int, match_types: Optional[List[str]] = None,
+                          in_process: bool = False):
+        return self.repository.find_replacements(part_number, max_depth, match_types, in_process)
+
+    # ---------- SIMILARITY ----------
+    def find_similar_parts(self, profile: dict, k: int, exclude: Optional[str] = None):
+        return self.repository.find_similar_parts(profile, k, exclude)
+
+    # ---------- EXTERNAL WRITES ----------
+    def invalidate(self, part_numbers: Iterable[str]):
+        part_numbers = list(part_numbers)
+        self.repository.invalidate(part_numbers)
+        # Written already: the stored neighbours are the new ones, the cached ones the old
+        self._invalidate_parts(self._neighbours(part_numbers))
+
+    # ---------- GET MATCHES FOR PART ----------
+    def get_matches_for_part(self, part_number: str):
+        return self._read_through(
+            _matches_for_key(part_number),
+            lambda: self.repository.get_matches_for_part(part_number)
+        )
+
+    def get_matches_for_parts(self, part_numbers: List[str]) -> dict:
+        results = {part_number: self.cache.get(_matches_for_key(part_number)) for part_number in part_numbers}
+        missing = [part_number for part_number, result in results.items() if result is None]
+        if missing:
+            for part_number, result in self.repository.get_matches_for_parts(missing).items():
+                if result is not None:
+                    self.cache.set(_matches_for_key(part_number), result)
+                results[part_number] = result
+        return results
@@ -0,0 +1,297 @@
+# lib/app/adapter/output/persistence/memory/graph_index.py
+
+import threading
+import time
+from array import array
+from typing import Iterable, Iterator, List, Optional
+from lib.app.domain.entities.part_number import PartNumber
+from lib.app.domain.entities.match import Match
+from lib.app.domain.services.replacement_search import rank_paths
+
+# Match types are stored as small ints; unknown types get the next free code
+DEFAULT_MATCH_TYPES = ("Perfect", "Partial", "No Match")
+
+# Edge scores are stored as float32; NaN stands for "no score"
+NO_SCORE = float("nan")
+
+def _score_value(score: Optional[float]) -> float:
+    return NO_SCORE if score is None else float(score)
+
+def _score_or_none(value: float) -> Optional[float]:
+    return None if value != value else round(value, 6)
+
+class GraphIndex:
+    """
+    In-memory PartNumber/MATCHED adjacency index.
+    Part numbers are interned to dense ints; each node keeps array-backed out/in neighbour
+    lists with parallel arrays of match-type codes and scores. Built from a snapshot with load() and
+    kept fresh by the incremental upsert/remove calls made from the write paths.
+    Parts marked dirty (written behind the index's back, or while a load's snapshot was being
+    read) are not served until the next load; neither are match lists that reach one.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._type_codes = {}
+        self._type_names = []
+        for match_type in DEFAULT_MATCH_TYPES:
+            self._type_code(match_type)
+        self._reset()
+        self._refresh_writes: Optional[set] = None
+        self.ready = False
+        self.loaded_at: Optional[float] = None
+
+    def _reset(self):
+        self._ids = {}
+        self._parts: List[Optional[PartNumber]] = []
+        self._out: List[array] = []
+        self._out_types: List[array] = []
+        self._out_scores: List[array] = []
+        self._in: List[array] = []
+        self._in_types: List[array] = []
+        self._in_scores: List[array] = []
+        self._dirty = set()
+
+    def _type_code(self, match_type: str) -> int:
+        code = self._type_codes.get(match_type)
+        if code is None:
+            code = len(self._type_names)
+            self._type_codes[match_type] = code
+            self._type_names.append(match_type)
+        return code
+
+    def _node(self, part_number: str) -> int:
+        node = self._ids.get(part_number)
+        if node is None:
+            node = len(self._parts)
+            self._ids[part_number] = node
+            self._parts.append(None)
+            self._out.append(array("I"))
+            self._out_types.append(array("B"))
+            self._out_scores.append(array("f"))
+            self._in.append(array("I"))
+            self._in_types.append(array("B"))
+            self._in_scores.append(array("f"))
+        return node
+
+    def _live_node(self, part_number: str) -> Optional[int]:
+        node = self._ids.get(part_number)
+        if node is None or self._parts[node] is None or part_number in self._dirty:
+            return None
+        return node
+
+    def _reaches_dirty(self, nodes: Iterable[int]) -> bool:
+        return bool(self._dirty) and any(
+            self._parts[n] is not None and self._parts[n].part_number in self._dirty for n in nodes
+        )
+
+    def _touch(self, *part_numbers: str):
+        if self._refresh_writes is not None:
+            self._refresh_writes.update(part_numbers)
+
+    # ---------- SNAPSHOT ----------
+    def begin_refresh(self):
+        """
+        Call before reading the snapshot the next load() swaps in. Parts written from then on
+        may be missing from (or older in) that snapshot, so load() leaves them dirty.
+        """
+        with self._lock:
+            self._refresh_writes = set()
+
+    def load(self, parts: Iterable[PartNumber], matches: Iterable[Match]):
+        """Rebuilds the whole index from a snapshot of parts and matches."""
+        with self._lock:
+            self._reset()
+            for part in parts:
+                self._parts[self._node(part.part_number)] = part
+            for match in matches:
+                self._add_edge(match, overwrite=True)
+            if self._refresh_writes:
+                self._dirty.update(self._refresh_writes)
+            self._refresh_writes = None
+            self.ready = True
+            self.loaded_at = time.time()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "parts": sum(1 for p in self._parts if p is not None),
+                "edges": sum(len(out) for out in self._out),
+                "dirty": len(self._dirty),
+                "loaded_at": self.loaded_at
+            }
+
+    # ---------- INCREMENTAL UPDATES ----------
+    def upsert_part(self, part: PartNumber):
+        with self._lock:
+            self._touch(part.part_number)
+            self._parts[self._node(part.part_number)] = part
+
+    def remove_part(self, part_number: str):
+        with self._lock:
+            self._touch(part_number)
+            node = self._ids.get(part_number)
+            if node is None:
+                return
+            # Neighbours lose an edge: after a refresh they are as stale as the part itself
+            self._touch(*(self._parts[n].part_number for n in (*self._out[node], *self._in[node])
+                          if self._parts[n] is not None))
+            for other in list(self._out[node]):
+                self._drop(self._in[other], self._in_types[other], self._in_scores[other], node)
+            for other in list(self._in[node]):
+                self._drop(self._out[other], self._out_types[other], self._out_scores[other], node)
+            self._parts[node] = None
+            self._out[node], self._out_types[node], self._out_scores[node] = array("I"), array("B"), array("f")
+            self._in[node], self._in_types[node], self._in_scores[node] = array("I"), array("B"), array("f")
+
+    def mark_dirty(self, part_numbers: Iterable[str]):
+        with self._lock:
+            part_numbers = list(part_numbers)
+            self._touch(*part_numbers)
+            self._dirty.update(part_numbers)
+
+    def add_match(self, match: Match, overwrite: bool = False):
+        """
+        Adds the edge; an existing edge keeps its type/score unless overwrite (like create_match).
+        An edge to a part the index does not serve marks both ends dirty instead.
+        """
+        with self._lock:
+            self._touch(match.source, match.target)
+            if self._live_node(match.source) is None or self._live_node(match.target) is None:
+                self._dirty.update((match.source, match.target))
+                return
+            self._add_edge(match, overwrite)
+
+    def remove_match(self, source: str, target: str):
+        with self._lock:
+            self._touch(source, target)
+            s, t = self._ids.get(source), self._ids.get(target)
+            if s is None or t is None:
+                return
+            self._drop(self._out[s], self._out_types[s], self._out_scores[s], t)
+            self._drop(self._in[t], self._in_types[t], self._in_scores[t], s)
+
+    def _add_edge(self, match: Match, overwrite: bool):
+        s, t = self._node(match.source), self._node(match.target)
+        code = self._type_code(match.match_type or "")
+        score = _score_value(match.score)
+        neighbours = self._out[s]
+        if t in neighbours:
+            if overwrite:
+                i, j = neighbours.index(t), self._in[t].index(s)
+                self._out_types[s][i] = self._in_types[t][j] = code
+                # A match update without a score keeps the stored one (like update_match)
+                if match.score is not None:
+                    self._out_scores[s][i] = self._in_scores[t][j] = score
+            return
+        neighbours.append(t)
+        self._out_types[s].append(code)
+        self._out_scores[s].append(score)
+        self._in[t].append(s)
+        self._in_types[t].append(code)
+        self._in_scores[t].append(score)
+
+    @staticmethod
+    def _drop(neighbours: array, types: array, scores: array, node: int):
+        if node in neighbours:
+            i = neighbours.index(node)
+            del neighbours[i]
+            del types[i]
+            del scores[i]
+
+    # ---------- READS (None = not known here, ask the repository) ----------
+    def knows(self, part_number: str) -> bool:
+        with self._lock:
+            return self.ready and self._live_node(part_number) is not None
+
+    def get_part(self, part_number: str) -> Optional[PartNumber]:
+        with self._lock:
+            node = self._live_node(part_number) if self.ready else None
+            return self._parts[node] if node is not None else None
+
+    def get_match(self, source: str, target: str) -> Optional[Match]:
+        with self._lock:
+            if not self.ready:
+                return None
+            s, t = self._live_node(source), self._live_node(target)
+            if s is None or t is None or t not in self._out[s]:
+                return None
+            i = self._out[s].index(t)
+            return Match(source, target, self._type_names[self._out_types[s][i]], _score_or_none(self._out_scores[s][i]))
+
+    def matches_from(self, source: str) -> Optional[List[Match]]:
+        """Outgoing edges of source."""
+        with self._lock:
+            s = self._live_node(source) if self.ready else None
+            if s is None or self._reaches_dirty(self._out[s]):
+                return None
+            return [
+                Match(source, self._parts[t].part_number, self._type_names[code], _score_or_none(score))
+                for t, code, score in zip(self._out[s], self._out_types[s], self._out_scores[s])
+                if self._parts[t] is not None
+            ]
+
+    def iter_matches(self) -> Iterator[Match]:
+        """Every edge between live parts, grouped by source part in interning order."""
+        with self._lock:
+            matches = [
+                Match(self._parts[s].part_number, self._parts[t].part_number, self._type_names[code], _score_or_none(score))
+                for s in range(len(self._parts)) if self._parts[s] is not None
+                for t, code, score in zip(self._out[s], self._out_types[s], self._out_scores[s])
+                if self._parts[t] is not None
+            ]
+        return iter(matches)
+
+    def get_matches_for_part(self, part_number: str):
+        with self._lock:
+            node = self._live_node(part_number) if self.ready else None
+            if node is None or self._reaches_dirty(self._out[node]) or self._reaches_dirty(self._in[node]):
+                return None
+            matches = []
+            for neighbours, types, scores in ((self._out[node], self._out_types[node], self._out_scores[node]),
+                                              (self._in[node], self._in_types[node], self._in_scores[node])):
+                for other, code, score in zip(neighbours, types, scores):
+                    if self._parts[other] is None:
+                        continue
+                    matches.append({
+                        "replacement_part": self._parts[other],
+                        "match_type": self._type_names[code],
+                        "score": _score_or_none(score)
+                    })
+            return {"part": self._parts[node], "matches": matches}
+
+    def find_replacements(self, part_number: str, max_depth: int, match_types: Optional[List[str]] = None,
+                          max_paths: int = 10000):
+        """
+        In-process equivalent of the repository's transitive search: depth-first over simple
+        paths of at most max_depth edges, in either direction, capped at max_paths paths.
+        """
+        with self._lock:
+            start = self._live_node(part_number) if self.ready else None
+            if start is None:
+                return None
+            allowed = None
+            if match_types:
+                allowed = {self._type_codes[t] for t in match_types if t in self._type_codes}
+
+            paths = []
+            stack = [(start, [start], [])]
+            while stack and len(paths) < max_paths:
+                node, nodes, codes = stack.pop()
+                if len(codes) >= max_depth:
+                    continue
+                for neighbours, types in ((self._out[node], self._out_types[node]), (self._in[node], self._in_types[node])):
+                    for other, code in zip(neighbours, types):
+                        if other in nodes or self._parts[other] is None or (allowed is not None and code not in allowed):
+                            continue
+                        paths.append((nodes + [other], codes + [code]))
+                        stack.append((other, nodes + [other], codes + [code]))
+            if self._reaches_dirty({n for nodes, _ in paths for n in nodes}):
+                return None
+
+            ranked = rank_paths(part_number, [
+                ([self._parts[n].part_number for n in nodes], [self._type_names[c] for c in codes])
+                for nodes, codes in paths[:max_paths]
+            ])
+            return [{"replacement_part": self._parts[self._ids[r["part_number"]]], **r} for r in ranked]
@@ -0,0 +1,166 @@
+# lib/app/adapter/output/persistence/memory/in_memory_repository.py
+
+import bisect
+import threading
+from typing import Dict, List, Optional, Tuple
+from lib.app.application.services.repository_interface import RepositoryInterface
+from lib.app.adapter.output.persistence.memory.graph_index import GraphIndex
+from lib.app.adapter.output.persistence.memory.spec_index import SpecIndex
+from lib.app.domain.entities.part_number import PartNumber, part_vertex_id
+from lib.app.domain.entities.match import Match
+from lib.app.domain.services.fingerprint import part_fingerprint, match_fingerprint
+from lib.core.metrics import instrument_methods
+
+@instrument_methods
+class InMemoryRepository(RepositoryInterface):
+    """
+    Process-local stand-in for NeptuneRepository with the same semantics (upserted parts,
+    create_match never duplicating an edge, keyset-paged list_parts, ...), built on the
+    GraphIndex and SpecIndex. Lets benchmarks and local runs exercise the use cases and
+    API without a Neptune cluster.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._sorted_part_numbers: List[str] = []
+        self.graph = GraphIndex()
+        self.graph.load([], [])
+        self.specs = SpecIndex()
+        self.specs.load([])
+        # Fingerprint stored with each edge, as Neptune keeps it on the MATCHED edge
+        self._match_fingerprints: Dict[Tuple[str, str], str] = {}
+
+    def _upsert(self, part: PartNumber):
+        if not part.id:
+            part.id = part_vertex_id(part.part_number)
+        with self._lock:
+            if not self.graph.knows(part.part_number):
+                bisect.insort(self._sorted_part_numbers, part.part_number)
+            self.graph.upsert_part(part)
+            self.specs.upsert_part(part)
+
+    # ---------- PART CRUD ----------
+    def create_part(self, part: PartNumber) -> PartNumber:
+        self._upsert(part)
+        return part
+
+    def get_part(self, part_number: str) -> Optional[PartNumber]:
+        return self.graph.get_part(part_number)
+
+    def update_part(self, part: PartNumber) -> PartNumber:
+        existing = self.graph.get_part(part.part_number)
+        if existing is None:
+            raise ValueError(f"Part {part.part_number} not found")
+        part.id = existing.id
+        self._upsert(part)
+        return part
+
+    def delete_part(self, part_number: str) -> bool:
+        with self._lock:
+            if self.graph.knows(part_number):
+                i = bisect.bisect_left(self._sorted_part_numbers, part_number)
+                del self._sorted_part_numbers[i]
+                for match in (self.graph.get_matches_for_part(part_number) or {}).get("matches", []):
+                    other = match["replacement_part"].part_number
+                    self._match_fingerprints.pop((part_number, other), None)
+                    self._match_fingerprints.pop((other, part_number), None)
+            self.graph.remove_part(part_number)
+            self.specs.remove_part(part_number)
+        return True
+
+    def list_parts(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[PartNumber]:
+        with self._lock:
+            start = bisect.bisect_right(self._sorted_part_numbers, cursor) if cursor is not None else 0
+            end = start + limit if limit is not None else None
+            part_numbers = self._sorted_part_numbers[start:end]
+        return [self.graph.get_part(pn) for pn in part_numbers]
+
+    def create_parts_bulk(self, parts: List[PartNumber], chunk_size: int) -> List[PartNumber]:
+        for part in parts:
+            self._upsert(part)
+        return parts
+
+    def get_part_ids(self, part_numbers: List[str]) -> Dict[str, str]:
+        parts = (self.graph.get_part(part_number) for part_number in part_numbers)
+        return {part.part_number: part.id for part in parts if part}
+
+    # ---------- MATCH CRUD ----------
+    def _add_match(self, match: Match):
+        # Like Neptune, an edge whose endpoints do not exist is skipped
+        with self._lock:
+            if not (self.graph.knows(match.source) and self.graph.knows(match.target)):
+                return
+            if self.graph.get_match(match.source, match.target) is None:
+                self._match_fingerprints[(match.source, match.target)] = match_fingerprint(match)
+            self.graph.add_match(match)
+
+    def create_match(self, match: Match) -> Match:
+        self._add_match(match)
+        return match
+
+    def get_match(self, source: str, target: str) -> Optional[Match]:
+        return self.graph.get_match(source, target)
+
+    def update_match(self, match: Match) -> Match:
+        with self._lock:
+            if self.graph.get_match(match.source, match.target) is None:
+                raise ValueError(f"Match {match.source} -> {match.target} not found")
+            self.graph.add_match(match, overwrite=True)
+            # Without a score the stored one is kept and the fingerprint dropped (like Neptune)
+            if match.score is not None:
+                self._match_fingerprints[(match.source, match.target)] = match_fingerprint(match)
+            else:
+                self._match_fingerprints.pop((match.source, match.target), None)
+        return match
+
+    def delete_match(self, source: str, target: str) -> bool:
+        with self._lock:
+            self.graph.remove_match(source, target)
+            self._match_fingerprints.pop((source, target), None)
+        return True
+
+    def list_matches(self, limit: Optional[int] = None, cursor: Optional[Tuple[str, str]] = None) -> List[Match]:
+        if limit is None and cursor is None:
+            return list(self.graph.iter_matches())
+        with self._lock:
+            start = bisect.bisect_left(self._sorted_part_numbers, cursor[0]) if cursor is not None else 0
+            sources = self._sorted_part_numbers[start:]
+        matches = []
+        for source in sources:
+            for match in sorted(self.graph.matches_from(source) or [], key=lambda m: m.target):
+                if cursor is not None and (match.source, match.target) <= cursor:
+                    continue
+                matches.append(match)
+                if len(matches) == limit:
+                    return matches
+        return matches
+
+    def create_matches_bulk(self, matches: List[Match], chunk_size: int) -> List[Match]:
+        for match in matches:
+            self._add_match(match)
+        return matches
+
+    # ---------- FINGERPRINTS ----------
+    # Parts: computed from the stored entity, which is always written whole. Matches: the
+    # fingerprint stored with the edge, None when it has none (like Neptune)
+    def get_part_fingerprints(self, part_numbers: List[str]) -> Dict[str, Optional[str]]:
+        parts = {part_number: self.graph.get_part(part_number) for part_number in part_numbers}
+        return {part_number: part_fingerprint(part) for part_number, part in parts.items() if part}
+
+    def get_match_fingerprints(self, sources: List[str]) -> Dict[Tuple[str, str], Optional[str]]:
+        return {
+            (match.source, match.target): self._match_fingerprints.get((match.source, match.target))
+            for source in sources
+            for match in self.graph.matches_from(source) or []
+        }
+
+    # ---------- SEARCH ----------
+    def get_matches_for_part(self, part_number: str):
+        return self.graph.get_matches_for_part(part_number)
+
+    def find_replacements(self, part_number: str, max_depth: int, match_types: Optional[List[str]] = None,
+                          in_process: bool = False):
+        return self.graph.find_replacements(part_number, max_depth, match_types)
+
+    def find_similar_parts(self, profile: dict, k: int, exclude: Optional[str] = None):
+        return self.specs.search(profile, k, exclude)
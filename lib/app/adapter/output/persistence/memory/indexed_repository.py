@@ -0,0 +1,158 @@
+# lib/app/adapter/output/persistence/memory/indexed_repository.py
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from lib.app.application.services.repository_interface import RepositoryInterface
+from lib.app.adapter.output.persistence.memory.graph_index import GraphIndex
+from lib.app.adapter.output.persistence.memory.spec_index import SpecIndex
+from lib.app.domain.entities.part_number import PartNumber
+from lib.app.domain.entities.match import Match
+from lib.core.metrics import instrument_methods
+
+@instrument_methods
+class IndexedRepository(RepositoryInterface):
+    """
+    Serves reads from in-memory indexes, falling back to the wrapped repository when an
+    index is not enabled, not loaded, or does not know the part/edge:
+    - GraphIndex: get_match, get_matches_for_part and in-process find_replacements
+    - SpecIndex: find_similar_parts
+    Writes go to the wrapped repository first, then update the indexes.
+    """
+
+    def __init__(self, repository: RepositoryInterface, index: Optional[GraphIndex] = None,
+                 spec_index: Optional[SpecIndex] = None):
+        self.repository = repository
+        self.index = index
+        self.spec_index = spec_index
+
+    def _upsert_part(self, part: PartNumber):
+        if self.index:
+            self.index.upsert_part(part)
+        if self.spec_index:
+            self.spec_index.upsert_part(part)
+
+    # ---------- PART CRUD ----------
+    def create_part(self, part: PartNumber) -> PartNumber:
+        created = self.repository.create_part(part)
+        self._upsert_part(part)
+        return created
+
+    def get_part(self, part_number: str) -> Optional[PartNumber]:
+        return self.repository.get_part(part_number)
+
+    def update_part(self, part: PartNumber) -> PartNumber:
+        updated = self.repository.update_part(part)
+        self._upsert_part(updated or part)
+        return updated
+
+    def delete_part(self, part_number: str) -> bool:
+        result = self.repository.delete_part(part_number)
+        if self.index:
+            self.index.remove_part(part_number)
+        if self.spec_index:
+            self.spec_index.remove_part(part_number)
+        return result
+
+    def list_parts(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[PartNumber]:
+        return self.repository.list_parts(limit, cursor)
+
+    def create_parts_bulk(self, parts: List[PartNumber], chunk_size: int) -> List[PartNumber]:
+        created = self.repository.create_parts_bulk(parts, chunk_size)
+        for part in parts:
+            self._upsert_part(part)
+        return created
+
+    def get_part_ids(self, part_numbers: List[str]) -> Dict[str, str]:
+        return self.repository.get_part_ids(part_numbers)
+
+    # ---------- MATCH CRUD ----------
+    def create_match(self, match: Match) -> Match:
+        created = self.repository.create_match(match)
+        if self.index:
+            self.index.add_match(match)
+        return created
+
+    def get_match(self, source: str, target: str) -> Optional[Match]:
+        match = self.index.get_match(source, target) if self.index else None
+        return match or self.repository.get_match(source, target)
+
+    def update_match(self, match: Match) -> Match:
+        updated = self.repository.update_match(match)
+        if self.index:
+            self.index.add_match(match, overwrite=True)
+        return updated
+
+    def delete_match(self, source: str, target: str) -> bool:
+        result = self.repository.delete_match(source, target)
+        if self.index:
+            self.index.remove_match(source, target)
+        return result
+
+    def update_matches_bulk(self, matches: List[Match], chunk_size: int) -> List[Match]:
+        updated = self.repository.update_matches_bulk(matches, chunk_size)
+        if self.index:
+            # Edges the backend skipped (no such match) must not appear in the index either
+            for match in matches:
+                if self.index.get_match(match.source, match.target) is not None:
+                    self.index.add_match(match, overwrite=True)
+        return updated
+
+    def delete_matches_bulk(self, pairs: List[Tuple[str, str]], chunk_size: int) -> int:
+        result = self.repository.delete_matches_bulk(pairs, chunk_size)
+        if self.index:
+            for source, target in pairs:
+                self.index.remove_match(source, target)
+        return result
+
+    def list_matches(self, limit: Optional[int] = None, cursor: Optional[Tuple[str, str]] = None) -> List[Match]:
+        return self.repository.list_matches(limit, cursor)
+
+    def create_matches_bulk(self, matches: List[Match], chunk_size: int) -> List[Match]:
+        created = self.repository.create_matches_bulk(matches, chunk_size)
+        if self.index:
+            for match in matches:
+                self.index.add_match(match)
+        return created
+
+    # ---------- FINGERPRINTS ----------
+    def get_part_fingerprints(self, part_numbers: List[str]) -> Dict[str, Optional[str]]:
+        return self.repository.get_part_fingerprints(part_numbers)
+
+    def get_match_fingerprints(self, sources: List[str]) -> Dict[Tuple[str, str], Optional[str]]:
+        return self.repository.get_match_fingerprints(sources)
+
+    # ---------- TRANSITIVE REPLACEMENTS ----------
+    def find_replacements(self, part_number: str, max_depth: int, match_types: Optional[List[str]] = None,
+                          in_process: bool = False):
+        if in_process and self.index and self.index.knows(part_number):
+            # None when the search reaches a part being refreshed: the backend answers instead
+            result = self.index.find_replacements(part_number, max_depth, match_types)
+            if result is not None:
+                return result
+        return self.repository.find_replacements(part_number, max_depth, match_types, in_process)
+
+    # ---------- SIMILARITY ----------
+    def find_similar_parts(self, profile: dict, k: int, exclude: Optional[str] = None):
+        results = self.spec_index.search(profile, k, exclude) if self.spec_index else None
+        if results is None:
+            results = self.repository.find_similar_parts(profile, k, exclude)
+        return results
+
+    # ---------- EXTERNAL WRITES ----------
+    def invalidate(self, part_numbers: Iterable[str]):
+        part_numbers = list(part_numbers)
+        self.repository.invalidate(part_numbers)
+        if self.index:
+            self.index.mark_dirty(part_numbers)
+
+    # ---------- GET MATCHES FOR PART ----------
+    def get_matches_for_part(self, part_number: str):
+        result = self.index.get_matches_for_part(part_number) if self.index else None
+        return result or self.repository.get_matches_for_part(part_number)
+
+    def get_matches_for_parts(self, part_numbers: List[str]) -> dict:
+        results = {part_number: self.index.get_matches_for_part(part_number) if self.index else None
+                   for part_number in part_numbers}
+        missing = [part_number for part_number, result in results.items() if result is None]
+        if missing:
+            results.update(self.repository.get_matches_for_parts(missing))
+        return results
@@ -0,0 +1,108 @@
+# lib/app/adapter/output/persistence/memory/spec_index.py
+
+import heapq
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+from lib.app.domain.entities.part_number import PartNumber
+from lib.app.domain.services.similarity import SIMILARITY_FIELDS, FIELD_WEIGHTS, normalize_value, normalize_profile
+
+class SpecIndex:
+    """
+    Inverted index from (field, normalized value) to part numbers over spec1..spec5 and
+    note1..note3. A top-k similarity query only touches the posting lists of the profile's
+    own values instead of comparing against every part in the catalog.
+    Built from a snapshot with load() and updated incrementally from the write paths.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[tuple, set] = defaultdict(set)
+        self._parts: Dict[str, PartNumber] = {}
+        self._refresh_writes: Optional[Dict[str, Optional[PartNumber]]] = None
+        self.ready = False
+
+    def begin_refresh(self):
+        """
+        Call before reading the snapshot the next load() swaps in: writes from then on are
+        replayed over it, since the snapshot may predate them.
+        """
+        with self._lock:
+            self._refresh_writes = {}
+
+    def load(self, parts: Iterable[PartNumber]):
+        with self._lock:
+            self._postings = defaultdict(set)
+            self._parts = {}
+            for part in parts:
+                self._add(part)
+            for part_number, part in (self._refresh_writes or {}).items():
+                self._remove(part_number)
+                if part is not None:
+                    self._add(part)
+            self._refresh_writes = None
+            self.ready = True
+
+    def _add(self, part: PartNumber):
+        self._parts[part.part_number] = part
+        for field in SIMILARITY_FIELDS:
+            value = normalize_value(getattr(part, field))
+            if value:
+                self._postings[(field, value)].add(part.part_number)
+
+    def _remove(self, part_number: str):
+        part = self._parts.pop(part_number, None)
+        if part is None:
+            return
+        for field in SIMILARITY_FIELDS:
+            key = (field, normalize_value(getattr(part, field)))
+            posting = self._postings.get(key)
+            if posting is not None:
+                posting.discard(part_number)
+                if not posting:
+                    del self._postings[key]
+
+    # ---------- INCREMENTAL UPDATES ----------
+    def upsert_part(self, part: PartNumber):
+        with self._lock:
+            if self._refresh_writes is not None:
+                self._refresh_writes[part.part_number] = part
+            self._remove(part.part_number)
+            self._add(part)
+
+    def remove_part(self, part_number: str):
+        with self._lock:
+            if self._refresh_writes is not None:
+                self._refresh_writes[part_number] = None
+            self._remove(part_number)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"ready": self.ready, "parts": len(self._parts), "postings": len(self._postings)}
+
+    # ---------- SEARCH ----------
+    def search(self, profile: Dict[str, str], k: int, exclude: Optional[str] = None) -> Optional[List[dict]]:
+        """
+        Top-k parts by weighted share of equal profile fields; None if the index is not loaded.
+        Returns [{"part": PartNumber, "score": float, "matched_fields": [str, ...]}, ...].
+        """
+        if not self.ready:
+            return None
+        profile = normalize_profile(profile)
+        total = sum(FIELD_WEIGHTS[f] for f in profile)
+        if not total:
+            return []
+
+        with self._lock:
+            scores = defaultdict(float)
+            matched = defaultdict(list)
+            for field, value in profile.items():
+                for part_number in self._postings.get((field, value), ()):
+                    scores[part_number] += FIELD_WEIGHTS[field]
+                    matched[part_number].append(field)
+            scores.pop(exclude, None)
+            top = heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
+            return [
+                {"part": self._parts[pn], "score": round(score / total, 4), "matched_fields": matched[pn]}
+                for pn, score in top
+            ]
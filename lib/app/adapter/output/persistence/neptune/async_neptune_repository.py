@@ -0,0 +1,103 @@
+# lib/app/adapter/output/persistence/neptune/async_neptune_repository.py
+
+import asyncio
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from lib.app.adapter.output.persistence.neptune.neptune_repository import NeptuneRepository
+from lib.app.application.services.repository_interface import RepositoryInterface
+from lib.app.domain.entities.part_number import PartNumber
+from lib.app.domain.entities.match import Match
+from lib.core.aws.neptune_client import NeptuneConnectionPool
+
+class AsyncNeptuneRepository:
+    """
+    Awaitable counterpart of the repository port for async def callers.
+    Every call checks a connection out of the pool without blocking the event loop, wraps it
+    with decorate (the container passes its cache/index decorators, so async reads and writes
+    see and invalidate the same cache and indexes) and runs the blocking gremlinpython
+    traversal in a worker thread. Concurrent requests spread over the pool instead of
+    queueing on one socket.
+    """
+
+    def __init__(self, pool: NeptuneConnectionPool,
+                 decorate: Callable[[RepositoryInterface], RepositoryInterface] = lambda repository: repository):
+        self.pool = pool
+        self.decorate = decorate
+
+    async def _call(self, method: str, *args):
+        async with self.pool.acheckout() as conn:
+            repository = self.decorate(NeptuneRepository(conn.g, conn.connection))
+            return await asyncio.to_thread(getattr(repository, method), *args)
+
+    # ---------- PART CRUD ----------
+    async def create_part(self, part: PartNumber) -> PartNumber:
+        return await self._call("create_part", part)
+
+    async def get_part(self, part_number: str) -> Optional[PartNumber]:
+        return await self._call("get_part", part_number)
+
+    async def update_part(self, part: PartNumber) -> PartNumber:
+        return await self._call("update_part", part)
+
+    async def delete_part(self, part_number: str) -> bool:
+        return await self._call("delete_part", part_number)
+
+    async def list_parts(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[PartNumber]:
+        return await self._call("list_parts", limit, cursor)
+
+    async def create_parts_bulk(self, parts: List[PartNumber], chunk_size: int) -> List[PartNumber]:
+        return await self._call("create_parts_bulk", parts, chunk_size)
+
+    async def get_part_ids(self, part_numbers: List[str]) -> Dict[str, str]:
+        return await self._call("get_part_ids", part_numbers)
+
+    # ---------- MATCH CRUD ----------
+    async def create_match(self, match: Match) -> Match:
+        return await self._call("create_match", match)
+
+    async def get_match(self, source: str, target: str) -> Optional[Match]:
+        return await self._call("get_match", source, target)
+
+    async def update_match(self, match: Match) -> Match:
+        return await self._call("update_match", match)
+
+    async def delete_match(self, source: str, target: str) -> bool:
+        return await self._call("delete_match", source, target)
+
+    async def list_matches(self, limit: Optional[int] = None, cursor: Optional[Tuple[str, str]] = None) -> List[Match]:
+        return await self._call("list_matches", limit, cursor)
+
+    async def create_matches_bulk(self, matches: List[Match], chunk_size: int) -> List[Match]:
+        return await self._call("create_matches_bulk", matches, chunk_size)
+
+    async def update_matches_bulk(self, matches: List[Match], chunk_size: int) -> List[Match]:
+        return await self._call("update_matches_bulk", matches, chunk_size)
+
+    async def delete_matches_bulk(self, pairs: List[Tuple[str, str]], chunk_size: int) -> int:
+        return await self._call("delete_matches_bulk", pairs, chunk_size)
+
+    # ---------- FINGERPRINTS ----------
+    async def get_part_fingerprints(self, part_numbers: List[str]) -> Dict[str, Optional[str]]:
+        return await self._call("get_part_fingerprints", part_numbers)
+
+    async def get_match_fingerprints(self, sources: List[str]) -> Dict[Tuple[str, str], Optional[str]]:
+        return await self._call("get_match_fingerprints", sources)
+
+    # ---------- EXTERNAL WRITES ----------
+    async def invalidate(self, part_numbers: Iterable[str]):
+        return await self._call("invalidate", list(part_numbers))
+
+    # ---------- GET MATCHES FOR PART ----------
+    async def get_matches_for_part(self, part_number: str):
+        return await self._call("get_matches_for_part", part_number)
+
+    async def get_matches_for_parts(self, part_numbers: List[str]) -> Dict[str, Optional[dict]]:
+        return await self._call("get_matches_for_parts", part_numbers)
+
+    # ---------- TRANSITIVE REPLACEMENTS ----------
+    async def find_replacements(self, part_number: str, max_depth: int, match_types: Optional[List[str]] = None,
+                                in_process: bool = False):
+        return await self._call("find_replacements", part_number, max_depth, match_types, in_process)
+
+    # ---------- SIMILARITY ----------
+    async def find_similar_parts(self, profile: dict, k: int, exclude: Optional[str] = None):
+        return await self._call("find_similar_parts", profile, k, exclude)
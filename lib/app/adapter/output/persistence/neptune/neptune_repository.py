@@ -1,188 +1,497 @@
 from lib.app.application.services.repository_interface import RepositoryInterface
-from lib.app.domain.entities.part_number import PartNumber
+from lib.app.domain.entities.part_number import PartNumber, PART_FIELDS, SPEC_FIELDS, NOTE_FIELDS, part_vertex_id
 from lib.app.domain.entities.match import Match
+from lib.app.domain.services.fingerprint import FINGERPRINT_PROPERTY, part_fingerprint, match_fingerprint
+from lib.app.domain.services.replacement_search import rank_paths
+from lib.app.domain.services.similarity import (
+    SIMILARITY_FIELDS, SEARCH_KEY_PROPERTIES, normalize_value, normalize_profile, score_part
+)
 from lib.core.aws.neptune_client import get_neptune_connection
+from lib.core.metrics import instrument_methods
 from gremlin_python.process.graph_traversal import __
-import hashlib
-import time
-
-def _get_prop(obj, key: str, default=""):
-    try:
-        if hasattr(obj, "properties") and key in obj.properties:
-            props = obj.properties[key]
-            if isinstance(props, list) and len(props) > 0:
-                return props[0].value or ""
-    except Exception:
-        pass
-    return default
+from gremlin_python.process.traversal import T, P, Cardinality, WithOptions
+from typing import Dict, List, Optional, Tuple
+import os
 
+# Upper bound on paths a transitive replacement search may expand
+MAX_REPLACEMENT_PATHS = int(os.getenv("MAX_REPLACEMENT_PATHS", 10000))
+
+# Upper bound on candidate parts fetched for a similarity search
+MAX_SIMILARITY_CANDIDATES = int(os.getenv("MAX_SIMILARITY_CANDIDATES", 5000))
+
+# Number of addV/addE steps folded into a single traversal by the bulk writers
+DEFAULT_BATCH_SIZE = int(os.getenv("NEPTUNE_BATCH_SIZE", 200))
+
+# Part numbers resolved per has(part_number, within(...)) traversal by batch match searches
+SEARCH_BATCH_SIZE = int(os.getenv("NEPTUNE_SEARCH_BATCH_SIZE", 100))
+
+# Part numbers per within() traversal when reading fingerprints or vertex ids for an upload
+FINGERPRINT_BATCH_SIZE = int(os.getenv("NEPTUNE_FINGERPRINT_BATCH_SIZE", 1000))
+
+_PART_KEYS = frozenset(PART_FIELDS)
+
+def _chunked(items: list, size: int):
+    size = max(int(size), 1)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def _part_from_map(m: dict) -> PartNumber:
+    """
+    Builds a PartNumber in one pass over a valueMap().with_(WithOptions.tokens) or
+    elementMap() result: valueMap() wraps property values in lists, elementMap() and the
+    tokens (T.id, T.label) come back bare. part_number and id fall back to the vertex id.
+    """
+    values = dict.fromkeys(PART_FIELDS, "")
+    values["id"] = values["part_number"] = None
+    vertex_id = None
+    for key, value in m.items():
+        if key is T.id:
+            vertex_id = value
+        elif key in _PART_KEYS:
+            if value.__class__ is list:
+                value = value[0] if value else None
+            values[key] = value or ""
+    if values["part_number"] is None:
+        values["part_number"] = vertex_id
+    if values["id"] is None:
+        values["id"] = vertex_id
+    return PartNumber(**values)
+
+def _first(values: list):
+    # values("x").fold() result: the property value, or None when the property is missing
+    return values[0] if values else None
+
+def _add_match_edge(match: Match):
+    """addE("MATCHED") from step "a" with match_type and fingerprint, plus score when the match has one."""
+    edge = __.addE("MATCHED").from_("a")\
+        .property("match_type", match.match_type)\
+        .property(FINGERPRINT_PROPERTY, match_fingerprint(match))
+    if match.score is not None:
+        edge = edge.property("score", float(match.score))
+    return edge
+
+def _project_matches(vertices):
+    """Projects each part vertex to its valueMap and its MATCHED neighbours (either direction)."""
+    return vertices.project("part", "matches")\
+        .by(__.valueMap().with_(WithOptions.tokens))\
+        .by(
+            __.bothE("MATCHED")
+            .project("match_type", "score", "replacement_part")
+            .by(__.coalesce(__.values("match_type"), __.constant("")))
+            .by(__.values("score").fold())
+            .by(__.otherV().valueMap().with_(WithOptions.tokens))
+            .fold()
+        )
+
+def _matches_from_row(row: dict) -> dict:
+    return {
+        "part": _part_from_map(row["part"]),
+        "matches": [
+            {
+                "replacement_part": _part_from_map(m["replacement_part"]),
+                "match_type": m["match_type"] or "",
+                "score": _first(m["score"])
+            }
+            for m in row["matches"]
+        ]
+    }
+
+def _matched_edge(source, from_part: str, to_part: str):
+    # Starts from the indexed source vertex: only its outgoing edges are scanned, never all of E()
+    return source.V().has("PartNumber", "part_number", from_part)\
+        .outE("MATCHED").where(__.inV().has("part_number", to_part))
+
+def _set_part_properties(vertices, part: PartNumber):
+    """
+    Overwrites specs, notes, their similarity search keys and the fingerprint of the
+    vertices, all with single cardinality.
+    """
+    for field in SPEC_FIELDS + NOTE_FIELDS:
+        vertices = vertices.property(Cardinality.single, field, getattr(part, field))
+    for field, key in SEARCH_KEY_PROPERTIES.items():
+        vertices = vertices.property(Cardinality.single, key, normalize_value(getattr(part, field)))
+    return vertices.property(Cardinality.single, FINGERPRINT_PROPERTY, part_fingerprint(part))
+
+def _upsert_part(source, part: PartNumber):
+    """
+    Appends an upsert-by-part_number of part to source (g or __): the existing vertex is
+    reused when present, otherwise one is added under the deterministic id. Specs and
+    notes are always overwritten with single cardinality.
+    """
+    return _set_part_properties(
+        source.V().has("PartNumber", "part_number", part.part_number).fold()
+        .coalesce(
+            __.unfold(),
+            __.addV("PartNumber")
+            .property(T.id, part.id)
+            .property("id", part.id)
+            .property("part_number", part.part_number)
+        ),
+        part
+    )
+
+def _set_match_properties(edges, match: Match):
+    """Overwrites match_type, and score + fingerprint when the match has a score."""
+    edges = edges.property("match_type", match.match_type)
+    if match.score is not None:
+        return edges.property("score", float(match.score)).property(FINGERPRINT_PROPERTY, match_fingerprint(match))
+    # The stored score is kept, so the fingerprint cannot be computed here; without one the
+    # next delta upload treats the edge as changed
+    return edges.sideEffect(__.properties(FINGERPRINT_PROPERTY).drop())
+
+@instrument_methods
 class NeptuneRepository(RepositoryInterface):
-    def __init__(self):
-        self.g, self.connection = get_neptune_connection()
+    def __init__(self, g=None, connection=None):
+        # Bound to a pooled connection when one is passed in, otherwise owns a dedicated one
+        self._owns_connection = g is None
+        if self._owns_connection:
+            self.g, self.connection = get_neptune_connection()
+        else:
+            self.g, self.connection = g, connection
 
     # ---------- PART CRUD ----------
     def create_part(self, part: PartNumber) -> PartNumber:
-        # Generate unique composite id if not already present
+        # Deterministic id so re-creating the same part_number never adds a second vertex
         if not part.id:
-            part.id = f"{part.part_number}_{hashlib.md5(str(time.time()).encode()).hexdigest()}"
-        
-        self.g.addV("PartNumber")\
-            .property("id", part.id)\
-            .property("part_number", part.part_number)\
-            .property("spec1", part.spec1)\
-            .property("spec2", part.spec2)\
-            .property("spec3", part.spec3)\
-            .property("spec4", part.spec4)\
-            .property("spec5", part.spec5)\
-            .property("note1", part.note1)\
-            .property("note2", part.note2)\
-            .property("note3", part.note3)\
-            .next()
+            part.id = part_vertex_id(part.part_number)
+
+        _upsert_part(self.g, part).next()
         return part
 
     def get_part(self, part_number: str):
-        try:
-            v = self.g.V().has("PartNumber", "part_number", part_number).next()
-            return PartNumber(
-                part_number=_get_prop(v, "part_number", v.id),
-                spec1=_get_prop(v, "spec1"),
-                spec2=_get_prop(v, "spec2"),
-                spec3=_get_prop(v, "spec3"),
-                spec4=_get_prop(v, "spec4"),
-                spec5=_get_prop(v, "spec5"),
-                note1=_get_prop(v, "note1"),
-                note2=_get_prop(v, "note2"),
-                note3=_get_prop(v, "note3"),
-                id=_get_prop(v, "id", v.id)
-            )
-        except StopIteration:
-            return None
+        maps = self.g.V().has("PartNumber", "part_number", part_number).limit(1)\
+            .valueMap().with_(WithOptions.tokens).toList()
+        return _part_from_map(maps[0]) if maps else None
 
     def update_part(self, part: PartNumber) -> PartNumber:
+        # Single cardinality for every property, like _upsert_part: Neptune's default (set)
+        # would keep the old values next to the new ones
         v = self.g.V().has("PartNumber", "part_number", part.part_number).next()
-        self.g.V(v.id)\
-            .property("spec1", part.spec1)\
-            .property("spec2", part.spec2)\
-            .property("spec3", part.spec3)\
-            .property("spec4", part.spec4)\
-            .property("spec5", part.spec5)\
-            .property("note1", part.note1)\
-            .property("note2", part.note2)\
-            .property("note3", part.note3)\
-            .next()
+        _set_part_properties(self.g.V(v.id), part).next()
         return self.get_part(part.part_number)
 
     def delete_part(self, part_number: str) -> bool:
         self.g.V().has("PartNumber", "part_number", part_number).drop().iterate()
         return True
 
-    def list_parts(self):
-        vertices = self.g.V().hasLabel("PartNumber").toList()
-        parts = []
-        for v in vertices:
-            parts.append(
-                PartNumber(
-                    part_number=_get_prop(v, "part_number", v.id),
-                    spec1=_get_prop(v, "spec1"),
-                    spec2=_get_prop(v, "spec2"),
-                    spec3=_get_prop(v, "spec3"),
-                    spec4=_get_prop(v, "spec4"),
-                    spec5=_get_prop(v, "spec5"),
-                    note1=_get_prop(v, "note1"),
-                    note2=_get_prop(v, "note2"),
-                    note3=_get_prop(v, "note3"),
-                    id=_get_prop(v, "id", v.id)
-                )
-            )
+    def create_parts_bulk(self, parts: List[PartNumber], chunk_size: int = DEFAULT_BATCH_SIZE) -> List[PartNumber]:
+        """
+        Upserts parts in chunks: one traversal (and one round trip) per chunk of upserts.
+        """
+        for chunk in _chunked(parts, chunk_size):
+            t = self.g.inject(0)
+            for part in chunk:
+                if not part.id:
+                    part.id = part_vertex_id(part.part_number)
+                t = t.sideEffect(_upsert_part(__, part))
+            t.iterate()
         return parts
 
+    def get_part_ids(self, part_numbers: List[str]) -> Dict[str, str]:
+        ids = {}
+        for chunk in _chunked(list(part_numbers), FINGERPRINT_BATCH_SIZE):
+            rows = self.g.V().has("PartNumber", "part_number", P.within(*chunk))\
+                .project("part_number", "id").by(__.values("part_number")).by(__.id_())\
+                .toList()
+            for row in rows:
+                # Duplicate vertices (see merge_duplicate_parts): prefer the deterministic id
+                if row["part_number"] not in ids or row["id"] == part_vertex_id(row["part_number"]):
+                    ids[row["part_number"]] = row["id"]
+        return ids
+
+    def list_parts(self, limit: Optional[int] = None, cursor: Optional[str] = None):
+        """
+        Lists parts. With limit/cursor, returns one page ordered by part_number, starting
+        after the cursor part_number (keyset pagination).
+        """
+        t = self.g.V().hasLabel("PartNumber")
+        if cursor is not None:
+            t = t.has("part_number", P.gt(cursor))
+        if limit is not None or cursor is not None:
+            t = t.order().by("part_number")
+        if limit is not None:
+            t = t.limit(limit)
+        return [_part_from_map(m) for m in t.valueMap().with_(WithOptions.tokens).toList()]
+
     # ---------- MATCH CRUD ----------
     def create_match(self, match: Match) -> Match:
         self.g.V().has("PartNumber", "part_number", match.source).as_("a")\
             .V().has("PartNumber", "part_number", match.target)\
             .coalesce(
                 __.inE("MATCHED").where(__.outV().as_("a")),
-                __.addE("MATCHED").from_("a").property("match_type", match.match_type)
+                _add_match_edge(match)
             ).next()
         return match
 
+    def create_matches_bulk(self, matches: List[Match], chunk_size: int = DEFAULT_BATCH_SIZE) -> List[Match]:
+        """
+        Writes matches in chunks: one traversal per chunk, each edge guarded by the same
+        coalesce as create_match so existing edges are not duplicated. Edges whose
+        endpoints do not exist are skipped without failing the rest of the chunk.
+        """
+        for chunk in _chunked(matches, chunk_size):
+            t = self.g.inject(0)
+            for match in chunk:
+                t = t.sideEffect(
+                    __.V().has("PartNumber", "part_number", match.source).as_("a")
+                    .V().has("PartNumber", "part_number", match.target)
+                    .coalesce(
+                        __.inE("MATCHED").where(__.outV().as_("a")),
+                        _add_match_edge(match)
+                    )
+                )
+            t.iterate()
+        return matches
+
     def get_match(self, source: str, target: str):
-        edges = self.g.E().hasLabel("MATCHED")\
-            .where(__.outV().has("part_number", source))\
-            .where(__.inV().has("part_number", target)).toList()
-        if edges:
-            return Match(source, target, _get_prop(edges[0], "match_type"))
+        rows = _matched_edge(self.g, source, target).limit(1)\
+            .project("match_type", "score")\
+            .by(__.coalesce(__.values("match_type"), __.constant("")))\
+            .by(__.values("score").fold())\
+            .toList()
+        if rows:
+            return Match(source, target, rows[0]["match_type"], _first(rows[0]["score"]))
         return None
 
     def update_match(self, match: Match) -> Match:
-        e = self.g.E().hasLabel("MATCHED")\
-            .where(__.outV().has("part_number", match.source))\
-            .where(__.inV().has("part_number", match.target)).next()
-        e.property("match_type", match.match_type)
+        # Written server-side in the same traversal that finds the edge
+        if not _set_match_properties(_matched_edge(self.g, match.source, match.target), match).count().next():
+            raise ValueError(f"Match {match.source} -> {match.target} not found")
         return match
 
+    def update_matches_bulk(self, matches: List[Match], chunk_size: int = DEFAULT_BATCH_SIZE) -> List[Match]:
+        """
+        update_match in chunks: one traversal per chunk; matches without an edge are skipped.
+        """
+        for chunk in _chunked(matches, chunk_size):
+            t = self.g.inject(0)
+            for match in chunk:
+                t = t.sideEffect(_set_match_properties(_matched_edge(__, match.source, match.target), match))
+            t.iterate()
+        return matches
+
     def delete_match(self, source: str, target: str) -> bool:
-        self.g.E().hasLabel("MATCHED")\
-            .where(__.outV().has("part_number", source))\
-            .where(__.inV().has("part_number", target)).drop().iterate()
+        _matched_edge(self.g, source, target).drop().iterate()
         return True
 
-    def list_matches(self):
-        edges = self.g.E().hasLabel("MATCHED").toList()
-        return [Match(e.outV.id, e.inV.id, _get_prop(e, "match_type")) for e in edges]
+    def delete_matches_bulk(self, pairs: List[Tuple[str, str]], chunk_size: int = DEFAULT_BATCH_SIZE) -> int:
+        for chunk in _chunked(pairs, chunk_size):
+            t = self.g.inject(0)
+            for source, target in chunk:
+                t = t.sideEffect(_matched_edge(__, source, target).drop())
+            t.iterate()
+        return len(pairs)
+
+    def list_matches(self, limit: Optional[int] = None, cursor: Optional[Tuple[str, str]] = None):
+        """
+        Lists matches. With limit/cursor, returns one page ordered by (source, target)
+        part_number, starting after the cursor pair (keyset pagination, like list_parts):
+        sources from the cursor's onwards through the part_number index, then their edges.
+        """
+        if limit is None and cursor is None:
+            t = self.g.E().hasLabel("MATCHED")
+        else:
+            t = self.g.V().hasLabel("PartNumber")
+            if cursor is not None:
+                t = t.has("part_number", P.gte(cursor[0]))
+            t = t.order().by("part_number")\
+                .flatMap(__.outE("MATCHED").order().by(__.inV().values("part_number")))
+            if cursor is not None:
+                t = t.where(__.or_(
+                    __.outV().has("part_number", P.gt(cursor[0])),
+                    __.inV().has("part_number", P.gt(cursor[1]))
+                ))
+            if limit is not None:
+                t = t.limit(limit)
+        rows = t.project("source", "target", "match_type", "score")\
+            .by(__.outV().coalesce(__.values("part_number"), __.id_()))\
+            .by(__.inV().coalesce(__.values("part_number"), __.id_()))\
+            .by(__.coalesce(__.values("match_type"), __.constant("")))\
+            .by(__.values("score").fold())\
+            .toList()
+        return [Match(r["source"], r["target"], r["match_type"], _first(r["score"])) for r in rows]
 
     # ---------- GET MATCHES FOR PART ----------
     def get_matches_for_part(self, part_number: str):
-        try:
-            part_vertex = self.g.V().has("PartNumber", "part_number", part_number).next()
-            part_data = PartNumber(
-                part_number=_get_prop(part_vertex, "part_number", part_vertex.id),
-                spec1=_get_prop(part_vertex, "spec1"),
-                spec2=_get_prop(part_vertex, "spec2"),
-                spec3=_get_prop(part_vertex, "spec3"),
-                spec4=_get_prop(part_vertex, "spec4"),
-                spec5=_get_prop(part_vertex, "spec5"),
-                note1=_get_prop(part_vertex, "note1"),
-                note2=_get_prop(part_vertex, "note2"),
-                note3=_get_prop(part_vertex, "note3"),
-                id=_get_prop(part_vertex, "id", part_vertex.id)
-            )
-        except StopIteration:
-            return None
-
-        edges_out = self.g.V().has("PartNumber", "part_number", part_number)\
-            .outE("MATCHED").as_("e").inV().as_("v").select("e", "v").toList()
-        edges_in = self.g.V().has("PartNumber", "part_number", part_number)\
-            .inE("MATCHED").as_("e").outV().as_("v").select("e", "v").toList()
-
-        matches = []
-        for e in edges_out + edges_in:
-            matched_vertex = e["v"]
-            matched_part = PartNumber(
-                part_number=_get_prop(matched_vertex, "part_number", matched_vertex.id),
-                spec1=_get_prop(matched_vertex, "spec1"),
-                spec2=_get_prop(matched_vertex, "spec2"),
-                spec3=_get_prop(matched_vertex, "spec3"),
-                spec4=_get_prop(matched_vertex, "spec4"),
-                spec5=_get_prop(matched_vertex, "spec5"),
-                note1=_get_prop(matched_vertex, "note1"),
-                note2=_get_prop(matched_vertex, "note2"),
-                note3=_get_prop(matched_vertex, "note3"),
-                id=_get_prop(matched_vertex, "id", matched_vertex.id)
-            )
-            matches.append({
-                "replacement_part": matched_part,
-                "match_type": _get_prop(e["e"], "match_type")
-            })
-
-        return {
-            "part": part_data,
-            "matches": matches
-        }
+        # One round trip: the part, every MATCHED neighbour (either direction) and the match types
+        rows = _project_matches(self.g.V().has("PartNumber", "part_number", part_number).limit(1)).toList()
+        return _matches_from_row(rows[0]) if rows else None
+
+    def get_matches_for_parts(self, part_numbers: List[str]) -> dict:
+        # One within() traversal per SEARCH_BATCH_SIZE part numbers instead of one per part
+        results = dict.fromkeys(part_numbers)
+        for chunk in _chunked(list(results), SEARCH_BATCH_SIZE):
+            rows = _project_matches(self.g.V().has("PartNumber", "part_number", P.within(*chunk))).toList()
+            for row in rows:
+                result = _matches_from_row(row)
+                # Graphs written before parts were upserted may hold duplicates; keep the first
+                if results.get(result["part"].part_number) is None:
+                    results[result["part"].part_number] = result
+        return results
+
+    # ---------- FINGERPRINTS ----------
+    def get_part_fingerprints(self, part_numbers: List[str]) -> Dict[str, Optional[str]]:
+        fingerprints = {}
+        for chunk in _chunked(list(part_numbers), FINGERPRINT_BATCH_SIZE):
+            rows = self.g.V().has("PartNumber", "part_number", P.within(*chunk))\
+                .project("part_number", "fingerprint")\
+                .by(__.values("part_number"))\
+                .by(__.values(FINGERPRINT_PROPERTY).fold())\
+                .toList()
+            for row in rows:
+                fingerprints.setdefault(row["part_number"], _first(row["fingerprint"]))
+        return fingerprints
+
+    def get_match_fingerprints(self, sources: List[str]) -> Dict[Tuple[str, str], Optional[str]]:
+        fingerprints = {}
+        for chunk in _chunked(list(sources), FINGERPRINT_BATCH_SIZE):
+            rows = self.g.V().has("PartNumber", "part_number", P.within(*chunk))\
+                .outE("MATCHED")\
+                .project("source", "target", "fingerprint")\
+                .by(__.outV().values("part_number"))\
+                .by(__.inV().values("part_number"))\
+                .by(__.values(FINGERPRINT_PROPERTY).fold())\
+                .toList()
+            for row in rows:
+                fingerprints[(row["source"], row["target"])] = _first(row["fingerprint"])
+        return fingerprints
+
+    # ---------- TRANSITIVE REPLACEMENTS ----------
+    def find_replacements(self, part_number: str, max_depth: int, match_types: Optional[List[str]] = None,
+                          in_process: bool = False):
+        # Bounded repeat over MATCHED edges in either direction; simplePath() stops cycles
+        # and MAX_REPLACEMENT_PATHS caps fan-out on densely matched parts
+        step = __.bothE("MATCHED")
+        if match_types:
+            step = step.has("match_type", P.within(*match_types))
+        rows = self.g.V().has("PartNumber", "part_number", part_number).limit(1)\
+            .repeat(step.otherV().simplePath()).emit().times(max_depth)\
+            .limit(MAX_REPLACEMENT_PATHS)\
+            .project("path", "part")\
+            .by(__.path()
+                .by(__.coalesce(__.values("part_number"), __.id_()))
+                .by(__.coalesce(__.values("match_type"), __.constant(""))))\
+            .by(__.valueMap().with_(WithOptions.tokens))\
+            .toList()
+        if not rows:
+            return [] if self.get_part(part_number) else None
+
+        parts = {}
+        paths = []
+        for row in rows:
+            objects = list(row["path"].objects)
+            parts[objects[-1]] = row["part"]
+            paths.append((objects[0::2], objects[1::2]))
+        return [
+            {"replacement_part": _part_from_map(parts[r["part_number"]]), **r}
+            for r in rank_paths(part_number, paths)
+        ]
+
+    # ---------- SIMILARITY ----------
+    def find_similar_parts(self, profile: dict, k: int, exclude: Optional[str] = None):
+        # Candidates are parts sharing at least one normalized value with the profile, found
+        # through Neptune's property indexes on the stored search keys; scoring happens here
+        normalized = normalize_profile(profile)
+        if not normalized:
+            return []
+        maps = self.g.V().hasLabel("PartNumber")\
+            .or_(*[__.has(SEARCH_KEY_PROPERTIES[field], value) for field, value in normalized.items()])\
+            .limit(MAX_SIMILARITY_CANDIDATES)\
+            .valueMap().with_(WithOptions.tokens).toList()
+
+        results = []
+        for m in maps:
+            part = _part_from_map(m)
+            if part.part_number == exclude:
+                continue
+            score, matched = score_part(normalized, part)
+            if score > 0:
+                results.append({"part": part, "score": round(score, 4), "matched_fields": matched})
+        results.sort(key=lambda r: (-r["score"], r["part"].part_number))
+        return results[:k]
+
+    # ---------- MAINTENANCE ----------
+    def merge_duplicate_parts(self) -> dict:
+        """
+        One-shot dedup for graphs written before parts were upserted: every part_number ends
+        up as a single vertex under its deterministic id (the id bulk loads address), so
+        duplicates are merged and lone vertices under a random id are re-created. The MATCHED
+        edges of the old vertices are re-pointed with all their properties.
+        """
+        groups = self.g.V().hasLabel("PartNumber")\
+            .group().by("part_number").by(__.id_().fold()).next()
+
+        merged_parts, reassigned_ids, dropped_vertices = 0, 0, 0
+        for part_number, ids in groups.items():
+            keep = part_vertex_id(part_number)
+            if ids == [keep]:
+                continue
+            if keep not in ids:
+                # The first vertex's specs/notes carry over to the re-created one
+                survivor = _part_from_map(self.g.V(ids[0]).valueMap().with_(WithOptions.tokens).next())
+                _set_part_properties(
+                    self.g.addV("PartNumber").property(T.id, keep).property("id", keep)
+                    .property("part_number", part_number),
+                    survivor
+                ).iterate()
+                reassigned_ids += 1
+            duplicates = [vid for vid in ids if vid != keep]
+            self._repoint_edges(duplicates, keep)
+            self.g.V(*duplicates).drop().iterate()
+
+            merged_parts += len(ids) > 1
+            dropped_vertices += len(duplicates)
+
+        return {"merged_parts": merged_parts, "reassigned_ids": reassigned_ids, "dropped_vertices": dropped_vertices}
+
+    def backfill_search_keys(self, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        One-shot for parts written before similarity search keys were stored: re-upserts
+        every part (keyset-paged by part_number) so its search keys are written. Returns
+        the number of parts rewritten.
+        """
+        cursor, count = None, 0
+        while True:
+            page = self.list_parts(batch_size, cursor)
+            self.create_parts_bulk(page, batch_size)
+            count += len(page)
+            if len(page) < batch_size:
+                return count
+            cursor = page[-1].part_number
+
+    def _repoint_edges(self, duplicates: list, keep: str):
+        """
+        Copies the MATCHED edges of duplicates onto keep, every property included, unless
+        keep already has an edge to/from the same part. Edges between the duplicates (and
+        keep) are dropped with them.
+        """
+        merged = {keep, *duplicates}
+        for outgoing in (True, False):
+            edges = self.g.V(*duplicates).outE("MATCHED") if outgoing else self.g.V(*duplicates).inE("MATCHED")
+            rows = edges.project("other", "properties")\
+                .by(__.inV().id_() if outgoing else __.outV().id_())\
+                .by(__.valueMap())\
+                .toList()
+            copies = {}
+            for row in rows:
+                if row["other"] not in merged:
+                    copies.setdefault(row["other"], row["properties"])
+            for chunk in _chunked(list(copies.items()), DEFAULT_BATCH_SIZE):
+                t = self.g.inject(0)
+                for other, properties in chunk:
+                    source, target = (keep, other) if outgoing else (other, keep)
+                    edge = __.addE("MATCHED").from_("a")
+                    for key, value in properties.items():
+                        edge = edge.property(key, value)
+                    t = t.sideEffect(
+                        __.V(source).as_("a").V(target)
+                        .coalesce(__.inE("MATCHED").where(__.outV().as_("a")), edge)
+                    )
+                t.iterate()
 
     def close(self):
         try:
-            if self.connection:
+            if self.connection and self._owns_connection:
                 self.connection.close()
         except Exception as e:
             print("Error closing Neptune connection:", e)
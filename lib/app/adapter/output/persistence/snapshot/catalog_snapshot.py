@@ -0,0 +1,155 @@
+# lib/app/adapter/output/persistence/snapshot/catalog_snapshot.py
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+from lib.app.domain.entities.part_number import PartNumber, PART_FIELDS
+from lib.app.domain.entities.match import Match
+
+# Rows per Arrow record batch / Parquet row group; writers only ever hold one chunk
+SNAPSHOT_CHUNK_SIZE = int(os.getenv("SNAPSHOT_CHUNK_SIZE", 50_000))
+
+SNAPSHOT_FORMATS = {"arrow": ".arrow", "parquet": ".parquet"}
+SNAPSHOT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+MATCH_FIELDS = ("source", "target", "match_type", "score")
+
+def _pyarrow():
+    # pyarrow is only needed by processes that read or write snapshots
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+    return pyarrow
+
+def part_schema():
+    pa = _pyarrow()
+    return pa.schema([(field, pa.string()) for field in PART_FIELDS])
+
+def match_schema():
+    pa = _pyarrow()
+    return pa.schema([
+        ("source", pa.string()), ("target", pa.string()), ("match_type", pa.string()), ("score", pa.float64())
+    ])
+
+def _text(value) -> Optional[str]:
+    # Older uploads may have stored numeric specs; the snapshot columns are all strings
+    return value if value is None or isinstance(value, str) else str(value)
+
+def _part_columns(parts: Iterable[PartNumber], chunk_size: int) -> Iterator[dict]:
+    parts = iter(parts)
+    while chunk := list(islice(parts, chunk_size)):
+        yield {field: [_text(getattr(p, field)) for p in chunk] for field in PART_FIELDS}
+
+def _match_columns(matches: Iterable[Match], chunk_size: int) -> Iterator[dict]:
+    matches = iter(matches)
+    while chunk := list(islice(matches, chunk_size)):
+        yield {
+            "source": [m.source for m in chunk],
+            "target": [m.target for m in chunk],
+            "match_type": [m.match_type for m in chunk],
+            "score": [None if m.score is None else float(m.score) for m in chunk]
+        }
+
+def _write_table(path: str, schema, format: str, chunks: Iterator[dict]) -> int:
+    """Writes chunks as record batches to a temporary file, then moves it over path."""
+    pa = _pyarrow()
+    tmp = f"{path}.tmp-{os.getpid()}"
+    writer = pa.parquet.ParquetWriter(tmp, schema) if format == "parquet" else pa.ipc.new_file(tmp, schema)
+    rows = 0
+    try:
+        for columns in chunks:
+            batch = pa.record_batch([columns[name] for name in schema.names], schema=schema)
+            writer.write_batch(batch)
+            rows += batch.num_rows
+        writer.close()
+    except BaseException:
+        writer.close()
+        os.remove(tmp)
+        raise
+    os.replace(tmp, path)
+    return rows
+
+def write_snapshot(directory: str, parts: Iterable[PartNumber], matches: Iterable[Match],
+                   format: str = "arrow", chunk_size: int = SNAPSHOT_CHUNK_SIZE) -> dict:
+    """
+    Writes the catalog to directory as parts/matches tables (Arrow IPC files, or Parquet for
+    offline analysis) plus a manifest. parts and matches may be lazy iterables; they are
+    consumed chunk_size rows at a time. Each file is replaced atomically, the manifest last.
+    """
+    if format not in SNAPSHOT_FORMATS:
+        raise ValueError(f"Unknown snapshot format {format!r}; expected one of {sorted(SNAPSHOT_FORMATS)}")
+    os.makedirs(directory, exist_ok=True)
+    extension = SNAPSHOT_FORMATS[format]
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "format": format,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "parts": _write_table(os.path.join(directory, f"parts{extension}"), part_schema(), format,
+                              _part_columns(parts, chunk_size)),
+        "matches": _write_table(os.path.join(directory, f"matches{extension}"), match_schema(), format,
+                                _match_columns(matches, chunk_size))
+    }
+    tmp = os.path.join(directory, f"{MANIFEST_FILE}.tmp-{os.getpid()}")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, os.path.join(directory, MANIFEST_FILE))
+    return manifest
+
+
+class CatalogSnapshot:
+    """
+    A loaded snapshot: parts and matches as pyarrow Tables. Arrow IPC snapshots are
+    memory-mapped, so the tables reference the file pages directly (no copy, no parse);
+    Parquet snapshots are decoded on load.
+    """
+
+    def __init__(self, directory: str, manifest: dict, parts, matches):
+        self.directory = directory
+        self.manifest = manifest
+        self.parts = parts
+        self.matches = matches
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - datetime.fromisoformat(self.manifest["created_at"]).timestamp()
+
+    def iter_parts(self) -> Iterator[PartNumber]:
+        for batch in self.parts.to_batches():
+            columns = [batch.column(field).to_pylist() for field in PART_FIELDS]
+            for id, part_number, *values in zip(*columns):
+                yield PartNumber(part_number, *values, id=id)
+
+    def iter_matches(self) -> Iterator[Match]:
+        for batch in self.matches.to_batches():
+            columns = [batch.column(field).to_pylist() for field in MATCH_FIELDS]
+            for source, target, match_type, score in zip(*columns):
+                yield Match(source, target, match_type, score)
+
+
+def _read_table(path: str, format: str):
+    pa = _pyarrow()
+    if format == "parquet":
+        return pa.parquet.read_table(path, memory_map=True)
+    # The table's buffers point into the mapping and keep it open for as long as they live
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+def load_snapshot(directory: str) -> Optional[CatalogSnapshot]:
+    """The snapshot in directory, or None if there is none (or it was written by another version)."""
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        return None
+    format = manifest["format"]
+    extension = SNAPSHOT_FORMATS[format]
+    return CatalogSnapshot(
+        directory,
+        manifest,
+        _read_table(os.path.join(directory, f"parts{extension}"), format),
+        _read_table(os.path.join(directory, f"matches{extension}"), format)
+    )
@@ -1,5 +1,20 @@
 # lib/app/application/services/file_service.py
 
+import csv as py_csv
+import os
+from itertools import zip_longest
+from typing import BinaryIO, Dict, Iterator, List, Tuple
+
+# Example rows of the upload templates, in every format, are recognised by their S.No.
+# value (case-insensitive): "Template" in Neptune_Parts_Upload_Template.xlsx, "model" in partmatch.xlsx
+SERIAL_COLUMN = "S.No."
+TEMPLATE_MARKERS = frozenset(
+    marker.strip().lower() for marker in os.getenv("UPLOAD_TEMPLATE_MARKERS", "Template,model").split(",") if marker.strip()
+)
+
+# Bytes per block read by the CSV reader (and by the CSV row count)
+CSV_BLOCK_SIZE = 1 << 20
+
 class FileService:
     """
     Generic service for file-related operations.
@@ -7,3 +22,179 @@ class FileService:
     def process_file(self, file_bytes, filename: str):
         # You can extend this to save files, validate Excel structure, etc.
         return {"filename": filename, "status": "processed"}
+
+    def count_xlsx_rows(self, file: BinaryIO) -> int:
+        """
+        Number of data rows in the first sheet, counted the way iter_chunks reads them (blank
+        and template rows skipped). The dimension recorded by the writer is not trusted (see
+        _sheet_rows).
+        """
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            _, rows = _xlsx_rows(_sheet_rows(workbook.worksheets[0]))
+            return sum(1 for _ in rows)
+        finally:
+            workbook.close()
+            file.seek(0)
+
+    # ---------- UPLOAD FORMATS ----------
+    def detect_format(self, file: BinaryIO, filename: str) -> str:
+        """
+        Upload format from the file's first bytes (XLSX is a zip archive, Parquet starts with
+        PAR1); anything else is read as CSV. The extension is only used to reject files
+        that claim to be XLSX/Parquet but are not.
+        """
+        head = file.read(4)
+        file.seek(0)
+        if head.startswith(b"PK\x03\x04"):
+            return "xlsx"
+        if head == b"PAR1":
+            return "parquet"
+        extension = os.path.splitext(filename)[1].lower().lstrip(".")
+        if extension in ("xlsx", "parquet"):
+            raise ValueError(f"{filename} is not a valid {extension} file")
+        return "csv"
+
+    def count_rows(self, file: BinaryIO, format: str) -> int:
+        """Number of data rows; exact for XLSX/Parquet, newline-based for CSV (template row included)."""
+        if format == "xlsx":
+            return self.count_xlsx_rows(file)
+        try:
+            if format == "parquet":
+                from pyarrow import parquet
+
+                return parquet.ParquetFile(file).metadata.num_rows
+            file.seek(0)
+            lines, last = 0, b"\n"
+            while block := file.read(CSV_BLOCK_SIZE):
+                lines += block.count(b"\n")
+                last = block[-1:]
+            return max(lines + (last != b"\n") - 1, 0)
+        finally:
+            file.seek(0)
+
+    def iter_chunks(self, file: BinaryIO, format: str, chunk_size: int) -> Iterator[Dict[str, List[str]]]:
+        """
+        Streams an upload and yields chunks of at most chunk_size rows as columns,
+        {header: [value, ...]}, with every value already normalized to a stripped string
+        ("" for empty cells). Template rows (TEMPLATE_MARKERS) and blank rows are dropped.
+        Only one chunk is held in memory at a time, whatever the size of the file.
+        """
+        if format == "xlsx":
+            return self._iter_xlsx_chunks(file, chunk_size)
+        if format == "parquet":
+            from pyarrow import parquet
+
+            batches = parquet.ParquetFile(file).iter_batches(batch_size=chunk_size)
+        else:
+            batches = self._iter_csv_batches(file)
+        return (self._arrow_columns(table) for table in _rechunk(batches, chunk_size))
+
+    def _iter_xlsx_chunks(self, file: BinaryIO, chunk_size: int) -> Iterator[Dict[str, List[str]]]:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            columns, rows = _xlsx_rows(_sheet_rows(workbook.worksheets[0]))
+            chunk = []
+            for values in rows:
+                chunk.append(values)
+                if len(chunk) >= chunk_size:
+                    yield _xlsx_columns(columns, chunk)
+                    chunk = []
+            if chunk:
+                yield _xlsx_columns(columns, chunk)
+        finally:
+            workbook.close()
+
+    def _iter_csv_batches(self, file: BinaryIO):
+        from pyarrow import csv, string
+
+        # Every column is read as text: type inference per block would turn part numbers
+        # into integers (and fail on the first block where they are not)
+        header = next(py_csv.reader([file.readline().decode("utf-8-sig")]), [])
+        file.seek(0)
+        return csv.open_csv(
+            file,
+            read_options=csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            convert_options=csv.ConvertOptions(column_types={name: string() for name in header})
+        )
+
+    def _arrow_columns(self, table) -> Dict[str, List[str]]:
+        """Column-wise normalization of one chunk with Arrow compute kernels."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        columns = {}
+        for name, column in zip(table.column_names, table.columns):
+            if pa.types.is_floating(column.type):
+                column = pc.if_else(pc.is_nan(column), pa.scalar(None, column.type), column)
+            if not pa.types.is_string(column.type):
+                column = pc.cast(column, pa.string())
+            columns[str(name).strip()] = pc.fill_null(pc.utf8_trim_whitespace(column), "")
+
+        keep = None
+        for column in columns.values():
+            filled = pc.not_equal(column, "")
+            keep = filled if keep is None else pc.or_(keep, filled)
+        if SERIAL_COLUMN in columns:
+            template = pc.is_in(pc.utf8_lower(columns[SERIAL_COLUMN]), value_set=pa.array(list(TEMPLATE_MARKERS), pa.string()))
+            keep = pc.and_(keep, pc.invert(template))
+        if keep is None:
+            return {}
+        return {name: pc.filter(column, keep).to_pylist() for name, column in columns.items()}
+
+
+def _cell_text(value) -> str:
+    # None for empty cells; value != value catches float NaN
+    return "" if value is None or value != value else str(value).strip()
+
+def _is_template(value) -> bool:
+    return _cell_text(value).lower() in TEMPLATE_MARKERS
+
+def _sheet_rows(sheet) -> Iterator[tuple]:
+    # Read-only sheets stop at the dimension the writer recorded, which may be stale; drop it
+    # so every stored row (and column) is read
+    sheet.reset_dimensions()
+    return sheet.iter_rows(values_only=True)
+
+def _xlsx_rows(rows: Iterator[tuple]) -> Tuple[List[str], Iterator[tuple]]:
+    """(header, data rows) of a sheet's rows; blank and template rows are skipped."""
+    header = next(rows, None)
+    if header is None:
+        return [], iter(())
+    columns = [str(c).strip() if c is not None else "" for c in header]
+    serial = columns.index(SERIAL_COLUMN) if SERIAL_COLUMN in columns else None
+
+    def data():
+        for values in rows:
+            if values is None or all(v is None for v in values):
+                continue
+            if serial is not None and serial < len(values) and _is_template(values[serial]):
+                continue
+            yield values
+    return columns, data()
+
+def _xlsx_columns(header: List[str], rows: List[tuple]) -> Dict[str, List[str]]:
+    columns = zip_longest(*rows, fillvalue=None)
+    return {name: [_cell_text(v) for v in values] for name, values in zip(header, columns)}
+
+def _rechunk(batches, chunk_size: int):
+    """Regroups record batches of any size into tables of exactly chunk_size rows (the last may be short)."""
+    import pyarrow as pa
+
+    pending, rows = [], 0
+    for batch in batches:
+        if not batch.num_rows:
+            continue
+        pending.append(batch)
+        rows += batch.num_rows
+        while rows >= chunk_size:
+            table = pa.Table.from_batches(pending)
+            yield table.slice(0, chunk_size)
+            rest = table.slice(chunk_size)
+            pending, rows = rest.to_batches(), rest.num_rows
+    if rows:
+        yield pa.Table.from_batches(pending)
@@ -1,7 +1,7 @@
 # lib/app/application/services/repository_interface.py
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from lib.app.domain.entities.part_number import PartNumber
 from lib.app.domain.entities.match import Match
 
@@ -29,7 +29,25 @@ class RepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def list_parts(self) -> List[PartNumber]: 
+    def list_parts(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[PartNumber]:
+        """
+        Lists parts; with limit/cursor, one page ordered by part_number after cursor.
+        """
+        pass
+
+    @abstractmethod
+    def create_parts_bulk(self, parts: List[PartNumber], chunk_size: int) -> List[PartNumber]:
+        """
+        Creates many parts, batching the writes in chunks of chunk_size.
+        """
+        pass
+
+    @abstractmethod
+    def get_part_ids(self, part_numbers: List[str]) -> Dict[str, str]:
+        """
+        Vertex ids of the parts that exist, by part_number. Not always the deterministic
+        id: parts written before upserts (or never deduplicated) keep whatever id they got.
+        """
         pass
 
     # ---------- MATCH CRUD ----------
@@ -42,7 +60,11 @@ class RepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def update_match(self, match: Match) -> Match: 
+    def update_match(self, match: Match) -> Match:
+        """
+        Overwrites match_type (and score when given). Raises ValueError if there is no
+        match from source to target.
+        """
         pass
 
     @abstractmethod
@@ -50,7 +72,64 @@ class RepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def list_matches(self) -> List[Match]: 
+    def list_matches(self, limit: Optional[int] = None, cursor: Optional[Tuple[str, str]] = None) -> List[Match]:
+        """
+        Lists matches; with limit/cursor, one page of at most limit matches ordered by
+        (source, target), starting after the cursor (source, target) pair.
+        """
+        pass
+
+    @abstractmethod
+    def create_matches_bulk(self, matches: List[Match], chunk_size: int) -> List[Match]:
+        """
+        Creates many matches, batching the writes in chunks of chunk_size.
+        """
+        pass
+
+    def update_matches_bulk(self, matches: List[Match], chunk_size: int) -> List[Match]:
+        """
+        update_match for many matches; matches without an edge are skipped. Loops over
+        update_match by default; backends override it to batch the writes.
+        """
+        for match in matches:
+            try:
+                self.update_match(match)
+            except ValueError:
+                pass
+        return matches
+
+    def delete_matches_bulk(self, pairs: List[Tuple[str, str]], chunk_size: int) -> int:
+        """
+        Deletes the (source, target) matches; returns how many pairs were asked for.
+        Loops over delete_match by default; backends override it to batch the writes.
+        """
+        for source, target in pairs:
+            self.delete_match(source, target)
+        return len(pairs)
+
+    # ---------- FINGERPRINTS ----------
+    @abstractmethod
+    def get_part_fingerprints(self, part_numbers: List[str]) -> Dict[str, Optional[str]]:
+        """
+        {part_number: stored part fingerprint} for the parts that exist; None for parts
+        written before fingerprints were stored. Missing parts are left out.
+        """
+        pass
+
+    @abstractmethod
+    def get_match_fingerprints(self, sources: List[str]) -> Dict[Tuple[str, str], Optional[str]]:
+        """
+        {(source, target): stored match fingerprint} for every match out of the given
+        parts; None for matches written without one (older uploads, auto-match proposals).
+        """
+        pass
+
+    # ---------- EXTERNAL WRITES ----------
+    def invalidate(self, part_numbers: Iterable[str]):
+        """
+        Called after parts were written outside this repository (e.g. by the Neptune bulk
+        loader). No-op by default; caching decorators drop the affected entries.
+        """
         pass
 
     # ---------- GET MATCHES FOR A PART ----------
@@ -63,10 +142,51 @@ class RepositoryInterface(ABC):
             "matches": [
                 {
                     "replacement_part": PartNumber,
-                    "match_type": str
+                    "match_type": str,
+                    "score": float | None
                 },
                 ...
             ]
         }
         """
         pass
+
+    def get_matches_for_parts(self, part_numbers: List[str]) -> Dict[str, Optional[dict]]:
+        """
+        get_matches_for_part for many parts: {part_number: result, or None if the part does
+        not exist}. Loops over get_matches_for_part by default; backends override it to
+        resolve the batch in fewer round trips.
+        """
+        return {part_number: self.get_matches_for_part(part_number) for part_number in part_numbers}
+
+    # ---------- TRANSITIVE REPLACEMENTS ----------
+    @abstractmethod
+    def find_replacements(self, part_number: str, max_depth: int, match_types: Optional[List[str]] = None,
+                          in_process: bool = False):
+        """
+        Parts reachable from part_number through up to max_depth MATCHED edges (either
+        direction, no cycles), only over edges whose match_type is in match_types when given.
+        Best path per part, ranked by path quality; None if the part does not exist:
+        [
+            {
+                "replacement_part": PartNumber,
+                "part_number": str,
+                "path": [str, ...],
+                "match_types": [str, ...],
+                "depth": int,
+                "quality": float
+            },
+            ...
+        ]
+        in_process asks implementations that hold an in-process graph to answer from it.
+        """
+        pass
+
+    # ---------- SIMILARITY ----------
+    @abstractmethod
+    def find_similar_parts(self, profile: dict, k: int, exclude: Optional[str] = None):
+        """
+        Top-k catalog parts closest to a spec1..spec5/note1..note3 profile, best first:
+        [{"part": PartNumber, "score": float, "matched_fields": [str, ...]}, ...]
+        """
+        pass
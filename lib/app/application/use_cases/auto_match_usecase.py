@@ -0,0 +1,129 @@
+# lib/app/application/use_cases/auto_match_usecase.py
+
+import asyncio
+import functools
+import os
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from lib.core.logging import logger
+from lib.app.domain.entities.part_number import part_vertex_id
+from lib.app.domain.services.auto_match import build_blocks, block_row, match_blocks
+from lib.app.domain.services.replacement_search import match_types_at_least
+from lib.core.aws.neptune_bulk_loader import trigger_bulk_load, BulkCsvShardWriter
+from lib.core.aws.s3_client import upload_files_to_s3_async
+
+# Blocks sharing a spec value with more parts than this are skipped (too common to be evidence)
+AUTO_MATCH_MAX_BLOCK_SIZE = int(os.getenv("AUTO_MATCH_MAX_BLOCK_SIZE", 1000))
+# Candidate pairs handed to one worker task; small blocks are grouped up to this budget
+AUTO_MATCH_TASK_PAIRS = int(os.getenv("AUTO_MATCH_TASK_PAIRS", 250_000))
+AUTO_MATCH_WORKERS = int(os.getenv("AUTO_MATCH_WORKERS", os.cpu_count() or 1))
+# Value of the "origin" edge property that marks edges proposed by this job
+AUTO_MATCH_ORIGIN = "auto"
+
+AUTO_EDGE_CSV_FIELDS = ["~id", "~from", "~to", "~label", "match_type", "score:Double", "origin"]
+
+class AutoMatchUseCase:
+    """
+    Proposes MATCHED edges across the whole catalog:
+    1. blocking: parts are bucketed by shared (normalized) spec value, so only parts that
+       share at least one value are compared - never the full N^2 cross product
+    2. MatchLogic runs over each block's pairs in a process pool
+    3. new edges (pairs without an existing match either way) are staged as bulk-loader CSVs,
+       tagged origin=auto, and loaded through the Neptune bulk loader
+    Only Perfect matches are proposed by default. With the default rules any shared spec
+    value is a Partial match, so proposing Partial matches requires an explicit min_score.
+    """
+
+    def __init__(self, part_usecase, match_usecase, min_match_type: str = "Perfect",
+                 min_score: Optional[float] = None, max_block_size: int = AUTO_MATCH_MAX_BLOCK_SIZE,
+                 workers: int = AUTO_MATCH_WORKERS, batch_size: int = 10_000):
+        if min_match_type != "Perfect" and min_score is None:
+            raise ValueError(f"Proposing {min_match_type} matches requires a min_score")
+        self.part_usecase = part_usecase
+        self.match_usecase = match_usecase
+        self.keep = frozenset(t for t in match_types_at_least(min_match_type) if t != "No Match")
+        self.min_score = min_score or 0.0
+        self.max_block_size = max_block_size
+        self.workers = workers
+        self.batch_size = batch_size
+        self.s3_bucket = os.getenv("S3_BUCKET_NAME")
+
+    def _tasks(self, parts, blocks):
+        """Groups blocks into worker tasks of roughly AUTO_MATCH_TASK_PAIRS candidate pairs."""
+        task, pairs = [], 0
+        for key, members in blocks.items():
+            task.append((key, [block_row(i, parts[i]) for i in members]))
+            pairs += len(members) * (len(members) - 1) // 2
+            if pairs >= AUTO_MATCH_TASK_PAIRS:
+                yield task
+                task, pairs = [], 0
+        if task:
+            yield task
+
+    def propose(self, edge_writer: Optional[BulkCsvShardWriter] = None) -> dict:
+        """Runs blocking + matching; writes proposed edges to edge_writer when given."""
+        parts = list(self.part_usecase.iter_parts(self.batch_size))
+        # Keyset-paged by (source, target), so the walk is linear and sees every edge once
+        existing = {frozenset((m.source, m.target)) for m in self.match_usecase.iter_matches(self.batch_size)}
+        blocks, oversized = build_blocks(parts, self.max_block_size)
+        logger.info(f"Auto-match: {len(parts)} parts, {len(blocks)} blocks, {len(oversized)} oversized keys skipped")
+
+        stats = {
+            "parts": len(parts),
+            "blocks": len(blocks),
+            "oversized_blocks": len(oversized),
+            "candidate_pairs": sum(len(m) * (len(m) - 1) // 2 for m in blocks.values()),
+            "proposed": 0,
+            "already_matched": 0,
+            "by_match_type": {t: 0 for t in sorted(self.keep)}
+        }
+        touched = set()
+        worker = functools.partial(match_blocks, oversized=oversized, keep=self.keep, min_score=self.min_score)
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for results in pool.map(worker, self._tasks(parts, blocks)):
+                for i, j, match_type, score in results:
+                    source, target = sorted((parts[i], parts[j]), key=lambda p: p.part_number)
+                    if frozenset((source.part_number, target.part_number)) in existing:
+                        stats["already_matched"] += 1
+                        continue
+                    stats["proposed"] += 1
+                    stats["by_match_type"][match_type] += 1
+                    touched.update((source.part_number, target.part_number))
+                    if edge_writer is not None:
+                        source_id = source.id or part_vertex_id(source.part_number)
+                        target_id = target.id or part_vertex_id(target.part_number)
+                        edge_writer.writerow({
+                            # Deterministic id: re-running the job does not duplicate its edges
+                            "~id": f"{AUTO_MATCH_ORIGIN}-{source_id}-{target_id}",
+                            "~from": source_id,
+                            "~to": target_id,
+                            "~label": "MATCHED",
+                            "match_type": match_type,
+                            "score:Double": score,
+                            "origin": AUTO_MATCH_ORIGIN
+                        })
+        stats["touched_parts"] = touched
+        return stats
+
+    async def execute(self, dry_run: bool = False) -> dict:
+        if dry_run:
+            stats = await asyncio.to_thread(self.propose)
+            stats.pop("touched_parts")
+            return {**stats, "bulk_load_id": None}
+
+        with tempfile.TemporaryDirectory(prefix="neptune_auto_match_") as staging_dir:
+            edge_writer = BulkCsvShardWriter(staging_dir, "auto_matches", AUTO_EDGE_CSV_FIELDS)
+            stats = await asyncio.to_thread(self.propose, edge_writer)
+            shards = edge_writer.close()
+
+            bulk_load_id = None
+            if stats["proposed"]:
+                s3_prefix = f"neptune_auto_match/{uuid.uuid4().hex}/"
+                await upload_files_to_s3_async([(path, f"{s3_prefix}{os.path.basename(path)}") for path in shards])
+                bulk_response = await trigger_bulk_load(f"s3://{self.s3_bucket}/{s3_prefix}", mode="NEW")
+                bulk_load_id = bulk_response.get("payload", {}).get("loadId") if isinstance(bulk_response, dict) else None
+
+        await asyncio.to_thread(self.part_usecase.invalidate_parts, stats.pop("touched_parts"))
+        return {**stats, "bulk_load_id": bulk_load_id}
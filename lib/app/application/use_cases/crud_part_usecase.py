@@ -1,6 +1,6 @@
 # lib/app/application/use_cases/crud_part_usecase.py
 
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from lib.app.domain.entities.part_number import PartNumber
 
 class CrudPartUseCase:
@@ -22,6 +22,18 @@ class CrudPartUseCase:
             created_part.id = part.id
         return created_part
 
+    def create_parts_bulk(self, parts: List[PartNumber], chunk_size: int) -> List[PartNumber]:
+        """
+        Create many parts, chunk_size parts per repository round trip.
+        """
+        return self.repository.create_parts_bulk(parts, chunk_size)
+
+    def invalidate_parts(self, part_numbers: Iterable[str]):
+        """
+        Tell the repository that these parts were written behind its back (bulk loader).
+        """
+        self.repository.invalidate(part_numbers)
+
     # ---------- READ ----------
     def get_part(self, part_number: str) -> Optional[PartNumber]:
         """
@@ -29,6 +41,18 @@ class CrudPartUseCase:
         """
         return self.repository.get_part(part_number)
 
+    def get_part_ids(self, part_numbers: List[str]) -> Dict[str, str]:
+        """
+        Vertex ids of the parts that exist, by part_number.
+        """
+        return self.repository.get_part_ids(part_numbers)
+
+    def get_part_fingerprints(self, part_numbers: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Stored spec/note fingerprints of the parts that exist (None where none was stored).
+        """
+        return self.repository.get_part_fingerprints(part_numbers)
+
     # ---------- UPDATE ----------
     def update_part(self, part: PartNumber) -> PartNumber:
         """
@@ -48,8 +72,27 @@ class CrudPartUseCase:
         return self.repository.delete_part(part_number)
 
     # ---------- LIST ----------
-    def list_parts(self) -> List[PartNumber]:
+    def list_parts(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[PartNumber]:
+        """
+        List all parts, or one page of limit parts after the cursor part_number.
+        """
+        return self.repository.list_parts(limit, cursor)
+
+    def iter_parts(self, batch_size: int) -> Iterator[PartNumber]:
+        """
+        Yield every part, fetching batch_size parts per repository call.
+        """
+        cursor = None
+        while True:
+            page = self.repository.list_parts(batch_size, cursor)
+            yield from page
+            if len(page) < batch_size:
+                return
+            cursor = page[-1].part_number
+
+    # ---------- SIMILARITY ----------
+    def find_similar_parts(self, profile: dict, k: int, exclude: Optional[str] = None) -> List[dict]:
         """
-        List all parts.
+        Top-k catalog parts whose specs/notes are closest to profile.
         """
-        return self.repository.list_parts()
+        return self.repository.find_similar_parts(profile, k, exclude)
@@ -1,7 +1,10 @@
 # lib/app/application/use_cases/match_part_usecase.py
 
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from lib.app.domain.entities.match import Match
+from lib.app.domain.entities.part_number import SPEC_FIELDS, NOTE_FIELDS
+from lib.app.domain.services.match_logic import MatchLogic
+from lib.app.domain.services.replacement_search import match_types_at_least
 
 class MatchPartUseCase:
     """
@@ -10,15 +13,39 @@ class MatchPartUseCase:
 
     def __init__(self, repository):
         self.repository = repository
+        self.logic = MatchLogic()
+
+    def _score(self, match: Match) -> Match:
+        """
+        Fills in the rule score when the caller did not give one (and the match type when
+        it is blank or AUTO), from the current specs/notes of both parts.
+        """
+        if match.score is not None:
+            return match
+        source, target = self.repository.get_part(match.source), self.repository.get_part(match.target)
+        if source and target:
+            match.score, match_type = self.logic.score_match(
+                {f: getattr(source, f) for f in SPEC_FIELDS}, {f: getattr(source, f) for f in NOTE_FIELDS},
+                {f: getattr(target, f) for f in SPEC_FIELDS}, {f: getattr(target, f) for f in NOTE_FIELDS}
+            )
+            if not match.match_type or match.match_type == "AUTO":
+                match.match_type = match_type
+        return match
 
     # ---------- CREATE ----------
     def create_match(self, match: Match) -> Match:
         """
-        Create a match between two parts.
+        Create a match between two parts, scored by the match rules.
         """
-        created_match = self.repository.create_match(match)
+        created_match = self.repository.create_match(self._score(match))
         return created_match
 
+    def create_matches_bulk(self, matches: List[Match], chunk_size: int) -> List[Match]:
+        """
+        Create many matches, chunk_size matches per repository round trip.
+        """
+        return self.repository.create_matches_bulk(matches, chunk_size)
+
     # ---------- READ ----------
     def get_match(self, source: str, target: str) -> Optional[Match]:
         """
@@ -34,6 +61,12 @@ class MatchPartUseCase:
         updated_match = self.repository.update_match(match)
         return updated_match
 
+    def update_matches_bulk(self, matches: List[Match], chunk_size: int) -> List[Match]:
+        """
+        Update many matches, chunk_size matches per repository round trip.
+        """
+        return self.repository.update_matches_bulk(matches, chunk_size)
+
     # ---------- DELETE ----------
     def delete_match(self, source: str, target: str) -> bool:
         """
@@ -41,12 +74,36 @@ class MatchPartUseCase:
         """
         return self.repository.delete_match(source, target)
 
+    def delete_matches_bulk(self, pairs: List[Tuple[str, str]], chunk_size: int) -> int:
+        """
+        Delete many (source, target) matches, chunk_size per repository round trip.
+        """
+        return self.repository.delete_matches_bulk(pairs, chunk_size)
+
     # ---------- LIST ----------
-    def list_matches(self) -> List[Match]:
+    def list_matches(self, limit: Optional[int] = None, cursor: Optional[Tuple[str, str]] = None) -> List[Match]:
         """
-        List all matches.
+        List all matches, or one page of limit matches after the cursor (source, target) pair.
         """
-        return self.repository.list_matches()
+        return self.repository.list_matches(limit, cursor)
+
+    def iter_matches(self, batch_size: int) -> Iterator[Match]:
+        """
+        Yield every match, fetching batch_size matches per repository call.
+        """
+        cursor = None
+        while True:
+            page = self.repository.list_matches(batch_size, cursor)
+            yield from page
+            if len(page) < batch_size:
+                return
+            cursor = (page[-1].source, page[-1].target)
+
+    def get_match_fingerprints(self, sources: List[str]) -> Dict[Tuple[str, str], Optional[str]]:
+        """
+        Stored fingerprints of every match out of the given parts, keyed by (source, target).
+        """
+        return self.repository.get_match_fingerprints(sources)
 
     # ---------- GET MATCHES FOR PART ----------
     def get_matches_for_part(self, part_number: str):
@@ -57,9 +114,28 @@ class MatchPartUseCase:
             "matches": [
                 {
                     "replacement_part": PartNumber,
-                    "match_type": str
+                    "match_type": str,
+                    "score": float | None
                 }, ...
             ]
         }
         """
         return self.repository.get_matches_for_part(part_number)
+
+    def get_matches_for_parts(self, part_numbers: List[str]) -> dict:
+        """
+        get_matches_for_part for many parts at once (duplicates collapsed, request order kept):
+        {part_number: result in the format above, or None if the part does not exist}
+        """
+        return self.repository.get_matches_for_parts(list(dict.fromkeys(part_numbers)))
+
+    # ---------- TRANSITIVE REPLACEMENTS ----------
+    def find_replacements(self, part_number: str, max_depth: int, min_match_type: str = "Partial",
+                          in_process: bool = False):
+        """
+        Everything that can ultimately replace part_number through chains of up to max_depth
+        matches, using only matches at least as good as min_match_type. Ranked best first.
+        """
+        return self.repository.find_replacements(
+            part_number, max_depth, match_types_at_least(min_match_type), in_process
+        )
@@ -1,132 +1,392 @@
 # lib/app/application/use_cases/upload_file_usecase.py
 
-import pandas as pd
 import tempfile
-from io import BytesIO
 import asyncio
 import os
-import hashlib
-from lib.app.domain.entities.part_number import PartNumber
-from lib.app.domain.entities.match import Match
+import time
+import uuid
+from collections import OrderedDict
+from typing import BinaryIO, Dict, List, Optional
+from lib.app.application.services.file_service import FileService
+from lib.app.domain.entities.part_number import PartNumber, part_vertex_id, SPEC_FIELDS, NOTE_FIELDS
+from lib.app.domain.entities.match import Match, match_edge_id
+from lib.app.domain.services.fingerprint import FINGERPRINT_PROPERTY, part_fingerprint, match_fingerprint
 from lib.app.domain.services.match_logic import MatchLogic
-from lib.core.aws.neptune_bulk_loader import trigger_bulk_load
-from lib.core.aws.s3_client import upload_file_to_s3_async
+from lib.app.domain.services.similarity import SEARCH_KEY_PROPERTIES, normalize_value
+from lib.core.aws.neptune_bulk_loader import trigger_bulk_load, get_bulk_load_status, BulkCsvShardWriter
+from lib.core.aws.s3_client import upload_files_to_s3_async
+from lib.core.logging import logger
+from lib.core.metrics import METRICS_ENABLED, UPLOAD_ROWS, UPLOAD_SECONDS, BULK_LOAD_SECONDS
+
+# Rows written to Neptune per batched traversal
+DEFAULT_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", 200))
+
+# Ingest modes: "gremlin" writes rows through traversals, "bulk" only stages CSVs for the
+# Neptune bulk loader, "auto" picks bulk once the sheet has BULK_INGEST_ROW_THRESHOLD rows
+INGEST_MODES = ("gremlin", "bulk", "auto")
+DEFAULT_INGEST_MODE = os.getenv("UPLOAD_INGEST_MODE", "auto")
+BULK_INGEST_ROW_THRESHOLD = int(os.getenv("BULK_INGEST_ROW_THRESHOLD", 5000))
+
+# Vertex properties are declared single-cardinality, so reloading a part (a delta update)
+# replaces its values instead of adding to them
+VERTEX_CSV_COLUMNS = {
+    f: f"{f}:String(single)"
+    for f in (*SPEC_FIELDS, *NOTE_FIELDS, "part_number", *SEARCH_KEY_PROPERTIES.values(), FINGERPRINT_PROPERTY)
+}
+VERTEX_CSV_FIELDS = ["~id", "~label", *VERTEX_CSV_COLUMNS.values()]
+# Edges carry a deterministic ~id, so loading the same sheet again does not add a second edge per pair
+EDGE_CSV_FIELDS = ["~id", "~from", "~to", "~label", "match_type", "score:Double", FINGERPRINT_PROPERTY]
+
+# Loader statuses that are still moving; anything else is final and its duration is recorded once
+BULK_LOAD_ACTIVE_STATUSES = ("LOAD_NOT_STARTED", "LOAD_IN_QUEUE", "LOAD_IN_PROGRESS")
+# How often a bulk-mode upload job polls its load until it is final
+BULK_LOAD_POLL_SECONDS = float(os.getenv("BULK_LOAD_POLL_SECONDS", 15))
+# The job fails (and frees its worker and connection) once the load is not final after
+# BULK_LOAD_TIMEOUT_SECONDS, or its status could not be read this many polls in a row
+BULK_LOAD_TIMEOUT_SECONDS = float(os.getenv("BULK_LOAD_TIMEOUT_SECONDS", 6 * 3600))
+BULK_LOAD_MAX_STATUS_ERRORS = int(os.getenv("BULK_LOAD_MAX_STATUS_ERRORS", 10))
+_recorded_bulk_loads = OrderedDict()
+
+class UploadProgress:
+    """
+    Live counters for one upload, updated chunk by chunk while execute() runs.
+    """
+    def __init__(self):
+        self.ingest_mode = None
+        self.rows_parsed = 0
+        self.rows_written = 0
+        self.errors = []
+        self.bulk_load_id = None
+
+class UploadDiff:
+    """
+    Delta-upload bookkeeping: the fingerprint this upload last wrote (or found unchanged)
+    per part and per (source, target) match, and counts of what was sent.
+    """
+    def __init__(self):
+        self.parts = {}
+        self.matches = {}
+        self.counts = {
+            "parts_inserted": 0, "parts_updated": 0, "parts_unchanged": 0,
+            "matches_inserted": 0, "matches_updated": 0, "matches_unchanged": 0, "matches_deleted": 0
+        }
+
+    def classify(self, kind: str, seen: dict, key, fingerprint: str, stored: dict) -> Optional[str]:
+        """
+        "inserted", "updated" or None (unchanged) for one part/match. Keys this upload already
+        handled are compared with what it wrote (and only counted again if they changed);
+        others with the stored fingerprints.
+        """
+        if key in seen:
+            if seen[key] == fingerprint:
+                return None
+            change = "updated"
+        elif key in stored:
+            change = None if stored[key] == fingerprint else "updated"
+        else:
+            change = "inserted"
+        seen[key] = fingerprint
+        self.counts[f"{kind}_{change or 'unchanged'}"] += 1
+        return change
 
 class UploadFileUseCase:
-    def __init__(self, part_usecase, match_usecase, backup_to_s3=True):
+    def __init__(self, part_usecase, match_usecase, backup_to_s3=True, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 ingest_mode: Optional[str] = None, delta: bool = False, delete_missing: bool = False):
         self.part_usecase = part_usecase
         self.match_usecase = match_usecase
         self.backup_to_s3 = backup_to_s3
+        self.chunk_size = chunk_size
+        self.ingest_mode = ingest_mode or DEFAULT_INGEST_MODE
+        if self.ingest_mode not in INGEST_MODES:
+            raise ValueError(f"Unknown ingest mode '{self.ingest_mode}', expected one of {INGEST_MODES}")
+        # delta: only rows whose fingerprints differ from the stored ones are written;
+        # delete_missing: matches out of the upload's input parts that the upload no longer lists are deleted
+        self.delta = delta or delete_missing
+        self.delete_missing = delete_missing
         self.s3_bucket = os.getenv("S3_BUCKET_NAME")
         self.logic = MatchLogic()
+        self.file_service = FileService()
+
+    async def _flush(self, parts: list, matches: list, match_updates: list = ()):
+        """Write one chunk of rows: a single parts traversal, then a single traversal per matches list."""
+        if parts:
+            await asyncio.to_thread(self.part_usecase.create_parts_bulk, parts, len(parts))
+        if matches:
+            await asyncio.to_thread(self.match_usecase.create_matches_bulk, matches, len(matches))
+        if match_updates:
+            await asyncio.to_thread(self.match_usecase.update_matches_bulk, match_updates, len(match_updates))
+
+    def _diff_chunk(self, parts: List[PartNumber], matches: List[Match], diff: UploadDiff):
+        """
+        Compares one chunk with the stored fingerprints (one bulk read for the parts, one for
+        the matches out of its input parts). Returns (changed parts, new matches, changed matches).
+        """
+        unseen = [p.part_number for p in parts if p.part_number not in diff.parts]
+        stored_parts = self.part_usecase.get_part_fingerprints(unseen) if unseen else {}
+        changed_parts = [
+            part for part in parts
+            if diff.classify("parts", diff.parts, part.part_number, part_fingerprint(part), stored_parts)
+        ]
+
+        # The last row for a pair wins within the chunk, as with parts
+        matches = list({(m.source, m.target): m for m in matches}.values())
+        sources = list({m.source for m in matches if (m.source, m.target) not in diff.matches})
+        stored_matches = self.match_usecase.get_match_fingerprints(sources) if sources else {}
+        inserts, updates = [], []
+        for match in matches:
+            change = diff.classify("matches", diff.matches, (match.source, match.target),
+                                   match_fingerprint(match), stored_matches)
+            if change == "inserted":
+                inserts.append(match)
+            elif change == "updated":
+                updates.append(match)
+        return changed_parts, inserts, updates
+
+    def _delete_missing_matches(self, diff: UploadDiff) -> int:
+        """
+        Deletes matches out of the upload's input parts that the upload does not list.
+        Matches stored without a fingerprint (auto-match proposals, older uploads) are kept.
+        """
+        sources = sorted({source for source, _ in diff.matches})
+        stale = [
+            pair for pair, fingerprint in self.match_usecase.get_match_fingerprints(sources).items()
+            if fingerprint is not None and pair not in diff.matches
+        ]
+        if stale:
+            self.match_usecase.delete_matches_bulk(stale, self.chunk_size)
+        return len(stale)
+
+    @staticmethod
+    def _parts_from_columns(columns: Dict[str, List[str]], side: str, rows: int) -> List[PartNumber]:
+        """The "Input ..." or "Output ..." part of every row of a chunk, built column-wise."""
+        empty = [""] * rows
+        numbers = columns.get(f"{side} Part Number", empty)
+        values = [columns.get(f"{side} Spec {i}", empty) for i in range(1, len(SPEC_FIELDS) + 1)]
+        values += [columns.get(f"{side} Note {i}", empty) for i in range(1, len(NOTE_FIELDS) + 1)]
+        return [PartNumber(number, *row, id=part_vertex_id(number)) for number, *row in zip(numbers, *values)]
+
+    def _score_matches(self, match_type_column: List[str], pairs: list):
+        """
+        Rule score for every row of a chunk in one vectorized pass. The Match Type column
+        wins when filled in; blank/AUTO rows take the tier of their score.
+        Returns (match_types, scores).
+        """
+        import numpy as np
+
+        match_types = np.array([t or "AUTO" for t in match_type_column], dtype=object)
+        scores, rule_types = self.logic.score_match_batch(
+            [[getattr(i, f) for f in SPEC_FIELDS] for i, _ in pairs],
+            [[getattr(i, f) for f in NOTE_FIELDS] for i, _ in pairs],
+            [[getattr(o, f) for f in SPEC_FIELDS] for _, o in pairs],
+            [[getattr(o, f) for f in NOTE_FIELDS] for _, o in pairs]
+        )
+        auto = match_types == "AUTO"
+        match_types[auto] = rule_types[auto]
+        return match_types.tolist(), scores.tolist()
+
+    @staticmethod
+    def _vertex_row(part: PartNumber) -> dict:
+        return {
+            "~id": part.id, "~label": "PartNumber",
+            **{VERTEX_CSV_COLUMNS[f]: getattr(part, f) for f in (*SPEC_FIELDS, *NOTE_FIELDS, "part_number")},
+            **{VERTEX_CSV_COLUMNS[key]: normalize_value(getattr(part, f)) for f, key in SEARCH_KEY_PROPERTIES.items()},
+            VERTEX_CSV_COLUMNS[FINGERPRINT_PROPERTY]: part_fingerprint(part)
+        }
+
+    @staticmethod
+    def _stage_rows(vertex_writer: BulkCsvShardWriter, vertex_rows: list, edge_writer: BulkCsvShardWriter, edge_rows: list):
+        for row in vertex_rows:
+            vertex_writer.writerow(row)
+        for row in edge_rows:
+            edge_writer.writerow(row)
+
+    async def _resolve_ingest_mode(self, file: BinaryIO, format: str) -> str:
+        if self.ingest_mode != "auto":
+            return self.ingest_mode
+        rows = await asyncio.to_thread(self.file_service.count_rows, file, format)
+        return "bulk" if rows >= BULK_INGEST_ROW_THRESHOLD else "gremlin"
+
+    @staticmethod
+    async def get_bulk_load_status(load_id: str) -> dict:
+        response = await get_bulk_load_status(load_id)
+        overall = response.get("payload", {}).get("overallStatus", {}) if isinstance(response, dict) else {}
+        status = overall.get("status")
+        if METRICS_ENABLED and status and status not in BULK_LOAD_ACTIVE_STATUSES and load_id not in _recorded_bulk_loads:
+            _recorded_bulk_loads[load_id] = True
+            if len(_recorded_bulk_loads) > 10000:
+                _recorded_bulk_loads.popitem(last=False)
+            BULK_LOAD_SECONDS.observe(float(overall.get("totalTimeSpent") or 0), status)
+        return {
+            "bulk_load_id": load_id,
+            "status": status,
+            "records_loaded": overall.get("totalRecords"),
+            "duplicates": overall.get("totalDuplicates"),
+            "errors": overall.get("parsingErrors", 0) + overall.get("insertErrors", 0),
+            "elapsed_seconds": overall.get("totalTimeSpent"),
+            "details": response.get("payload", {}) if isinstance(response, dict) else response
+        }
+
+    async def _wait_for_bulk_load(self, load_id: str) -> str:
+        """
+        Polls the loader until the load reaches a final status, and returns it. Raises
+        RuntimeError past BULK_LOAD_TIMEOUT_SECONDS or BULK_LOAD_MAX_STATUS_ERRORS.
+        """
+        deadline = time.monotonic() + BULK_LOAD_TIMEOUT_SECONDS
+        errors = 0
+        while time.monotonic() < deadline:
+            await asyncio.sleep(BULK_LOAD_POLL_SECONDS)
+            try:
+                status = (await self.get_bulk_load_status(load_id))["status"]
+            except Exception as e:
+                status, error = None, e
+            else:
+                error = "no status in the loader response"
+            if status is None:
+                errors += 1
+                if errors >= BULK_LOAD_MAX_STATUS_ERRORS:
+                    raise RuntimeError(f"Status of bulk load {load_id} unreadable {errors} times in a row: {error}")
+                logger.warning(f"Reading the status of bulk load {load_id} failed, retrying: {error}")
+                continue
+            errors = 0
+            if status not in BULK_LOAD_ACTIVE_STATUSES:
+                return status
+        raise RuntimeError(f"Bulk load {load_id} not final after {BULK_LOAD_TIMEOUT_SECONDS:g}s")
+
+    async def execute(self, file: BinaryIO, filename: str, progress: Optional[UploadProgress] = None) -> dict:
+        progress = progress or UploadProgress()
+        started = time.perf_counter()
+        status = "failed"
+        try:
+            result = await self._execute(file, filename, progress)
+            status = "succeeded"
+            return result
+        except Exception as e:
+            progress.errors.append(str(e))
+            raise
+        finally:
+            if METRICS_ENABLED:
+                UPLOAD_SECONDS.observe(time.perf_counter() - started, progress.ingest_mode or "unknown", status)
+
+    async def _execute(self, file: BinaryIO, filename: str, progress: UploadProgress) -> dict:
+        format = self.file_service.detect_format(file, filename)
+        ingest_mode = await self._resolve_ingest_mode(file, format)
+        progress.ingest_mode = ingest_mode
+        write_through_gremlin = ingest_mode == "gremlin"
+        part_numbers = set()
+
+        seen_vertex_ids = set()
+        edges_written = edges_updated = 0
+        diff = UploadDiff() if self.delta else None
+
+        with tempfile.TemporaryDirectory(prefix="neptune_bulk_") as staging_dir:
+            vertex_writer = BulkCsvShardWriter(staging_dir, "vertices", VERTEX_CSV_FIELDS)
+            edge_writer = BulkCsvShardWriter(staging_dir, "edges", EDGE_CSV_FIELDS)
+
+            # Parse in a worker thread one chunk at a time, so the event loop stays free
+            # and peak memory is bounded by chunk_size rather than by file size
+            chunks = self.file_service.iter_chunks(file, format, self.chunk_size)
+            while True:
+                columns = await asyncio.to_thread(next, chunks, None)
+                if columns is None:
+                    break
+                rows = max(map(len, columns.values()), default=0)
+                progress.rows_parsed += rows
+
+                pairs = list(zip(
+                    self._parts_from_columns(columns, "Input", rows),
+                    self._parts_from_columns(columns, "Output", rows)
+                ))
+                match_types, scores = self._score_matches(columns.get("Match Type", [""] * rows), pairs)
+
+                matches = [
+                    Match(input_part.part_number, output_part.part_number, match_type, score)
+                    for (input_part, output_part), match_type, score in zip(pairs, match_types, scores)
+                ]
+                # The same part can appear in many rows; the last row wins
+                parts = list({p.part_number: p for pair in pairs for p in pair}.values())
+                if not write_through_gremlin:
+                    # The loader addresses vertices by ~id: existing parts keep the id they have (not the
+                    # deterministic one for vertices older than upserts), so no duplicate vertex is loaded
+                    existing_ids = await asyncio.to_thread(self.part_usecase.get_part_ids, [p.part_number for p in parts])
+                    for part in parts:
+                        part.id = existing_ids.get(part.part_number, part.id)
+                vertex_ids = {part.part_number: part.id for part in parts}
+                match_updates = []
+                if self.delta:
+                    parts, matches, match_updates = await asyncio.to_thread(self._diff_chunk, parts, matches, diff)
+
+                # Vertices and edges for the bulk loader / S3 backup
+                vertex_rows = []
+                for part in parts:
+                    if part.id in seen_vertex_ids and not self.delta:
+                        continue
+                    seen_vertex_ids.add(part.id)
+                    part_numbers.add(part.part_number)
+                    vertex_rows.append(self._vertex_row(part))
+                edge_rows = []
+                for match in matches:
+                    source_id, target_id = vertex_ids[match.source], vertex_ids[match.target]
+                    edge_rows.append({
+                        "~id": match_edge_id(source_id, target_id),
+                        "~from": source_id,
+                        "~to": target_id,
+                        "~label": "MATCHED",
+                        "match_type": match.match_type,
+                        "score:Double": match.score,
+                        FINGERPRINT_PROPERTY: match_fingerprint(match)
+                    })
+                    part_numbers.update((match.source, match.target))
+                edges_written += len(edge_rows)
+
+                # gzip compression is CPU work; keep it off the event loop
+                await asyncio.to_thread(self._stage_rows, vertex_writer, vertex_rows, edge_writer, edge_rows)
+                if write_through_gremlin:
+                    await self._flush(parts, matches, match_updates)
+                elif match_updates:
+                    # The loader cannot update edges it did not create; changed matches go through Gremlin
+                    await asyncio.to_thread(self.match_usecase.update_matches_bulk, match_updates, len(match_updates))
+                edges_updated += len(match_updates)
+                progress.rows_written += rows
+                if METRICS_ENABLED:
+                    UPLOAD_ROWS.inc(ingest_mode, amount=rows)
+
+            shards = vertex_writer.close() + edge_writer.close()
+
+            # ---------------- Bulk loader & S3 backup ----------------
+            # Each upload gets its own prefix so the loader only picks up this upload's files
+            s3_prefix = f"neptune_bulk/{uuid.uuid4().hex}/"
+            if shards and (self.backup_to_s3 or not write_through_gremlin):
+                await upload_files_to_s3_async([(path, f"{s3_prefix}{os.path.basename(path)}") for path in shards])
+
+        if self.delete_missing:
+            diff.counts["matches_deleted"] = await asyncio.to_thread(self._delete_missing_matches, diff)
 
-    def safe_str(self, val):
-        return "" if pd.isna(val) else str(val).strip()
-
-    def generate_vertex_id(self, part_number: str) -> str:
-        """Composite vertex ID: part_number + random hash"""
-        hash_str = hashlib.md5(os.urandom(16)).hexdigest()[:8]
-        return f"{part_number}_{hash_str}"
-
-    async def execute(self, file_bytes: BytesIO, filename: str) -> dict:
-        # Save Excel temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
-            tmp.write(file_bytes.read())
-            tmp_path = tmp.name
-
-        # Read Excel: skip template row (assuming header + template in first 2 rows)
-        df = pd.read_excel(tmp_path)
-        df = df.iloc[2:]  # skip header + template
-        df = df.fillna("")
-        df.columns = [str(c).strip() for c in df.columns]
-
-        vertices, edges = [], []
-
-        for _, row in df.iterrows():
-            # ---------------- Input Part ----------------
-            input_part = PartNumber(
-                part_number=self.safe_str(row.get("Input Part Number")),
-                spec1=self.safe_str(row.get("Input Spec 1")),
-                spec2=self.safe_str(row.get("Input Spec 2")),
-                spec3=self.safe_str(row.get("Input Spec 3")),
-                spec4=self.safe_str(row.get("Input Spec 4")),
-                spec5=self.safe_str(row.get("Input Spec 5")),
-                note1=self.safe_str(row.get("Input Note 1")),
-                note2=self.safe_str(row.get("Input Note 2")),
-                note3=self.safe_str(row.get("Input Note 3")),
-                id=self.generate_vertex_id(row.get("Input Part Number"))
-            )
-
-            # ---------------- Output Part ----------------
-            output_part = PartNumber(
-                part_number=self.safe_str(row.get("Output Part Number")),
-                spec1=self.safe_str(row.get("Output Spec 1")),
-                spec2=self.safe_str(row.get("Output Spec 2")),
-                spec3=self.safe_str(row.get("Output Spec 3")),
-                spec4=self.safe_str(row.get("Output Spec 4")),
-                spec5=self.safe_str(row.get("Output Spec 5")),
-                note1=self.safe_str(row.get("Output Note 1")),
-                note2=self.safe_str(row.get("Output Note 2")),
-                note3=self.safe_str(row.get("Output Note 3")),
-                id=self.generate_vertex_id(row.get("Output Part Number"))
-            )
-
-            # Save parts
-            await asyncio.to_thread(self.part_usecase.create_part, input_part)
-            await asyncio.to_thread(self.part_usecase.create_part, output_part)
-
-            # ---------------- Determine Match Type ----------------
-            match_type = self.safe_str(row.get("Match Type")) or "AUTO"
-            if match_type == "AUTO":
-                match_type = self.logic.determine_match(
-                    {f"spec{i}": getattr(input_part, f"spec{i}") for i in range(1,6)},
-                    {f"note{i}": getattr(input_part, f"note{i}") for i in range(1,4)},
-                    {f"spec{i}": getattr(output_part, f"spec{i}") for i in range(1,6)},
-                    {f"note{i}": getattr(output_part, f"note{i}") for i in range(1,4)}
-                )
-
-            # Save match
-            match = Match(input_part.part_number, output_part.part_number, match_type)
-            await asyncio.to_thread(self.match_usecase.create_match, match)
-
-            # Prepare vertices and edges for bulk loader (optional)
-            vertices.extend([
-                {"~id": input_part.id, "~label": "PartNumber",
-                 **{f"spec{i}": getattr(input_part, f"spec{i}") for i in range(1,6)},
-                 **{f"note{i}": getattr(input_part, f"note{i}") for i in range(1,4)},
-                 "part_number": input_part.part_number},
-                {"~id": output_part.id, "~label": "PartNumber",
-                 **{f"spec{i}": getattr(output_part, f"spec{i}") for i in range(1,6)},
-                 **{f"note{i}": getattr(output_part, f"note{i}") for i in range(1,4)},
-                 "part_number": output_part.part_number}
-            ])
-
-            edges.append({
-                "~from": input_part.id,
-                "~to": output_part.id,
-                "~label": "MATCHED",
-                "match_type": match_type
-            })
-
-        # ---------------- Bulk loader & S3 backup ----------------
-        vertices_df = pd.DataFrame(vertices).drop_duplicates("~id")
-        edges_df = pd.DataFrame(edges)
-
-        vertices_csv = tempfile.NamedTemporaryFile(delete=False, suffix=".csv").name
-        edges_csv = tempfile.NamedTemporaryFile(delete=False, suffix=".csv").name
-        vertices_df.to_csv(vertices_csv, index=False)
-        edges_df.to_csv(edges_csv, index=False)
-
-        if self.backup_to_s3:
-            await upload_file_to_s3_async(vertices_csv, f"neptune_bulk/{os.path.basename(vertices_csv)}")
-            await upload_file_to_s3_async(edges_csv, f"neptune_bulk/{os.path.basename(edges_csv)}")
-
-        bulk_response = await trigger_bulk_load(f"s3://{self.s3_bucket}/neptune_bulk/", mode="NEW")
-        bulk_load_id = bulk_response.get("payload", {}).get("loadId") if isinstance(bulk_response, dict) else None
+        # Gremlin mode already wrote every row; only bulk mode hands the data to the loader
+        # (a delta upload without changes has nothing to load)
+        bulk_load_id = bulk_load_status = None
+        if not write_through_gremlin and shards:
+            bulk_response = await trigger_bulk_load(f"s3://{self.s3_bucket}/{s3_prefix}", mode="NEW")
+            bulk_load_id = bulk_response.get("payload", {}).get("loadId") if isinstance(bulk_response, dict) else None
+            progress.bulk_load_id = bulk_load_id
+            # Invalidated when the load starts, so the in-memory index stops answering for these
+            # parts, and again once it is final, dropping anything cached from a half-loaded graph
+            await asyncio.to_thread(self.part_usecase.invalidate_parts, part_numbers)
+            if bulk_load_id:
+                try:
+                    bulk_load_status = await self._wait_for_bulk_load(bulk_load_id)
+                finally:
+                    await asyncio.to_thread(self.part_usecase.invalidate_parts, part_numbers)
+                if bulk_load_status != "LOAD_COMPLETED":
+                    raise RuntimeError(f"Bulk load {bulk_load_id} ended with status {bulk_load_status}")
 
         return {
             "message": "File processed successfully",
-            "vertices_created": len(vertices_df),
-            "edges_created": len(edges_df),
-            "bulk_load_id": bulk_load_id
+            "format": format,
+            "ingest_mode": ingest_mode,
+            "vertices_created": len(seen_vertex_ids),
+            "edges_created": edges_written,
+            "edges_updated": edges_updated,
+            "bulk_load_id": bulk_load_id,
+            "bulk_load_status": bulk_load_status,
+            "diff": diff.counts if diff else None
         }
@@ -1,6 +1,11 @@
+from typing import List, Optional
 from pydantic import BaseModel
 
 class MatchDTO(BaseModel):
     source: str
     target: str
     match_type: str
+    score: Optional[float] = None
+
+class MatchSearchBatchDTO(BaseModel):
+    part_numbers: List[str]
@@ -12,3 +12,13 @@ class PartNumberDTO(BaseModel):
     note1: str = ""
     note2: str = ""
     note3: str = ""
+
+class PartProfileDTO(BaseModel):
+    spec1: str = ""
+    spec2: str = ""
+    spec3: str = ""
+    spec4: str = ""
+    spec5: str = ""
+    note1: str = ""
+    note2: str = ""
+    note3: str = ""
@@ -1,8 +1,18 @@
+def match_edge_id(source_id: str, target_id: str) -> str:
+    """Deterministic MATCHED edge id from its endpoint vertex ids (bulk-loader ~id)"""
+    return f"match-{source_id}-{target_id}"
+
 class Match:
-    def __init__(self, source: str, target: str, match_type: str):
+    __slots__ = ("source", "target", "match_type", "score")
+
+    def __init__(self, source: str, target: str, match_type: str, score: float = None):
         self.source = source
         self.target = target
         self.match_type = match_type
+        self.score = score
+
+    def to_dict(self) -> dict:
+        return {"source": self.source, "target": self.target, "match_type": self.match_type, "score": self.score}
 
     def in_part(self, part_number: str):
         """Return the other part in the match given one part_number"""
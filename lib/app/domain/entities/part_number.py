@@ -1,4 +1,20 @@
+import hashlib
+
+# Attribute layout shared by uploads, match rules and the bulk-loader CSVs
+SPEC_FIELDS = tuple(f"spec{i}" for i in range(1, 6))
+NOTE_FIELDS = tuple(f"note{i}" for i in range(1, 4))
+# Every attribute of a PartNumber, in the order it is serialized
+PART_FIELDS = ("id", "part_number") + SPEC_FIELDS + NOTE_FIELDS
+
+def part_vertex_id(part_number: str) -> str:
+    """Deterministic vertex id: part_number + short hash of part_number"""
+    part_number = str(part_number)
+    return f"{part_number}_{hashlib.md5(part_number.encode()).hexdigest()[:8]}"
+
 class PartNumber:
+    # Slotted: the in-memory indexes hold one of these per catalog part
+    __slots__ = PART_FIELDS
+
     def __init__(self, part_number: str, spec1: str, spec2: str, spec3: str, spec4: str, spec5: str,
                  note1: str = "", note2: str = "", note3: str = "", id: str = None):
         self.id = id
@@ -11,3 +27,8 @@ class PartNumber:
         self.note1 = note1
         self.note2 = note2
         self.note3 = note3
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "part_number": self.part_number,
+                "spec1": self.spec1, "spec2": self.spec2, "spec3": self.spec3, "spec4": self.spec4, "spec5": self.spec5,
+                "note1": self.note1, "note2": self.note2, "note3": self.note3}
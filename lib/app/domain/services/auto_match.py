@@ -0,0 +1,73 @@
+# lib/app/domain/services/auto_match.py
+
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+import numpy as np
+from lib.app.domain.entities.part_number import PartNumber, SPEC_FIELDS, NOTE_FIELDS
+from lib.app.domain.services.match_logic import MatchLogic
+from lib.app.domain.services.similarity import normalize_value
+
+# A blocking key is (spec field index, normalized value); parts sharing one are candidates
+BlockKey = Tuple[int, str]
+# Worker row: (index into the caller's part list, spec values, note values)
+BlockRow = Tuple[int, Tuple[str, ...], Tuple[str, ...]]
+
+def blocking_keys(part: PartNumber) -> List[BlockKey]:
+    """Non-blank spec values of part, normalized, tagged with their field index."""
+    keys = []
+    for f, field in enumerate(SPEC_FIELDS):
+        value = normalize_value(getattr(part, field))
+        if value:
+            keys.append((f, value))
+    return keys
+
+def build_blocks(parts: Sequence[PartNumber], max_block_size: int) -> Tuple[Dict[BlockKey, List[int]], FrozenSet[BlockKey]]:
+    """
+    Buckets part indexes by shared spec value.
+    Returns (blocks with at least two parts, keys skipped because more than max_block_size
+    parts share them - a value that common says little and would cost O(n^2) comparisons).
+    """
+    blocks = defaultdict(list)
+    for i, part in enumerate(parts):
+        for key in blocking_keys(part):
+            blocks[key].append(i)
+    oversized = frozenset(k for k, members in blocks.items() if len(members) > max_block_size)
+    return {k: members for k, members in blocks.items() if 1 < len(members) <= max_block_size}, oversized
+
+def block_row(index: int, part: PartNumber) -> BlockRow:
+    return index, tuple(getattr(part, f) for f in SPEC_FIELDS), tuple(getattr(part, f) for f in NOTE_FIELDS)
+
+def match_block(key: BlockKey, rows: List[BlockRow], oversized: FrozenSet[BlockKey], keep: FrozenSet[str],
+                min_score: float = 0.0) -> List[Tuple[int, int, str, float]]:
+    """
+    Runs MatchLogic over every pair in one block, vectorized.
+    A pair sharing several spec values lands in several blocks; it is only reported by the
+    block of its lowest shared key, so results across blocks never repeat.
+    Returns (index, index, match_type, score) for pairs whose match type is in keep and
+    whose score is at least min_score.
+    """
+    indexes = np.array([r[0] for r in rows])
+    specs = np.array([r[1] for r in rows], dtype=object)
+    notes = np.array([r[2] for r in rows], dtype=object)
+    i, j = np.triu_indices(len(rows), k=1)
+
+    owned = np.ones(len(i), dtype=bool)
+    field = key[0]
+    if field:
+        normalized = np.array([[normalize_value(v) for v in r[1][:field]] for r in rows], dtype=object)
+        eligible = np.array([[bool(v) and (f, v) not in oversized for f, v in enumerate(r)] for r in normalized], dtype=bool)
+        shared_lower = (normalized[i] == normalized[j]) & eligible[i]
+        owned = ~shared_lower.any(axis=1)
+
+    i, j = i[owned], j[owned]
+    scores, match_types = MatchLogic().score_match_batch(specs[i], notes[i], specs[j], notes[j])
+    kept = np.isin(match_types, list(keep)) & (scores >= min_score)
+    return list(zip(indexes[i[kept]].tolist(), indexes[j[kept]].tolist(), match_types[kept].tolist(), scores[kept].tolist()))
+
+def match_blocks(tasks: List[Tuple[BlockKey, List[BlockRow]]], oversized: FrozenSet[BlockKey], keep: FrozenSet[str],
+                 min_score: float = 0.0) -> List[Tuple[int, int, str, float]]:
+    """Process pool entry point: several small blocks per task to amortize pickling."""
+    results = []
+    for key, rows in tasks:
+        results.extend(match_block(key, rows, oversized, keep, min_score))
+    return results
@@ -0,0 +1,26 @@
+# lib/app/domain/services/fingerprint.py
+
+import hashlib
+from typing import Iterable
+from lib.app.domain.entities.part_number import PartNumber, SPEC_FIELDS, NOTE_FIELDS
+from lib.app.domain.entities.match import Match
+
+# Content hashes stored with the data ("fingerprint" vertex/edge property), so a re-upload
+# can tell unchanged rows from changed ones without comparing every field
+FINGERPRINT_PROPERTY = "fingerprint"
+
+def _digest(values: Iterable[str]) -> str:
+    # Unit separator between fields: ("ab", "") and ("a", "b") must not collide
+    return hashlib.blake2b("\x1f".join(values).encode(), digest_size=8).hexdigest()
+
+def part_fingerprint(part: PartNumber) -> str:
+    """Hash of spec1..spec5 and note1..note3."""
+    return _digest("" if getattr(part, f) is None else str(getattr(part, f)) for f in SPEC_FIELDS + NOTE_FIELDS)
+
+def match_fingerprint(match: Match) -> str:
+    """
+    Hash of match_type and score. The score is rounded to 4 places: the in-memory index keeps
+    float32 scores, and a rule score read back from storage must hash the same as the original.
+    """
+    score = "" if match.score is None else f"{float(match.score):.4f}"
+    return _digest((match.match_type or "", score))
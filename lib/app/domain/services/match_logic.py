@@ -1,10 +1,17 @@
 # lib/app/domain/services/match_logic.py
 
+from typing import Tuple
+from lib.app.domain.services.match_rules import MatchRules, get_match_rules
+
 class MatchLogic:
     """
-    Determines the match type between two parts based on specs and notes.
+    Determines the match type (and score) between two parts based on specs and notes,
+    using the configured weighted match rules (see match_rules.py).
     """
 
+    def __init__(self, rules: MatchRules = None):
+        self.rules = rules or get_match_rules()
+
     @staticmethod
     def determine_match(
         input_specs: dict,
@@ -15,23 +22,31 @@ class MatchLogic:
         """
         Returns match type: "Perfect", "Partial", or "No Match"
         """
+        return get_match_rules().evaluate({**input_specs, **input_notes}, {**output_specs, **output_notes})[1]
 
-        # Perfect match: all specs AND notes match exactly
-        if input_specs == output_specs and input_notes == output_notes:
-            return "Perfect"
+    def score_match(self, input_specs: dict, input_notes: dict, output_specs: dict, output_notes: dict) -> Tuple[float, str]:
+        """
+        Returns (score in [0, 1], match type) for one pair.
+        """
+        return self.rules.evaluate({**input_specs, **input_notes}, {**output_specs, **output_notes})
 
-        # Partial match: at least one spec or one note matches
-        spec_match = any(
-            input_specs.get(f"spec{i}") == output_specs.get(f"spec{i}")
-            for i in range(1, 6)
-        )
-        note_match = any(
-            input_notes.get(f"note{i}") == output_notes.get(f"note{i}")
-            for i in range(1, 4)
-        )
+    @staticmethod
+    def determine_match_batch(input_specs, input_notes, output_specs, output_notes):
+        """
+        Vectorized determine_match over n pairs at once.
+        Specs are (n, 5) and notes (n, 3) array-likes (NumPy arrays or DataFrames, columns
+        in spec1..spec5 / note1..note3 order). Returns an (n,) object array of match types,
+        identical to calling determine_match row by row.
+        """
+        return MatchLogic(get_match_rules()).score_match_batch(input_specs, input_notes, output_specs, output_notes)[1]
 
-        if spec_match or note_match:
-            return "Partial"
+    def score_match_batch(self, input_specs, input_notes, output_specs, output_notes):
+        """
+        Vectorized score_match: returns ((n,) scores, (n,) match types).
+        """
+        import numpy as np
 
-        # No match: nothing matches
-        return "No Match"
+        return self.rules.evaluate_batch(
+            np.hstack([np.asarray(input_specs, dtype=object).reshape(-1, 5), np.asarray(input_notes, dtype=object).reshape(-1, 3)]),
+            np.hstack([np.asarray(output_specs, dtype=object).reshape(-1, 5), np.asarray(output_notes, dtype=object).reshape(-1, 3)])
+        )
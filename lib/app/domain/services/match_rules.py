@@ -0,0 +1,170 @@
+# lib/app/domain/services/match_rules.py
+
+import functools
+import json
+import os
+import re
+from typing import Dict, Optional, Sequence, Tuple
+from lib.app.domain.entities.part_number import SPEC_FIELDS, NOTE_FIELDS
+
+# Fields the rules compare, in the column order batch evaluation expects
+RULE_FIELDS = SPEC_FIELDS + NOTE_FIELDS
+
+# Tiers from best to worst; a pair gets the first tier whose threshold its score reaches.
+# A score of 0 (nothing in common) is always "No Match".
+MATCH_TIERS = ("Perfect", "Partial")
+NO_MATCH = "No Match"
+
+# Scores are stored on MATCHED edges rounded to this many decimals
+SCORE_DECIMALS = 6
+
+_WHITESPACE = re.compile(r"\s+")
+_QUANTITY = re.compile(r"^([-+]?(?:\d+\.?\d*|\.\d+))\s*([pnuµmkKMG]?)\s*([^\d\s]*)$")
+_SI_PREFIXES = {"": 1.0, "p": 1e-12, "n": 1e-9, "u": 1e-6, "µ": 1e-6, "m": 1e-3, "k": 1e3, "K": 1e3, "M": 1e6, "G": 1e9}
+
+def _normalize_whitespace(value: str) -> str:
+    return _WHITESPACE.sub(" ", value).strip()
+
+def _normalize_case(value: str) -> str:
+    return value.lower()
+
+def _normalize_unit(value: str) -> str:
+    """
+    Canonical quantity: "10k", "10 K", "10000" and "10,000" all become "10000";
+    "4.7kohm" becomes "4700ohm". A lone trailing letter is read as an SI prefix (10k, 100n).
+    Values that are not a number + optional prefix/unit are returned unchanged.
+    """
+    m = _QUANTITY.match(value.replace(",", ""))
+    if not m:
+        return value
+    number, prefix, unit = m.groups()
+    return f"{float(number) * _SI_PREFIXES[prefix]:.12g}{unit}"
+
+# Normalizers always run in this order, whatever order the config lists them in,
+# so case folding never erases an SI prefix (m vs M) before unit parsing sees it
+NORMALIZERS = {
+    "whitespace": _normalize_whitespace,
+    "unit": _normalize_unit,
+    "case": _normalize_case,
+}
+
+DEFAULT_RULES = {
+    "fields": {f: {"weight": 1.0, "normalizers": []} for f in RULE_FIELDS},
+    "tiers": {"Perfect": 1.0, "Partial": 0.0}
+}
+
+class MatchRules:
+    """
+    Weighted match rules, compiled once into a per-pair and a vectorized evaluator.
+    score = sum of the weights of fields whose normalized values are equal / sum of all weights.
+    The default rules (every field weight 1, no normalizers, Perfect at 1.0, Partial above 0)
+    reproduce the original "all equal / any equal / nothing equal" classification.
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        config = config or DEFAULT_RULES
+        fields = config.get("fields", DEFAULT_RULES["fields"])
+        unknown = set(fields) - set(RULE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown match rule fields {sorted(unknown)}, expected {RULE_FIELDS}")
+
+        self.fields = [f for f in RULE_FIELDS if fields.get(f, {}).get("weight", 0) > 0]
+        if not self.fields:
+            raise ValueError("Match rules need at least one field with a positive weight")
+        self.columns = [RULE_FIELDS.index(f) for f in self.fields]
+        self.weights = tuple(float(fields[f]["weight"]) for f in self.fields)
+        self.total_weight = sum(self.weights)
+        self.normalizers = [self._compile_normalizer(fields[f].get("normalizers", [])) for f in self.fields]
+
+        tiers = config.get("tiers", DEFAULT_RULES["tiers"])
+        unknown = set(tiers) - set(MATCH_TIERS)
+        if unknown:
+            raise ValueError(f"Unknown match tiers {sorted(unknown)}, expected {MATCH_TIERS}")
+        self.tiers = [(t, float(tiers[t])) for t in MATCH_TIERS if t in tiers]
+
+    @staticmethod
+    def _compile_normalizer(names: Sequence[str]):
+        unknown = set(names) - set(NORMALIZERS)
+        if unknown:
+            raise ValueError(f"Unknown normalizers {sorted(unknown)}, expected {list(NORMALIZERS)}")
+        if not names:
+            return None
+        steps = [fn for name, fn in NORMALIZERS.items() if name in names]
+
+        # Catalog values repeat a lot; normalize each distinct value once
+        @functools.lru_cache(maxsize=65536)
+        def normalize(value):
+            value = "" if value is None else str(value)
+            for step in steps:
+                value = step(value)
+            return value
+        return normalize
+
+    def _tier(self, score: float) -> str:
+        if score > 0:
+            for name, threshold in self.tiers:
+                if score >= threshold:
+                    return name
+        return NO_MATCH
+
+    # ---------- SINGLE PAIR ----------
+    def evaluate(self, input_values: Dict[str, str], output_values: Dict[str, str]) -> Tuple[float, str]:
+        """Scores one pair given {field: value} dicts. Returns (score, match type)."""
+        matched = 0.0
+        for field, weight, normalize in zip(self.fields, self.weights, self.normalizers):
+            a, b = input_values.get(field), output_values.get(field)
+            if normalize is not None:
+                a, b = normalize(a), normalize(b)
+            if a == b:
+                matched += weight
+        score = round(matched / self.total_weight, SCORE_DECIMALS)
+        return score, self._tier(score)
+
+    # ---------- BATCH ----------
+    def evaluate_batch(self, input_values, output_values):
+        """
+        Scores n pairs at once. Values are (n, 8) array-likes with columns in RULE_FIELDS order.
+        Returns ((n,) float scores, (n,) object array of match types), identical to evaluate().
+        """
+        # NumPy is only needed by batch callers (uploads, auto-matching); keep it off API startup
+        import numpy as np
+
+        input_values = np.asarray(input_values, dtype=object).reshape(-1, len(RULE_FIELDS))
+        output_values = np.asarray(output_values, dtype=object).reshape(-1, len(RULE_FIELDS))
+        equal = np.empty((len(input_values), len(self.fields)), dtype=bool)
+        for k, (column, normalize) in enumerate(zip(self.columns, self.normalizers)):
+            a, b = input_values[:, column], output_values[:, column]
+            if normalize is not None:
+                a = np.array([normalize(v) for v in a], dtype=object)
+                b = np.array([normalize(v) for v in b], dtype=object)
+            equal[:, k] = a == b
+
+        # Same summation order as evaluate(), so both paths agree to the last bit
+        matched = np.zeros(len(equal))
+        for k, weight in enumerate(self.weights):
+            matched += np.where(equal[:, k], weight, 0.0)
+        scores = np.round(matched / self.total_weight, SCORE_DECIMALS)
+
+        conditions = [scores >= threshold for _, threshold in self.tiers]
+        types = np.select(conditions, [name for name, _ in self.tiers], default=NO_MATCH).astype(object)
+        types[scores <= 0] = NO_MATCH
+        return scores, types
+
+def load_match_rules(path: Optional[str] = None) -> MatchRules:
+    """
+    Rules from a JSON file (MATCH_RULES_PATH), or the defaults when none is configured.
+    Same shape as DEFAULT_RULES, e.g.
+    {"fields": {"spec1": {"weight": 3, "normalizers": ["whitespace", "unit", "case"]}, ...},
+     "tiers": {"Perfect": 0.95, "Partial": 0.4}}
+    Fields left out get weight 0 (ignored).
+    """
+    path = path or os.getenv("MATCH_RULES_PATH")
+    if not path:
+        return MatchRules()
+    with open(path) as f:
+        return MatchRules(json.load(f))
+
+@functools.lru_cache(maxsize=1)
+def get_match_rules() -> MatchRules:
+    """Process-wide compiled rules, loaded on first use."""
+    return load_match_rules()
@@ -0,0 +1,43 @@
+# lib/app/domain/services/replacement_search.py
+
+from typing import List, Sequence, Tuple
+
+# Match types from best to worst, with the quality each contributes to a path
+MATCH_TYPE_QUALITY = {"Perfect": 1.0, "Partial": 0.5, "No Match": 0.0}
+
+def match_types_at_least(min_match_type: str) -> List[str]:
+    """Match types at least as good as min_match_type, e.g. "Partial" -> ["Perfect", "Partial"]."""
+    if min_match_type not in MATCH_TYPE_QUALITY:
+        raise ValueError(f"Unknown match type '{min_match_type}'")
+    floor = MATCH_TYPE_QUALITY[min_match_type]
+    return [t for t, q in MATCH_TYPE_QUALITY.items() if q >= floor]
+
+def path_quality(match_types: Sequence[str]) -> float:
+    """Product of edge qualities: a chain is only as good as all of its links."""
+    quality = 1.0
+    for match_type in match_types:
+        quality *= MATCH_TYPE_QUALITY.get(match_type, 0.0)
+    return quality
+
+def rank_paths(start: str, paths: List[Tuple[List[str], List[str]]]) -> List[dict]:
+    """
+    Keeps the best path to every reachable part and ranks them by path quality, then by
+    depth. paths are (part_numbers, match_types) with part_numbers[0] == start.
+    Returns [{"part_number", "path", "match_types", "depth", "quality"}, ...].
+    """
+    best = {}
+    for part_numbers, match_types in paths:
+        target = part_numbers[-1]
+        if target == start:
+            continue
+        candidate = {
+            "part_number": target,
+            "path": list(part_numbers),
+            "match_types": list(match_types),
+            "depth": len(match_types),
+            "quality": path_quality(match_types)
+        }
+        current = best.get(target)
+        if current is None or (candidate["quality"], -candidate["depth"]) > (current["quality"], -current["depth"]):
+            best[target] = candidate
+    return sorted(best.values(), key=lambda r: (-r["quality"], r["depth"], r["part_number"]))
@@ -0,0 +1,37 @@
+# lib/app/domain/services/similarity.py
+
+import re
+from typing import Dict, List, Tuple
+from lib.app.domain.entities.part_number import PartNumber, SPEC_FIELDS, NOTE_FIELDS
+
+# Fields compared by similarity search, and how much an equal value in each is worth
+SIMILARITY_FIELDS = SPEC_FIELDS + NOTE_FIELDS
+FIELD_WEIGHTS = {**{f: 1.0 for f in SPEC_FIELDS}, **{f: 0.5 for f in NOTE_FIELDS}}
+
+# Normalized copies of the similarity fields stored on every vertex ("spec1_key", ...), so
+# the graph's exact-match property lookups find candidates regardless of case and spacing
+SEARCH_KEY_PROPERTIES = {f: f"{f}_key" for f in SIMILARITY_FIELDS}
+
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_value(value) -> str:
+    """Case- and whitespace-insensitive form of a spec/note value; blanks become ""."""
+    if value is None:
+        return ""
+    return _WHITESPACE.sub(" ", str(value)).strip().lower()
+
+def normalize_profile(profile: Dict[str, str]) -> Dict[str, str]:
+    """Keeps only the non-blank similarity fields of profile, normalized."""
+    normalized = {f: normalize_value(profile.get(f)) for f in SIMILARITY_FIELDS}
+    return {f: v for f, v in normalized.items() if v}
+
+def score_part(profile: Dict[str, str], part: PartNumber) -> Tuple[float, List[str]]:
+    """
+    Weighted share of the (normalized) profile fields that part has equal values for.
+    Returns (score in [0, 1], matched field names).
+    """
+    total = sum(FIELD_WEIGHTS[f] for f in profile)
+    if not total:
+        return 0.0, []
+    matched = [f for f, v in profile.items() if normalize_value(getattr(part, f)) == v]
+    return sum(FIELD_WEIGHTS[f] for f in matched) / total, matched
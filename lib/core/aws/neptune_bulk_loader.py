@@ -1,10 +1,62 @@
+import csv
+import gzip
+import io
 import os
-import httpx
+from typing import List
+
+# Compressed size at which a staging CSV rolls over to a new shard
+BULK_SHARD_MAX_BYTES = int(os.getenv("BULK_SHARD_MAX_BYTES", 64 * 1024 * 1024))
+
+class BulkCsvShardWriter:
+    """
+    Writes bulk-loader CSV rows into gzip-compressed shards ({name}-00000.csv.gz, ...),
+    starting a new shard (with its own header row) once the current one reaches
+    max_bytes compressed. The Neptune loader reads gzip CSVs directly.
+    """
+
+    def __init__(self, directory: str, name: str, fieldnames: List[str], max_bytes: int = BULK_SHARD_MAX_BYTES):
+        self.directory = directory
+        self.name = name
+        self.fieldnames = fieldnames
+        self.max_bytes = max_bytes
+        self.paths = []
+        self.rows = 0
+        self._raw = None
+        self._text = None
+        self._writer = None
+
+    def _open_shard(self):
+        self._close_shard()
+        path = os.path.join(self.directory, f"{self.name}-{len(self.paths):05d}.csv.gz")
+        self._raw = open(path, "wb")
+        self._text = io.TextIOWrapper(gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6), newline="")
+        self._writer = csv.DictWriter(self._text, fieldnames=self.fieldnames)
+        self._writer.writeheader()
+        self.paths.append(path)
+
+    def _close_shard(self):
+        if self._text is not None:
+            self._text.close()
+            self._raw.close()
+            self._text = self._raw = self._writer = None
+
+    def writerow(self, row: dict):
+        if self._writer is None or self._raw.tell() >= self.max_bytes:
+            self._open_shard()
+        self._writer.writerow(row)
+        self.rows += 1
+
+    def close(self) -> List[str]:
+        """Closes the current shard and returns every shard path written."""
+        self._close_shard()
+        return self.paths
 
 async def trigger_bulk_load(s3_input_uri: str, mode: str = "NEW") -> dict:
     """
     Async Neptune Bulk Loader trigger
     """
+    import httpx
+
     neptune_endpoint = os.getenv("NEPTUNE_ENDPOINT")
     iam_role_arn = os.getenv("NEPTUNE_IAM_ROLE_ARN")
     region = os.getenv("AWS_REGION")
@@ -28,3 +80,20 @@ async def trigger_bulk_load(s3_input_uri: str, mode: str = "NEW") -> dict:
         raise Exception(f"Bulk load failed: {response.text}")
 
     return response.json()
+
+async def get_bulk_load_status(load_id: str) -> dict:
+    """
+    Async Neptune Bulk Loader status (GET /loader/{loadId})
+    """
+    import httpx
+
+    neptune_endpoint = os.getenv("NEPTUNE_ENDPOINT")
+    loader_url = f"https://{neptune_endpoint}:8182/loader/{load_id}"
+
+    async with httpx.AsyncClient(verify=False) as client:
+        response = await client.get(loader_url, params={"details": "true", "errors": "true"})
+
+    if response.status_code != 200:
+        raise Exception(f"Bulk load status failed: {response.text}")
+
+    return response.json()
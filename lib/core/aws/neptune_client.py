@@ -1,8 +1,14 @@
-from gremlin_python.structure.graph import Graph
+from gremlin_python.process.anonymous_traversal import traversal
 from gremlin_python.driver.driver_remote_connection import DriverRemoteConnection
+from contextlib import contextmanager, asynccontextmanager
+import asyncio
 import os
+import queue
+import threading
+import time
+from lib.core.metrics import instrument_round_trips, operation
 
-def get_neptune_connection():
+def get_neptune_connection(pool_size: int = None):
     """
     Returns sync Gremlin traversal source (g) and closable connection for Neptune.
     """
@@ -10,8 +16,157 @@ def get_neptune_connection():
     port = os.getenv("NEPTUNE_PORT", 8182)
     url = f"wss://{endpoint}:{port}/gremlin"
 
-    graph = Graph()
-    remote_conn = DriverRemoteConnection(url, 'g')
-    g = graph.traversal().withRemote(remote_conn)
+    remote_conn = DriverRemoteConnection(url, 'g', pool_size=pool_size)
+    # Every traversal is one synchronous submit(); time it as a Gremlin round trip
+    remote_conn.submit = instrument_round_trips(remote_conn.submit)
+    g = traversal().with_remote(remote_conn)
 
     return g, remote_conn
+
+
+class PooledConnection:
+    """
+    One pooled Gremlin connection: traversal source, remote connection and last use time.
+    """
+    def __init__(self, g, connection):
+        self.g = g
+        self.connection = connection
+        self.last_used = time.monotonic()
+
+
+class NeptuneConnectionPool:
+    """
+    Fixed-size pool of Gremlin WebSocket connections.
+    Connections are opened lazily and checked out per request. A connection that sat idle
+    longer than the health check interval, or whose last user raised, is pinged before it
+    is handed out again and reopened if the WebSocket dropped.
+    """
+
+    def __init__(self, size: int = None, health_check_interval: float = None, checkout_timeout: float = None):
+        self.size = size or int(os.getenv("NEPTUNE_POOL_SIZE", 8))
+        self.health_check_interval = health_check_interval if health_check_interval is not None \
+            else float(os.getenv("NEPTUNE_POOL_HEALTH_CHECK_SECONDS", 30))
+        self.checkout_timeout = checkout_timeout if checkout_timeout is not None \
+            else float(os.getenv("NEPTUNE_POOL_CHECKOUT_TIMEOUT", 30))
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._open = set()
+        self._closed = False
+
+    # ---------- CONNECTION LIFECYCLE ----------
+    def _connect(self) -> PooledConnection:
+        g, connection = get_neptune_connection(pool_size=1)
+        conn = PooledConnection(g, connection)
+        with self._lock:
+            self._open.add(conn)
+        return conn
+
+    def _discard(self, conn: PooledConnection):
+        with self._lock:
+            self._open.discard(conn)
+        try:
+            conn.connection.close()
+        except Exception:
+            pass
+
+    def _is_healthy(self, conn: PooledConnection) -> bool:
+        if conn.connection.is_closed():
+            return False
+        if time.monotonic() - conn.last_used < self.health_check_interval:
+            return True
+        try:
+            with operation("pool_health_check"):
+                conn.g.inject(1).next()
+            return True
+        except Exception:
+            return False
+
+    # ---------- CHECKOUT / CHECKIN ----------
+    def acquire(self, timeout: float = None) -> PooledConnection:
+        if self._closed:
+            raise RuntimeError("Neptune connection pool is closed")
+        if not self._slots.acquire(timeout=timeout if timeout is not None else self.checkout_timeout):
+            raise TimeoutError(f"No Neptune connection available (pool size {self.size})")
+        try:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+                if self._is_healthy(conn):
+                    return conn
+                self._discard(conn)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn: PooledConnection, failed: bool = False):
+        # A failed checkout forces a health check on the next acquire
+        conn.last_used = float("-inf") if failed else time.monotonic()
+        if self._closed:
+            self._discard(conn)
+        else:
+            self._idle.put(conn)
+        self._slots.release()
+
+    @contextmanager
+    def checkout(self, timeout: float = None):
+        conn = self.acquire(timeout)
+        failed = False
+        try:
+            yield conn
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.release(conn, failed)
+
+    @asynccontextmanager
+    async def acheckout(self, timeout: float = None):
+        """Async checkout: waiting for a free connection does not block the event loop."""
+        conn = await asyncio.to_thread(self.acquire, timeout)
+        failed = False
+        try:
+            yield conn
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.release(conn, failed)
+
+    # ---------- WARM-UP / PROBES ----------
+    def warm(self, count: int):
+        """Opens up to count connections ahead of the first requests; failures are left to acquire()."""
+        conns = []
+        try:
+            for _ in range(min(count, self.size)):
+                conns.append(self.acquire())
+        finally:
+            for conn in conns:
+                self.release(conn)
+
+    def ping(self, timeout: float = None) -> bool:
+        """True if a pooled connection can run a trivial traversal against Neptune."""
+        try:
+            with self.checkout(timeout) as conn:
+                with operation("readiness_probe"):
+                    conn.g.inject(1).next()
+            return True
+        except Exception:
+            return False
+
+    # ---------- STATS / SHUTDOWN ----------
+    def stats(self) -> dict:
+        with self._lock:
+            open_count = len(self._open)
+        idle = self._idle.qsize()
+        return {"size": self.size, "open": open_count, "idle": idle, "in_use": open_count - idle}
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
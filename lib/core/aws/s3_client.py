@@ -1,25 +1,53 @@
 import os
-import boto3
 import asyncio
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import List, Tuple
 
-# Initialize sync S3 client
-s3_client = boto3.client(
-    "s3",
-    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-    region_name=os.getenv("AWS_REGION")
-)
+# boto3 is imported on first use: it is the slowest import in the app and only uploads need it
+
+S3_UPLOAD_CONCURRENCY = int(os.getenv("S3_UPLOAD_CONCURRENCY", 4))
+
+# Dedicated bounded pool, so staging uploads never starve the default executor
+_upload_executor = ThreadPoolExecutor(max_workers=S3_UPLOAD_CONCURRENCY, thread_name_prefix="s3-upload")
+
+@lru_cache(maxsize=1)
+def get_transfer_config():
+    """Multipart settings for each object, and how many parts upload at once"""
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=int(os.getenv("S3_MULTIPART_THRESHOLD", 8 * 1024 * 1024)),
+        multipart_chunksize=int(os.getenv("S3_MULTIPART_CHUNKSIZE", 16 * 1024 * 1024)),
+        max_concurrency=int(os.getenv("S3_MULTIPART_CONCURRENCY", 8)),
+        use_threads=True
+    )
+
+@lru_cache(maxsize=1)
+def get_s3_client():
+    """Sync S3 client, created on first use (so a local stand-in such as moto can be active first)"""
+    import boto3
+
+    return boto3.client(
+        "s3",
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        region_name=os.getenv("AWS_REGION")
+    )
 
 def upload_file_to_s3(local_path: str, s3_key: str):
     """Blocking sync upload"""
     bucket_name = os.getenv("S3_BUCKET_NAME")
     if not bucket_name:
         raise ValueError("S3_BUCKET_NAME not set in environment")
-    s3_client.upload_file(local_path, bucket_name, s3_key)
+    get_s3_client().upload_file(local_path, bucket_name, s3_key, Config=get_transfer_config())
     print(f"Uploaded {s3_key} to bucket {bucket_name}")
 
 async def upload_file_to_s3_async(local_path: str, s3_key: str):
     """Async wrapper for S3 upload"""
     loop = asyncio.get_running_loop()
-    await loop.run_in_executor(None, partial(upload_file_to_s3, local_path, s3_key))
+    await loop.run_in_executor(_upload_executor, partial(upload_file_to_s3, local_path, s3_key))
+
+async def upload_files_to_s3_async(files: List[Tuple[str, str]]):
+    """Uploads (local_path, s3_key) pairs concurrently, S3_UPLOAD_CONCURRENCY at a time"""
+    await asyncio.gather(*(upload_file_to_s3_async(local_path, s3_key) for local_path, s3_key in files))
@@ -0,0 +1,148 @@
+# lib/core/cache/cache_backend.py
+
+import os
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+class CacheBackend(ABC):
+    """
+    Key/value store behind the read-through repository cache.
+    get() returns None on a miss; every backend counts hits and misses.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any):
+        pass
+
+    @abstractmethod
+    def delete(self, *keys: str):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Process-local LRU cache with a per-entry TTL.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 300):
+        super().__init__()
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["size"] = len(self._entries)
+        stats["max_size"] = self.max_size
+        return stats
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared by every API worker, stored in Redis.
+    Takes any redis-py compatible client (a local stand-in such as fakeredis works in tests).
+    """
+
+    def __init__(self, client, ttl_seconds: float = 300, prefix: str = "partmatch:"):
+        super().__init__()
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            self.misses += 1
+            return None
+        try:
+            value = pickle.loads(raw)
+        except Exception:
+            # Written by an older release whose classes no longer unpickle (e.g. entities since slotted)
+            self.client.delete(self.prefix + key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any):
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=max(int(self.ttl_seconds), 1))
+
+    def delete(self, *keys: str):
+        if keys:
+            self.client.delete(*[self.prefix + key for key in keys])
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+def create_cache_backend() -> Optional[CacheBackend]:
+    """
+    Builds the backend selected by CACHE_BACKEND: "memory" (default), "redis" or "none".
+    """
+    kind = os.getenv("CACHE_BACKEND", "memory").lower()
+    ttl_seconds = float(os.getenv("CACHE_TTL_SECONDS", 300))
+    if kind == "none":
+        return None
+    if kind == "redis":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package")
+        client = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+        return RedisCacheBackend(client, ttl_seconds=ttl_seconds)
+    return InMemoryCacheBackend(max_size=int(os.getenv("CACHE_MAX_SIZE", 10000)), ttl_seconds=ttl_seconds)
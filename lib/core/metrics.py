@@ -0,0 +1,226 @@
+# lib/core/metrics.py
+
+import contextvars
+import functools
+import inspect
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# METRICS_ENABLED=false turns instrumentation off where it is installed (decorators return
+# the function untouched, the connection/HTTP hooks are not attached), so it costs nothing
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+# Latency buckets in seconds: sub-millisecond cache hits up to multi-second traversals
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Bulk loads run for minutes to hours
+BULK_LOAD_BUCKETS = (10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0, 7200.0)
+
+# Repository method currently running on this thread/task; labels the Gremlin round trips it makes
+_operation = contextvars.ContextVar("metrics_operation", default="other")
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def _labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _number(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues, amount: float = 1.0):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for values, total in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labelnames, values)} {_number(total)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets) + (float("inf"),)
+        # labelvalues -> [per-bucket counts..., sum, count]
+        self._series: Dict[Tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues):
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0] * len(self.buckets) + [0.0, 0]
+            series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, *labelvalues):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labelvalues)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((values, list(s)) for values, s in self._series.items())
+        for values, s in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets, s):
+                cumulative += count
+                le = 'le="%s"' % _number(bound)
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, values, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, values)} {_number(s[-2])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, values)} {s[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Holds counters/histograms plus gauge callbacks that are read at scrape time
+    (pool, cache and queue state live in their own objects; nothing is copied until scraped).
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._gauges: List[Tuple[str, str, Tuple[str, ...], Callable[[], Iterable[Tuple[Tuple, float]]]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...],
+              collect: Callable[[], Iterable[Tuple[Tuple, float]]]):
+        """collect() returns [(labelvalues, value), ...] when scraped."""
+        self._gauges.append((name, documentation, labelnames, collect))
+
+    def gauge_from_stats(self, prefix: str, documentation: str, stats: Callable[[], dict]):
+        """One gauge per numeric key of stats(), e.g. neptune_pool_in_use from pool.stats()."""
+        def collect(key):
+            value = stats().get(key)
+            return [((), float(value))] if isinstance(value, (int, float)) else []
+        for key, value in stats().items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self.gauge(f"{prefix}_{key}", f"{documentation} ({key})", (), functools.partial(collect, key))
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for name, documentation, labelnames, collect in self._gauges:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} gauge")
+            try:
+                samples = list(collect())
+            except Exception:
+                samples = []
+            for values, value in samples:
+                lines.append(f"{name}{_labels(labelnames, values)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# ---------- STANDARD METRICS ----------
+REPOSITORY_SECONDS = registry.histogram(
+    "repository_method_seconds", "Repository method latency by decorator layer", ("layer", "method"))
+GREMLIN_SECONDS = registry.histogram(
+    "gremlin_round_trip_seconds", "Gremlin request/response round trip to Neptune", ("operation",))
+GREMLIN_ERRORS = registry.counter(
+    "gremlin_errors_total", "Gremlin round trips that raised", ("operation",))
+HTTP_SECONDS = registry.histogram(
+    "http_request_seconds", "HTTP request latency by route template", ("method", "route", "status"))
+UPLOAD_ROWS = registry.counter(
+    "upload_rows_total", "Spreadsheet rows written by uploads; rate() gives rows/sec", ("ingest_mode",))
+UPLOAD_SECONDS = registry.histogram(
+    "upload_duration_seconds", "Wall time of finished uploads", ("ingest_mode", "status"),
+    buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0))
+BULK_LOAD_SECONDS = registry.histogram(
+    "bulk_load_duration_seconds", "Neptune bulk load duration (loader totalTimeSpent)", ("status",),
+    buckets=BULK_LOAD_BUCKETS)
+
+# ---------- INSTRUMENTATION HELPERS ----------
+@contextmanager
+def operation(name: str):
+    """Labels the Gremlin round trips made inside the block with name."""
+    token = _operation.set(name)
+    try:
+        yield
+    finally:
+        _operation.reset(token)
+
+def instrument_methods(cls):
+    """
+    Class decorator: times every public method of a repository class into
+    repository_method_seconds{layer=<class>, method=<name>} and labels the Gremlin round
+    trips made inside with the method name. A no-op when metrics are disabled.
+    """
+    if not METRICS_ENABLED:
+        return cls
+    for name, fn in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(fn):
+            continue
+        setattr(cls, name, _timed_method(fn, cls.__name__, name))
+    return cls
+
+def _timed_method(fn, layer: str, name: str):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        token = _operation.set(name)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            REPOSITORY_SECONDS.observe(time.perf_counter() - start, layer, name)
+            _operation.reset(token)
+    return wrapper
+
+def instrument_round_trips(submit):
+    """Wraps DriverRemoteConnection.submit (one synchronous request/response per traversal)."""
+    if not METRICS_ENABLED:
+        return submit
+
+    @functools.wraps(submit)
+    def wrapper(*args, **kwargs):
+        operation_name = _operation.get()
+        start = time.perf_counter()
+        try:
+            return submit(*args, **kwargs)
+        except Exception:
+            GREMLIN_ERRORS.inc(operation_name)
+            raise
+        finally:
+            GREMLIN_SECONDS.observe(time.perf_counter() - start, operation_name)
+    return wrapper
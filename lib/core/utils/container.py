@@ -1,25 +1,164 @@
 # lib/core/utils/container.py
 
+import asyncio
+import os
+from fastapi import Depends
 from lib.app.adapter.output.persistence.neptune.neptune_repository import NeptuneRepository
+from lib.app.adapter.output.persistence.neptune.async_neptune_repository import AsyncNeptuneRepository
+from lib.app.adapter.output.persistence.cache.cached_repository import CachedRepository
+from lib.app.adapter.output.persistence.memory.graph_index import GraphIndex
+from lib.app.adapter.output.persistence.memory.indexed_repository import IndexedRepository
+from lib.app.adapter.output.persistence.memory.spec_index import SpecIndex
+from lib.app.adapter.output.persistence.snapshot.catalog_snapshot import load_snapshot, write_snapshot
+from lib.app.application.services.repository_interface import RepositoryInterface
 from lib.app.application.use_cases.crud_part_usecase import CrudPartUseCase
 from lib.app.application.use_cases.match_part_usecase import MatchPartUseCase
-from lib.app.application.use_cases.upload_file_usecase import UploadFileUseCase
+from lib.app.application.use_cases.upload_file_usecase import UploadFileUseCase, UploadProgress
+from lib.core.aws.neptune_client import NeptuneConnectionPool
+from lib.core.cache.cache_backend import create_cache_backend
+from lib.core.utils.job_queue import Job, JobQueue
+from lib.core.logging import logger
+from lib.core.metrics import registry
 
-# Initialize repository (singleton)
-repository = NeptuneRepository()
+# Shared Gremlin connection pool (singleton); size via NEPTUNE_POOL_SIZE
+connection_pool = NeptuneConnectionPool()
+
+# Shared read-through cache (singleton); CACHE_BACKEND=memory|redis|none
+cache_backend = create_cache_backend()
+
+# Optional in-memory match graph (singleton); GRAPH_INDEX_ENABLED=true to serve match reads from RAM
+graph_index = GraphIndex() if os.getenv("GRAPH_INDEX_ENABLED", "false").lower() == "true" else None
+
+# Optional spec/note inverted index (singleton); SPEC_INDEX_ENABLED=true for indexed similarity search
+spec_index = SpecIndex() if os.getenv("SPEC_INDEX_ENABLED", "false").lower() == "true" else None
+GRAPH_INDEX_REFRESH_SECONDS = float(os.getenv("GRAPH_INDEX_REFRESH_SECONDS", 300))
+
+# Local catalog snapshot (unset = disabled): written after every index refresh from Neptune and
+# served at boot while the first Neptune scan runs, when younger than SNAPSHOT_MAX_AGE_SECONDS
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR")
+SNAPSHOT_MAX_AGE_SECONDS = float(os.getenv("SNAPSHOT_MAX_AGE_SECONDS", GRAPH_INDEX_REFRESH_SECONDS))
+
+# Connections opened in the background after startup, so the first requests skip the handshake
+NEPTUNE_POOL_WARM = int(os.getenv("NEPTUNE_POOL_WARM", 1))
+
+def _decorate(repository: RepositoryInterface) -> RepositoryInterface:
+    # Index outermost (answers without touching the cache), then cache, then Neptune
+    if cache_backend:
+        repository = CachedRepository(repository, cache_backend)
+    if graph_index or spec_index:
+        repository = IndexedRepository(repository, graph_index, spec_index)
+    return repository
+
+# Dependency provider for the repository: one pooled connection per request, behind cache/index
+def get_repository():
+    with connection_pool.checkout() as conn:
+        yield _decorate(NeptuneRepository(conn.g, conn.connection))
+
+# Dependency provider for async def handlers: awaitable, pooled, behind the same cache/index
+def get_async_repository():
+    return AsyncNeptuneRepository(connection_pool, _decorate)
 
 # Dependency provider for Parts CRUD
-def get_part_usecase():
+def get_part_usecase(repository: RepositoryInterface = Depends(get_repository)):
     return CrudPartUseCase(repository)
 
 # Dependency provider for Matches CRUD
-def get_match_usecase():
+def get_match_usecase(repository: RepositoryInterface = Depends(get_repository)):
     return MatchPartUseCase(repository)
 
-# Dependency provider for Upload Use Case
-def get_file_usecase(backup_to_s3: bool = True):
-    return UploadFileUseCase(
-        part_usecase=get_part_usecase(),
-        match_usecase=get_match_usecase(),
-        backup_to_s3=backup_to_s3
-    )
+# Background upload jobs: each attempt checks out its own pooled connection, since the
+# request that submitted the job (and its connection) is long gone by the time it runs
+async def run_upload_job(job: Job):
+    job.progress = UploadProgress()
+    async with connection_pool.acheckout() as conn:
+        repository = _decorate(NeptuneRepository(conn.g, conn.connection))
+        usecase = UploadFileUseCase(
+            part_usecase=CrudPartUseCase(repository),
+            match_usecase=MatchPartUseCase(repository),
+            backup_to_s3=job.payload["backup_to_s3"],
+            ingest_mode=job.payload["ingest_mode"],
+            # Jobs queued before delta uploads existed carry no flags
+            delta=job.payload.get("delta", False),
+            delete_missing=job.payload.get("delete_missing", False)
+        )
+        with open(job.payload["file_path"], "rb") as f:
+            result = await usecase.execute(f, job.payload["filename"], job.progress)
+    # The staged copy is only kept while the job may still be retried
+    os.remove(job.payload["file_path"])
+    return result
+
+def _discard_upload_file(job: Job):
+    if os.path.exists(job.payload["file_path"]):
+        os.remove(job.payload["file_path"])
+
+upload_queue = JobQueue(run_upload_job, on_evict=_discard_upload_file)
+
+# Dependency provider for the upload job queue
+def get_upload_queue():
+    return upload_queue
+
+# Dependency provider for the connection pool (health probes)
+def get_connection_pool():
+    return connection_pool
+
+# Scrape-time gauges for /metrics: read from the singletons above when scraped
+registry.gauge_from_stats("neptune_pool", "Neptune connection pool", connection_pool.stats)
+if cache_backend:
+    registry.gauge_from_stats("repository_cache", "Repository read-through cache", cache_backend.stats)
+registry.gauge("upload_jobs", "Tracked upload jobs by status", ("status",),
+               lambda: [((status,), count) for status, count in upload_queue.stats().items()])
+
+# In-memory index snapshots: full rebuild from Neptune, repeated every GRAPH_INDEX_REFRESH_SECONDS.
+# Writes made while the scan runs are not lost by the swap: see begin_refresh()
+def refresh_graph_index():
+    for index in (graph_index, spec_index):
+        if index:
+            index.begin_refresh()
+    with connection_pool.checkout() as conn:
+        repository = NeptuneRepository(conn.g, conn.connection)
+        parts = repository.list_parts()
+        matches = repository.list_matches() if graph_index or SNAPSHOT_DIR else []
+    _load_indexes(parts, matches)
+    if SNAPSHOT_DIR:
+        try:
+            manifest = write_snapshot(SNAPSHOT_DIR, parts, matches)
+            logger.info(f"Catalog snapshot written to {SNAPSHOT_DIR}: {manifest}")
+        except Exception:
+            logger.exception(f"Writing the catalog snapshot to {SNAPSHOT_DIR} failed")
+
+def _load_indexes(parts, matches):
+    if graph_index:
+        graph_index.load(parts, matches)
+        logger.info(f"Graph index loaded: {graph_index.stats()}")
+    if spec_index:
+        spec_index.load(parts)
+        logger.info(f"Spec index loaded: {spec_index.stats()}")
+
+# Warm start: indexes from the local snapshot, when there is a recent enough one
+def load_indexes_from_snapshot() -> bool:
+    snapshot = load_snapshot(SNAPSHOT_DIR) if SNAPSHOT_DIR else None
+    if snapshot is None or snapshot.age_seconds > SNAPSHOT_MAX_AGE_SECONDS:
+        return False
+    _load_indexes(list(snapshot.iter_parts()), snapshot.iter_matches() if graph_index else [])
+    logger.info(f"Indexes loaded from the snapshot in {SNAPSHOT_DIR} ({snapshot.manifest['created_at']})")
+    return True
+
+# Background warm-up: never blocks or fails startup; an unreachable Neptune only shows in /health/ready
+async def warm_connection_pool():
+    try:
+        await asyncio.to_thread(connection_pool.warm, NEPTUNE_POOL_WARM)
+    except Exception as e:
+        logger.warning(f"Neptune connection pool warm-up failed: {e}")
+
+async def graph_index_refresh_loop():
+    # The snapshot only bridges the first Neptune scan, which starts right after it is loaded
+    try:
+        await asyncio.to_thread(load_indexes_from_snapshot)
+    except Exception:
+        logger.exception("Loading the catalog snapshot failed; indexes load from Neptune")
+    while True:
+        try:
+            await asyncio.to_thread(refresh_graph_index)
+        except Exception:
+            logger.exception("Graph index refresh failed; match reads fall back to Neptune")
+        await asyncio.sleep(GRAPH_INDEX_REFRESH_SECONDS)
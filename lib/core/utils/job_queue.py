@@ -0,0 +1,114 @@
+# lib/core/utils/job_queue.py
+
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+from lib.core.logging import logger
+
+class Job:
+    """
+    One unit of background work. payload holds whatever the handler needs to (re)run the
+    job; progress is an object the handler updates while it runs.
+    """
+
+    def __init__(self, payload: dict, progress: Any = None):
+        self.id = uuid.uuid4().hex
+        self.payload = payload
+        self.progress = progress
+        self.status = "queued"
+        self.attempts = 0
+        self.error: Optional[str] = None
+        self.result: Any = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+
+class JobQueue:
+    """
+    In-process async job queue with bounded concurrency.
+    Workers start lazily on the running event loop at first submit. Finished jobs are kept
+    (up to max_history) so their status can be read back, and failed ones can be retried.
+    """
+
+    def __init__(self, handler: Callable[[Job], Awaitable[Any]], concurrency: int = None,
+                 max_history: int = None, on_evict: Callable[[Job], None] = None):
+        self.handler = handler
+        self.concurrency = concurrency or int(os.getenv("UPLOAD_JOB_CONCURRENCY", 2))
+        self.max_history = max_history or int(os.getenv("UPLOAD_JOB_HISTORY", 1000))
+        self.on_evict = on_evict
+        self._jobs = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers = []
+
+    def _ensure_workers(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            job.attempts += 1
+            job.started_at = time.time()
+            job.finished_at = None
+            job.error = None
+            try:
+                job.result = await self.handler(job)
+                job.status = "succeeded"
+            except Exception as e:
+                job.status = "failed"
+                job.error = str(e)
+                logger.exception(f"Job {job.id} failed (attempt {job.attempts})")
+            finally:
+                job.finished_at = time.time()
+                self._queue.task_done()
+
+    def _evict(self):
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.max_history:
+                break
+            job = self._jobs[job_id]
+            if job.status in ("queued", "running"):
+                continue
+            del self._jobs[job_id]
+            if self.on_evict:
+                self.on_evict(job)
+
+    def submit(self, job: Job) -> Job:
+        self._ensure_workers()
+        self._jobs[job.id] = job
+        self._evict()
+        self._queue.put_nowait(job)
+        return job
+
+    def retry(self, job_id: str) -> Optional[Job]:
+        """Re-queues a failed job under the same id; returns None if it cannot be retried."""
+        job = self._jobs.get(job_id)
+        if job is None or job.status != "failed":
+            return None
+        job.status = "queued"
+        self._ensure_workers()
+        self._queue.put_nowait(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def stats(self) -> dict:
+        """Number of tracked jobs per status."""
+        counts = {status: 0 for status in ("queued", "running", "succeeded", "failed")}
+        for job in list(self._jobs.values()):
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return counts
+
+    async def close(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
@@ -1,18 +1,79 @@
 
 from lib.core.logging import logger
 
-from fastapi import FastAPI
+import asyncio
+import re
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+from lib.core.metrics import METRICS_ENABLED, HTTP_SECONDS, registry
 from lib.app.adapter.input.api.v1.routers import api_router
+from lib.app.adapter.input.api.v1.controllers import health_controller
+from lib.core.utils.container import (
+    connection_pool, upload_queue, graph_index, spec_index, graph_index_refresh_loop, warm_connection_pool
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Nothing here waits on Neptune: the worker starts serving (and answers /health/live)
+    # immediately, while connections and indexes come up in the background
+    background = [asyncio.create_task(warm_connection_pool())]
+    if graph_index or spec_index:
+        background.append(asyncio.create_task(graph_index_refresh_loop()))
+    try:
+        yield
+    finally:
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        await upload_queue.close()
+        connection_pool.close()
 
 app = FastAPI(
     title="Part Matching API",
     description="API for managing parts and matches with Neptune DB",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 app.include_router(api_router, prefix="/api")
+app.include_router(health_controller.router, prefix="/health", tags=["Health"])
+
+_PATH_PARAM = re.compile(r"\{(\w+)(?::\w+)?\}")
+
+def _route_template(request: Request) -> str:
+    """
+    Route template (/api/parts/{part_number}) rather than the raw path, so the label set
+    stays bounded. Included routers report their own relative path; the prefix is whatever
+    the raw path has in front of that path once filled in.
+    """
+    route = request.scope.get("route")
+    if route is None:
+        return "unmatched"
+    params = request.scope.get("path_params", {})
+    filled = _PATH_PARAM.sub(lambda m: str(params.get(m.group(1), m.group(0))), route.path)
+    path = request.scope["path"]
+    prefix = path[:-len(filled)] if filled and path.endswith(filled) else ""
+    return prefix + route.path
+
+if METRICS_ENABLED:
+    @app.middleware("http")
+    async def record_http_latency(request: Request, call_next):
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            HTTP_SECONDS.observe(time.perf_counter() - start, request.method, _route_template(request), str(status))
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
 
 @app.get("/")
 def root():
@@ -0,0 +1,44 @@
+# scripts/auto_match.py
+#
+# Batch job: propose MATCHED edges (origin=auto) across the whole catalog and bulk-load them.
+# Usage: python -m scripts.auto_match [--min-match-type Perfect|Partial --min-score 0.75] [--dry-run]
+
+import argparse
+import asyncio
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from lib.core.logging import logger
+from lib.app.adapter.output.persistence.neptune.neptune_repository import NeptuneRepository
+from lib.app.application.use_cases.crud_part_usecase import CrudPartUseCase
+from lib.app.application.use_cases.match_part_usecase import MatchPartUseCase
+from lib.app.application.use_cases.auto_match_usecase import AutoMatchUseCase, AUTO_MATCH_MAX_BLOCK_SIZE, AUTO_MATCH_WORKERS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Propose MATCHED edges across the catalog and bulk-load them")
+    parser.add_argument("--min-match-type", default="Perfect", choices=["Perfect", "Partial"])
+    parser.add_argument("--min-score", type=float, help="lowest rule score to propose; required with Partial")
+    parser.add_argument("--max-block-size", type=int, default=AUTO_MATCH_MAX_BLOCK_SIZE)
+    parser.add_argument("--workers", type=int, default=AUTO_MATCH_WORKERS)
+    parser.add_argument("--dry-run", action="store_true", help="count proposals without loading them")
+    args = parser.parse_args()
+    if args.min_match_type != "Perfect" and args.min_score is None:
+        parser.error("--min-match-type Partial requires --min-score")
+
+    repository = NeptuneRepository()
+    try:
+        usecase = AutoMatchUseCase(
+            CrudPartUseCase(repository), MatchPartUseCase(repository),
+            min_match_type=args.min_match_type, min_score=args.min_score,
+            max_block_size=args.max_block_size, workers=args.workers
+        )
+        result = asyncio.run(usecase.execute(dry_run=args.dry_run))
+        logger.info(f"Auto-match finished: {result}")
+    finally:
+        repository.close()
+
+
+if __name__ == "__main__":
+    main()
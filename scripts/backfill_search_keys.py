@@ -0,0 +1,26 @@
+# scripts/backfill_search_keys.py
+#
+# One-shot job: write the normalized similarity search keys (spec1_key, ...) on parts stored
+# before find_similar_parts looked candidates up through them. Parts without keys are never
+# returned as similarity candidates by Neptune until this has run.
+# Usage: python -m scripts.backfill_search_keys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from lib.core.logging import logger
+from lib.app.adapter.output.persistence.neptune.neptune_repository import NeptuneRepository
+
+
+def main():
+    repository = NeptuneRepository()
+    try:
+        count = repository.backfill_search_keys()
+        logger.info(f"Search keys written for {count} parts")
+    finally:
+        repository.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+# scripts/benchmark.py
+#
+# Benchmarks upload, search, list and CRUD through the use cases, against the in-memory
+# repository (default, no Neptune needed) or a Gremlin Server/TinkerGraph/Neptune endpoint.
+# Results are written as JSON; with a baseline, regressions beyond --tolerance fail the run.
+#
+# Usage:
+#   python -m scripts.benchmark --parts 20000 --save-baseline
+#   python -m scripts.benchmark --parts 20000                      # compares with the baseline
+#   python -m scripts.benchmark --backend gremlin --gremlin-url ws://localhost:8182/gremlin
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from lib.app.adapter.output.persistence.memory.in_memory_repository import InMemoryRepository
+from lib.app.application.use_cases.crud_part_usecase import CrudPartUseCase
+from lib.app.application.use_cases.match_part_usecase import MatchPartUseCase
+from lib.app.application.use_cases.upload_file_usecase import UploadFileUseCase
+from lib.app.domain.entities.part_number import PartNumber, SPEC_FIELDS, NOTE_FIELDS
+from lib.app.domain.entities.match import Match
+from lib.app.application.services.file_service import FileService
+from scripts.benchmark_data import (
+    PART_PREFIX, synthetic_parts, synthetic_matches, write_upload_workbook, write_upload_csv, write_upload_parquet
+)
+
+RESULTS_DIR = os.path.join("benchmarks", "results")
+
+
+class Recorder:
+    """Per-operation latency samples (seconds) and item counts."""
+
+    def __init__(self):
+        self.samples = {}
+        self.items = {}
+
+    def time(self, name: str, fn, *args, items: int = 1):
+        start = time.perf_counter()
+        result = fn(*args)
+        self.samples.setdefault(name, []).append(time.perf_counter() - start)
+        self.items[name] = self.items.get(name, 0) + items
+        return result
+
+    def add(self, name: str, seconds: float, items: int):
+        self.samples.setdefault(name, []).append(seconds)
+        self.items[name] = self.items.get(name, 0) + items
+
+    def summary(self) -> dict:
+        results = {}
+        for name, samples in self.samples.items():
+            ordered = sorted(samples)
+            total = sum(samples)
+            pick = lambda q: ordered[min(int(q * len(ordered)), len(ordered) - 1)] * 1000
+            results[name] = {
+                "calls": len(samples),
+                "items": self.items[name],
+                "items_per_second": round(self.items[name] / total, 1) if total else None,
+                "mean_ms": round(statistics.fmean(samples) * 1000, 4),
+                "p50_ms": round(pick(0.50), 4),
+                "p95_ms": round(pick(0.95), 4),
+                "p99_ms": round(pick(0.99), 4),
+                "max_ms": round(ordered[-1] * 1000, 4)
+            }
+        return results
+
+
+def make_repository(args):
+    if args.backend == "memory":
+        return InMemoryRepository(), None
+    from gremlin_python.process.anonymous_traversal import traversal
+    from gremlin_python.driver.driver_remote_connection import DriverRemoteConnection
+    from lib.app.adapter.output.persistence.neptune.neptune_repository import NeptuneRepository
+
+    connection = DriverRemoteConnection(args.gremlin_url, "g")
+    return NeptuneRepository(traversal().with_remote(connection), connection), connection
+
+
+def drop_benchmark_data(repository):
+    """Removes every synthetic part (and with it, its edges); only used on Gremlin backends."""
+    from gremlin_python.process.traversal import TextP
+    repository.g.V().has("PartNumber", "part_number", TextP.startingWith(PART_PREFIX)).drop().iterate()
+
+
+def bench_seed(rec, part_usecase, match_usecase, parts, matches, chunk_size, ops, rng):
+    """
+    Seeds the catalog. Single-edge lookups are sampled at half and at all of the edges:
+    the two scaling.get_match_* rows should stay flat as the edge count doubles.
+    """
+    for start in range(0, len(parts), chunk_size):
+        chunk = parts[start:start + chunk_size]
+        rec.time("seed.create_parts_bulk", part_usecase.create_parts_bulk, chunk, chunk_size, items=len(chunk))
+    half = len(matches) // 2
+    for name, batch in (("half", matches[:half]), ("full", matches[half:])):
+        for start in range(0, len(batch), chunk_size):
+            chunk = batch[start:start + chunk_size]
+            rec.time("seed.create_matches_bulk", match_usecase.create_matches_bulk, chunk, chunk_size, items=len(chunk))
+        for match in rng.sample(matches[:half], min(ops, half)):
+            rec.time(f"scaling.get_match_{name}_edges", match_usecase.get_match, match.source, match.target)
+
+
+def bench_upload(rec, part_usecase, match_usecase, rows, seed):
+    with tempfile.TemporaryDirectory(prefix="benchmark_upload_") as directory:
+        path = os.path.join(directory, "upload.xlsx")
+        write_upload_workbook(path, rows, seed)
+        usecase = UploadFileUseCase(part_usecase, match_usecase, backup_to_s3=False, ingest_mode="gremlin")
+        with open(path, "rb") as f:
+            start = time.perf_counter()
+            asyncio.run(usecase.execute(f, "upload.xlsx"))
+            rec.add("upload.gremlin", time.perf_counter() - start, rows)
+
+
+def bench_parse(rec, rows, seed, chunk_size):
+    """Parsing alone (format detection, reading, column normalization) for each upload format."""
+    writers = {"xlsx": write_upload_workbook, "csv": write_upload_csv, "parquet": write_upload_parquet}
+    service = FileService()
+    with tempfile.TemporaryDirectory(prefix="benchmark_parse_") as directory:
+        for format, write in writers.items():
+            path = os.path.join(directory, f"upload.{format}")
+            write(path, rows, seed)
+            with open(path, "rb") as f:
+                start = time.perf_counter()
+                chunks = service.iter_chunks(f, service.detect_format(f, path), chunk_size)
+                parsed = sum(len(columns["Input Part Number"]) for columns in chunks)
+                rec.add(f"parse.{format}", time.perf_counter() - start, parsed)
+
+
+def bench_crud(rec, part_usecase, match_usecase, parts, ops, rng):
+    for i in range(ops):
+        template = rng.choice(parts)
+        part = PartNumber(f"{PART_PREFIX}CRUD-{i:06d}", **{f: getattr(template, f) for f in SPEC_FIELDS + NOTE_FIELDS})
+        rec.time("crud.create_part", part_usecase.create_part, part)
+        rec.time("crud.get_part", part_usecase.get_part, part.part_number)
+        part.spec1 = "Updated"
+        rec.time("crud.update_part", part_usecase.update_part, part)
+        match = Match(part.part_number, template.part_number, "Partial")
+        rec.time("crud.create_match", match_usecase.create_match, match)
+        rec.time("crud.get_match", match_usecase.get_match, match.source, match.target)
+        rec.time("crud.update_match", match_usecase.update_match, Match(match.source, match.target, "Perfect"))
+        rec.time("crud.delete_match", match_usecase.delete_match, match.source, match.target)
+        rec.time("crud.delete_part", part_usecase.delete_part, part.part_number)
+
+
+def bench_search(rec, part_usecase, match_usecase, parts, ops, rng):
+    for _ in range(ops):
+        part = rng.choice(parts)
+        rec.time("search.matches_for_part", match_usecase.get_matches_for_part, part.part_number)
+        rec.time("search.replacements_depth3", match_usecase.find_replacements, part.part_number, 3)
+        profile = {f: getattr(part, f) for f in SPEC_FIELDS[:3]}
+        rec.time("search.similar_k10", part_usecase.find_similar_parts, profile, 10, part.part_number)
+        batch = [p.part_number for p in rng.sample(parts, min(50, len(parts)))]
+        rec.time("search.matches_batch50", match_usecase.get_matches_for_parts, batch, items=len(batch))
+
+
+def bench_list(rec, part_usecase, match_usecase, page_size, max_pages):
+    cursor = None
+    for _ in range(max_pages):
+        page = rec.time("list.parts_page", part_usecase.list_parts, page_size, cursor, items=0)
+        rec.items["list.parts_page"] += len(page)
+        if len(page) < page_size:
+            break
+        cursor = page[-1].part_number
+    cursor = None
+    for _ in range(max_pages):
+        page = rec.time("list.matches_page", match_usecase.list_matches, page_size, cursor, items=0)
+        rec.items["list.matches_page"] += len(page)
+        if len(page) < page_size:
+            break
+        cursor = (page[-1].source, page[-1].target)
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list:
+    """
+    Operations whose p95 latency rose, or whose throughput fell, by more than tolerance.
+    Latency changes under min_delta_ms are timer noise on microsecond operations and ignored.
+    """
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        if base["p95_ms"] and current["p95_ms"] > base["p95_ms"] * (1 + tolerance) \
+                and current["p95_ms"] - base["p95_ms"] >= min_delta_ms:
+            regressions.append(f"{name}: p95 {base['p95_ms']}ms -> {current['p95_ms']}ms")
+        if base["items_per_second"] and current["items_per_second"] is not None \
+                and current["items_per_second"] < base["items_per_second"] * (1 - tolerance) \
+                and current["mean_ms"] - base["mean_ms"] >= min_delta_ms:
+            regressions.append(f"{name}: {base['items_per_second']}/s -> {current['items_per_second']}/s")
+    return regressions
+
+
+def print_table(results: dict):
+    print(f"{'operation':32} {'calls':>7} {'items/s':>12} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    for name, r in results.items():
+        print(f"{name:32} {r['calls']:>7} {r['items_per_second'] or 0:>12} {r['p50_ms']:>10} {r['p95_ms']:>10} {r['p99_ms']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark upload, search, list and CRUD")
+    parser.add_argument("--backend", choices=["memory", "gremlin"], default="memory")
+    parser.add_argument("--gremlin-url", default=os.getenv("BENCHMARK_GREMLIN_URL", "ws://localhost:8182/gremlin"))
+    parser.add_argument("--parts", type=int, default=10000, help="synthetic catalog size")
+    parser.add_argument("--matches-per-part", type=int, default=2)
+    parser.add_argument("--upload-rows", type=int, default=2000)
+    parser.add_argument("--ops", type=int, default=500, help="samples per CRUD/search operation")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--max-pages", type=int, default=20)
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="results file (default benchmarks/results/<backend>-<timestamp>.json)")
+    parser.add_argument("--baseline", help="baseline file (default benchmarks/baseline-<backend>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05, help="ignore latency changes smaller than this")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    repository, connection = make_repository(args)
+    part_usecase, match_usecase = CrudPartUseCase(repository), MatchPartUseCase(repository)
+    parts = synthetic_parts(args.parts, args.seed)
+    matches = synthetic_matches(parts, args.matches_per_part, args.seed)
+
+    rec = Recorder()
+    try:
+        if connection:
+            drop_benchmark_data(repository)
+        bench_seed(rec, part_usecase, match_usecase, parts, matches, args.chunk_size, args.ops, rng)
+        bench_upload(rec, part_usecase, match_usecase, args.upload_rows, args.seed)
+        bench_parse(rec, args.upload_rows, args.seed, args.chunk_size)
+        bench_crud(rec, part_usecase, match_usecase, parts, args.ops, rng)
+        bench_search(rec, part_usecase, match_usecase, parts, args.ops, rng)
+        bench_list(rec, part_usecase, match_usecase, args.page_size, args.max_pages)
+    finally:
+        if connection:
+            drop_benchmark_data(repository)
+            connection.close()
+
+    results = rec.summary()
+    report = {
+        "backend": args.backend,
+        "parts": args.parts,
+        "matches": len(matches),
+        "upload_rows": args.upload_rows,
+        "ops": args.ops,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "results": results
+    }
+    print_table(results)
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output = args.output or os.path.join(RESULTS_DIR, f"{args.backend}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    baseline_path = args.baseline or os.path.join("benchmarks", f"baseline-{args.backend}.json")
+    if args.save_baseline:
+        with open(baseline_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {baseline_path}")
+    elif os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            regressions = compare(results, json.load(f), args.tolerance, args.min_delta_ms)
+        if regressions:
+            print(f"\nRegressions against {baseline_path} (tolerance {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions against {baseline_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# scripts/benchmark_data.py
+#
+# Synthetic catalogs and upload spreadsheets for scripts/benchmark.py.
+
+import random
+from typing import List
+from lib.app.domain.entities.part_number import PartNumber, SPEC_FIELDS, NOTE_FIELDS
+from lib.app.domain.entities.match import Match
+
+# Every synthetic part number starts with this, so benchmark data can be told apart and dropped
+PART_PREFIX = "BENCH-"
+
+# Value pools per field, shaped like the Neptune_Parts_Upload_Template.xlsx example rows
+VALUES = {
+    "spec1": ["Steel", "Aluminum", "Brass", "Copper", "Titanium", "Nylon", "PTFE", "Cast Iron"],
+    "spec2": [f"{d}mm" for d in range(2, 42, 2)],
+    "spec3": [f"{h} HRC" for h in range(20, 66, 3)],
+    "spec4": ["Polished", "Matte", "Brushed", "Anodized", "Raw"],
+    "spec5": ["Round", "Hex", "Square", "Flat", "Flanged"],
+    "note1": ["Zinc", "Galvanized", "Nickel", "Chrome", ""],
+    "note2": ["Layered", "Single", "Double", ""],
+    "note3": ["Heat-treated", "Coated", "Annealed", ""],
+}
+
+UPLOAD_HEADER = [
+    "S.No.",
+    "Input Part Number", *[f"Input Spec {i}" for i in range(1, 6)], *[f"Input Note {i}" for i in range(1, 4)],
+    "Output Part Number", *[f"Output Spec {i}" for i in range(1, 6)], *[f"Output Note {i}" for i in range(1, 4)],
+    "Match Type"
+]
+UPLOAD_TEMPLATE_ROW = [
+    "Template",
+    "model", "Material", "Diameter", "Hardness", "Finish", "Shape", "Coating", "Layer", "Treatment",
+    "model", "Material", "Diameter", "Hardness", "Finish", "Shape", "Coating", "Layer", "Treatment",
+    "Perfect / Partial / No Match"
+]
+
+def synthetic_parts(count: int, seed: int = 0, prefix: str = PART_PREFIX) -> List[PartNumber]:
+    rng = random.Random(seed)
+    return [
+        PartNumber(f"{prefix}{i:07d}", **{f: rng.choice(VALUES[f]) for f in SPEC_FIELDS + NOTE_FIELDS})
+        for i in range(count)
+    ]
+
+def synthetic_matches(parts: List[PartNumber], per_part: int, seed: int = 0) -> List[Match]:
+    """per_part outgoing matches per part to random other parts; no self-matches, no repeats."""
+    rng = random.Random(seed)
+    matches, seen = [], set()
+    for source in parts:
+        for _ in range(per_part):
+            target = rng.choice(parts)
+            key = (source.part_number, target.part_number)
+            if target is source or key in seen:
+                continue
+            seen.add(key)
+            matches.append(Match(source.part_number, target.part_number, rng.choice(["Perfect", "Partial", "No Match"])))
+    return matches
+
+def upload_rows(rows: int, seed: int = 0, prefix: str = PART_PREFIX + "U"):
+    """
+    Upload rows in the template layout (after the header and "Template" row): input/output
+    part pairs, about half of them with Match Type left blank for the rules to fill.
+    """
+    rng = random.Random(seed)
+    parts = synthetic_parts(max(rows // 2, 2), seed, prefix)
+    for n in range(1, rows + 1):
+        source, target = rng.sample(parts, 2)
+        yield [
+            n,
+            source.part_number, *[getattr(source, f) for f in SPEC_FIELDS + NOTE_FIELDS],
+            target.part_number, *[getattr(target, f) for f in SPEC_FIELDS + NOTE_FIELDS],
+            rng.choice(["Perfect", "Partial", None, None])
+        ]
+
+def write_upload_workbook(path: str, rows: int, seed: int = 0, prefix: str = PART_PREFIX + "U"):
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    sheet.append(UPLOAD_HEADER)
+    sheet.append(UPLOAD_TEMPLATE_ROW)
+    for row in upload_rows(rows, seed, prefix):
+        sheet.append(row)
+    workbook.save(path)
+
+def write_upload_csv(path: str, rows: int, seed: int = 0, prefix: str = PART_PREFIX + "U"):
+    import csv
+
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(UPLOAD_HEADER)
+        writer.writerow(UPLOAD_TEMPLATE_ROW)
+        writer.writerows(upload_rows(rows, seed, prefix))
+
+def write_upload_parquet(path: str, rows: int, seed: int = 0, prefix: str = PART_PREFIX + "U"):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = list(zip(*upload_rows(rows, seed, prefix)))
+    pq.write_table(pa.table({name: list(values) for name, values in zip(UPLOAD_HEADER, columns)}), path)
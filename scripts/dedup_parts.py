@@ -0,0 +1,25 @@
+# scripts/dedup_parts.py
+#
+# One-shot job: merge duplicate PartNumber vertices created before parts were upserted and move
+# parts still under a random vertex id onto their deterministic id (needed before bulk ingest).
+# Usage: python -m scripts.dedup_parts
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from lib.core.logging import logger
+from lib.app.adapter.output.persistence.neptune.neptune_repository import NeptuneRepository
+
+
+def main():
+    repository = NeptuneRepository()
+    try:
+        result = repository.merge_duplicate_parts()
+        logger.info(f"Duplicate parts merged: {result}")
+    finally:
+        repository.close()
+
+
+if __name__ == "__main__":
+    main()
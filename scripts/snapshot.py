@@ -0,0 +1,65 @@
+# scripts/snapshot.py
+#
+# Catalog snapshots: export the PartNumber/MATCHED graph from Neptune to Arrow IPC (what API
+# workers warm-start from, see SNAPSHOT_DIR) or Parquet (offline analysis), or describe one.
+# Usage:
+#   python -m scripts.snapshot export --output snapshots/catalog [--format arrow|parquet]
+#   python -m scripts.snapshot info snapshots/catalog
+
+import argparse
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from lib.core.logging import logger
+from lib.app.adapter.output.persistence.neptune.neptune_repository import NeptuneRepository
+from lib.app.adapter.output.persistence.snapshot.catalog_snapshot import (
+    SNAPSHOT_CHUNK_SIZE, SNAPSHOT_FORMATS, load_snapshot, write_snapshot
+)
+from lib.app.application.use_cases.crud_part_usecase import CrudPartUseCase
+from lib.app.application.use_cases.match_part_usecase import MatchPartUseCase
+
+
+def export(args):
+    repository = NeptuneRepository()
+    try:
+        # Streamed: parts and matches are paged out of Neptune while the files are written
+        manifest = write_snapshot(
+            args.output,
+            CrudPartUseCase(repository).iter_parts(args.batch_size),
+            MatchPartUseCase(repository).iter_matches(args.batch_size),
+            args.format, args.chunk_size
+        )
+        logger.info(f"Snapshot written to {args.output}: {manifest}")
+    finally:
+        repository.close()
+
+
+def info(args):
+    snapshot = load_snapshot(args.directory)
+    if snapshot is None:
+        raise SystemExit(f"No snapshot in {args.directory}")
+    print(f"{snapshot.manifest['format']} snapshot, created {snapshot.manifest['created_at']} "
+          f"({snapshot.age_seconds / 3600:.1f}h ago)")
+    print(f"parts:   {snapshot.parts.num_rows} rows, {snapshot.parts.nbytes / 1e6:.1f} MB")
+    print(f"matches: {snapshot.matches.num_rows} rows, {snapshot.matches.nbytes / 1e6:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export or describe catalog snapshots")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser("export", help="write a snapshot from Neptune")
+    export_parser.add_argument("--output", required=True, help="snapshot directory")
+    export_parser.add_argument("--format", choices=sorted(SNAPSHOT_FORMATS), default="arrow")
+    export_parser.add_argument("--batch-size", type=int, default=10_000, help="parts/matches per Neptune page")
+    export_parser.add_argument("--chunk-size", type=int, default=SNAPSHOT_CHUNK_SIZE, help="rows per record batch")
+    export_parser.set_defaults(run=export)
+    info_parser = commands.add_parser("info", help="describe a snapshot")
+    info_parser.add_argument("directory")
+    info_parser.set_defaults(run=info)
+    args = parser.parse_args()
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
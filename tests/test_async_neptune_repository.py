@@ -0,0 +1,45 @@
+# tests/test_async_neptune_repository.py
+#
+# The async repository must cover the whole repository port and run every call through
+# the decorated repository, on a connection checked out of the pool.
+
+import asyncio
+import inspect
+from contextlib import asynccontextmanager
+from lib.app.adapter.output.persistence.memory.in_memory_repository import InMemoryRepository
+from lib.app.adapter.output.persistence.neptune.async_neptune_repository import AsyncNeptuneRepository
+from lib.app.application.services.repository_interface import RepositoryInterface
+from lib.app.domain.entities.match import Match
+from lib.app.domain.entities.part_number import PartNumber
+
+class FakeConnection:
+    g, connection = object(), None
+
+class FakePool:
+    def __init__(self):
+        self.checkouts = 0
+
+    @asynccontextmanager
+    async def acheckout(self, timeout: float = None):
+        self.checkouts += 1
+        yield FakeConnection()
+
+def test_covers_every_repository_method():
+    port = {name for name, _ in inspect.getmembers(RepositoryInterface, inspect.isfunction) if not name.startswith("_")}
+    for name in port:
+        assert inspect.iscoroutinefunction(getattr(AsyncNeptuneRepository, name, None)), name
+
+def test_calls_go_through_the_decorated_repository():
+    backend, pool = InMemoryRepository(), FakePool()
+    repository = AsyncNeptuneRepository(pool, lambda neptune: backend)
+
+    async def scenario():
+        for part_number in "AB":
+            await repository.create_part(PartNumber(part_number, "Steel", "M3", "", "", ""))
+        await repository.create_match(Match("A", "B", "Perfect", 1.0))
+        return await repository.get_matches_for_part("A"), await repository.list_matches(10)
+
+    result, matches = asyncio.run(scenario())
+    assert [m["replacement_part"].part_number for m in result["matches"]] == ["B"]
+    assert [(m.source, m.target) for m in matches] == [("A", "B")]
+    assert pool.checkouts == 5
@@ -0,0 +1,44 @@
+# tests/test_cached_repository.py
+#
+# Part writes through the cache must drop their neighbours' cached results, whether or
+# not the written part's own search result was ever cached.
+
+import pytest
+from lib.app.adapter.output.persistence.cache.cached_repository import CachedRepository
+from lib.app.adapter.output.persistence.memory.in_memory_repository import InMemoryRepository
+from lib.app.domain.entities.match import Match
+from lib.app.domain.entities.part_number import PartNumber
+from lib.core.cache.cache_backend import InMemoryCacheBackend
+
+def part(part_number: str, spec: str = "Steel") -> PartNumber:
+    return PartNumber(part_number, spec, "M3", "10mm", "", "")
+
+@pytest.fixture
+def repository():
+    repository = CachedRepository(InMemoryRepository(), InMemoryCacheBackend())
+    for part_number in "ABC":
+        repository.create_part(part(part_number))
+    repository.create_match(Match("A", "B", "Perfect", 1.0))
+    repository.create_match(Match("B", "C", "Partial", 0.5))
+    return repository
+
+def neighbours(result) -> list:
+    return sorted(m["replacement_part"].part_number for m in result["matches"])
+
+def test_delete_drops_the_part_from_cached_neighbour_searches(repository):
+    assert neighbours(repository.get_matches_for_part("B")) == ["A", "C"]
+    assert repository.get_match("B", "C") is not None
+
+    repository.delete_part("C")
+
+    assert neighbours(repository.get_matches_for_part("B")) == ["A"]
+    assert repository.get_match("B", "C") is None
+
+def test_update_refreshes_cached_neighbour_searches(repository):
+    repository.get_matches_for_part("B")
+
+    repository.update_part(part("C", "Brass"))
+
+    result = repository.get_matches_for_part("B")
+    specs = {m["replacement_part"].part_number: m["replacement_part"].spec1 for m in result["matches"]}
+    assert specs["C"] == "Brass"
@@ -0,0 +1,31 @@
+# tests/test_file_service.py
+
+import io
+import re
+import zipfile
+from lib.app.application.services.file_service import FileService
+from scripts.benchmark_data import write_upload_workbook
+
+def with_dimension(data: bytes, ref: str) -> bytes:
+    """The workbook with the sheet dimension rewritten to ref, as a careless writer records it."""
+    source, target = zipfile.ZipFile(io.BytesIO(data)), io.BytesIO()
+    with zipfile.ZipFile(target, "w") as out:
+        for item in source.infolist():
+            content = source.read(item.filename)
+            if item.filename.startswith("xl/worksheets/"):
+                content = re.sub(rb"<dimension [^>]*/>", b"", content)
+                content = content.replace(b"</sheetPr>", f'</sheetPr><dimension ref="{ref}"/>'.encode(), 1)
+                assert ref.encode() in content
+            out.writestr(item, content)
+    return target.getvalue()
+
+def test_xlsx_row_count_matches_the_rows_read(tmp_path):
+    path = tmp_path / "upload.xlsx"
+    write_upload_workbook(str(path), 40)
+    service = FileService()
+
+    for ref in ("A1:A1", "A1:T5000"):
+        data = with_dimension(path.read_bytes(), ref)
+        read = sum(len(c["S.No."]) for c in service.iter_chunks(io.BytesIO(data), "xlsx", 16))
+        assert read == 40
+        assert service.count_rows(io.BytesIO(data), "xlsx") == read
@@ -0,0 +1,33 @@
+# tests/test_indexed_repository.py
+#
+# Reads the in-memory index cannot answer (parts dirty until the next refresh) must fall
+# back to the wrapped repository rather than look like a missing part.
+
+from lib.app.adapter.output.persistence.memory.graph_index import GraphIndex
+from lib.app.adapter.output.persistence.memory.in_memory_repository import InMemoryRepository
+from lib.app.adapter.output.persistence.memory.indexed_repository import IndexedRepository
+from lib.app.domain.entities.match import Match
+from lib.app.domain.entities.part_number import PartNumber
+
+def make_repository() -> IndexedRepository:
+    backend = InMemoryRepository()
+    parts = [PartNumber(part_number, "Steel", "M3", "", "", "") for part_number in "ABC"]
+    matches = [Match("A", "B", "Partial", 0.6), Match("B", "C", "Partial", 0.5)]
+    for part in parts:
+        backend.create_part(part)
+    for match in matches:
+        backend.create_match(match)
+    index = GraphIndex()
+    index.load(parts, matches)
+    return IndexedRepository(backend, index)
+
+def test_in_process_replacements_fall_back_when_the_index_is_dirty():
+    repository = make_repository()
+    expected = repository.repository.find_replacements("A", 3, ["Partial"], True)
+    assert expected is not None
+    assert repository.find_replacements("A", 3, ["Partial"], True) == expected
+
+    repository.invalidate(["C"])
+
+    assert repository.index.find_replacements("A", 3, ["Partial"]) is None
+    assert repository.find_replacements("A", 3, ["Partial"], True) == expected
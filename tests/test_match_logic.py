@@ -0,0 +1,63 @@
+# tests/test_match_logic.py
+#
+# Randomized equivalence check: the vectorized batch path must classify every pair exactly
+# like the per-pair path. Seeded, so failures reproduce.
+
+import random
+import pytest
+from lib.app.domain.entities.part_number import SPEC_FIELDS, NOTE_FIELDS
+from lib.app.domain.services.match_logic import MatchLogic
+from lib.app.domain.services.match_rules import MatchRules, RULE_FIELDS
+
+# Empty, whitespace-only, padded, case-varied and unit-varied spellings of a few values
+VALUES = ["", " ", "  ", None, "Steel", "steel", "STEEL", " Steel ", "Steel\t", "Brass", "brass ",
+          "10k", "10 K", "10000", "10,000", "4.7kohm", "4700ohm", "M3", "m3", "Zinc", "zinc  plated"]
+
+def random_pairs(rng: random.Random, n: int):
+    """n pairs of (input specs, input notes, output specs, output notes) rows."""
+    rows = []
+    for _ in range(n):
+        input_values = [rng.choice(VALUES) for _ in RULE_FIELDS]
+        # Output mostly copies the input with a few fields changed, so every tier shows up
+        output_values = [v if rng.random() < 0.6 else rng.choice(VALUES) for v in input_values]
+        rows.append((input_values[:5], input_values[5:], output_values[:5], output_values[5:]))
+    return rows
+
+def per_pair(logic: MatchLogic, rows):
+    return [
+        logic.score_match(dict(zip(SPEC_FIELDS, i_s)), dict(zip(NOTE_FIELDS, i_n)),
+                          dict(zip(SPEC_FIELDS, o_s)), dict(zip(NOTE_FIELDS, o_n)))
+        for i_s, i_n, o_s, o_n in rows
+    ]
+
+def batch_columns(rows):
+    return [[row[k] for row in rows] for k in range(4)]
+
+@pytest.mark.parametrize("seed", range(25))
+def test_determine_match_batch_matches_determine_match(seed):
+    rng = random.Random(seed)
+    rows = random_pairs(rng, rng.randint(1, 200))
+    expected = [
+        MatchLogic.determine_match(dict(zip(SPEC_FIELDS, i_s)), dict(zip(NOTE_FIELDS, i_n)),
+                                   dict(zip(SPEC_FIELDS, o_s)), dict(zip(NOTE_FIELDS, o_n)))
+        for i_s, i_n, o_s, o_n in rows
+    ]
+    assert list(MatchLogic.determine_match_batch(*batch_columns(rows))) == expected
+
+def test_determine_match_batch_empty():
+    assert len(MatchLogic.determine_match_batch([], [], [], [])) == 0
+
+@pytest.mark.parametrize("seed", range(25))
+def test_score_match_batch_matches_score_match_with_normalizers(seed):
+    rng = random.Random(seed)
+    logic = MatchLogic(MatchRules({
+        "fields": {
+            f: {"weight": rng.choice([0.5, 1, 2, 3]),
+                "normalizers": rng.sample(["whitespace", "unit", "case"], rng.randint(0, 3))}
+            for f in RULE_FIELDS
+        },
+        "tiers": {"Perfect": 0.95, "Partial": 0.4}
+    }))
+    rows = random_pairs(rng, rng.randint(1, 200))
+    scores, types = logic.score_match_batch(*batch_columns(rows))
+    assert list(zip(scores.tolist(), types.tolist())) == per_pair(logic, rows)
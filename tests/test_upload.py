@@ -0,0 +1,105 @@
+# tests/test_upload.py
+#
+# Uploads into the in-memory repository. Bulk mode runs against a fake Neptune loader that,
+# like the real one, keys loaded edges by their ~id.
+
+import asyncio
+import csv
+import gzip
+import os
+import pytest
+import lib.app.application.use_cases.upload_file_usecase as upload
+from lib.app.adapter.output.persistence.memory.in_memory_repository import InMemoryRepository
+from lib.app.application.use_cases.crud_part_usecase import CrudPartUseCase
+from lib.app.application.use_cases.match_part_usecase import MatchPartUseCase
+from scripts.benchmark_data import write_upload_csv
+
+class FakeLoader:
+    """Stands in for S3 + the bulk loader: every edge row is stored under its ~id."""
+    def __init__(self):
+        self.edges = {}
+        self.loads = 0
+
+    async def upload(self, files):
+        for path, _ in files:
+            if not os.path.basename(path).startswith("edges"):
+                continue
+            with gzip.open(path, "rt", newline="") as f:
+                for row in csv.DictReader(f):
+                    assert row["~id"], "edge rows need an ~id"
+                    self.edges[row["~id"]] = (row["~from"], row["~to"])
+
+    async def trigger(self, source, mode):
+        self.loads += 1
+        return {"payload": {"loadId": f"load-{self.loads}"}}
+
+    async def status(self, load_id):
+        return {"payload": {"overallStatus": {"status": "LOAD_COMPLETED"}}}
+
+@pytest.fixture
+def loader(monkeypatch):
+    fake = FakeLoader()
+    monkeypatch.setattr(upload, "upload_files_to_s3_async", fake.upload)
+    monkeypatch.setattr(upload, "trigger_bulk_load", fake.trigger)
+    monkeypatch.setattr(upload, "get_bulk_load_status", fake.status)
+    monkeypatch.setattr(upload, "BULK_LOAD_POLL_SECONDS", 0)
+    return fake
+
+def run_upload(repository, path):
+    usecase = upload.UploadFileUseCase(CrudPartUseCase(repository), MatchPartUseCase(repository),
+                                       backup_to_s3=False, ingest_mode="bulk", chunk_size=50)
+    with open(path, "rb") as f:
+        return asyncio.run(usecase.execute(f, "upload.csv"))
+
+def test_bulk_reupload_does_not_duplicate_edges(loader, tmp_path):
+    path = tmp_path / "upload.csv"
+    write_upload_csv(str(path), 300)
+    repository = InMemoryRepository()
+
+    run_upload(repository, path)
+    first = dict(loader.edges)
+    run_upload(repository, path)
+
+    assert loader.loads == 2
+    assert loader.edges == first
+    assert len(set(first.values())) == len(first)
+
+def test_bulk_load_with_unreadable_status_fails(loader, monkeypatch, tmp_path):
+    async def unreadable(load_id):
+        raise ConnectionError("loader unreachable")
+    monkeypatch.setattr(upload, "get_bulk_load_status", unreadable)
+    monkeypatch.setattr(upload, "BULK_LOAD_MAX_STATUS_ERRORS", 3)
+    path = tmp_path / "upload.csv"
+    write_upload_csv(str(path), 20)
+
+    with pytest.raises(RuntimeError, match="unreadable 3 times"):
+        run_upload(InMemoryRepository(), path)
+
+def test_stuck_bulk_load_fails_at_the_deadline(loader, monkeypatch, tmp_path):
+    async def in_progress(load_id):
+        return {"payload": {"overallStatus": {"status": "LOAD_IN_PROGRESS"}}}
+    monkeypatch.setattr(upload, "get_bulk_load_status", in_progress)
+    monkeypatch.setattr(upload, "BULK_LOAD_POLL_SECONDS", 0.01)
+    monkeypatch.setattr(upload, "BULK_LOAD_TIMEOUT_SECONDS", 0.05)
+    path = tmp_path / "upload.csv"
+    write_upload_csv(str(path), 20)
+
+    with pytest.raises(RuntimeError, match="not final"):
+        run_upload(InMemoryRepository(), path)
+
+def test_changed_matches_are_reported_as_updates(tmp_path):
+    path = tmp_path / "upload.csv"
+    write_upload_csv(str(path), 20)
+    repository = InMemoryRepository()
+    usecase = upload.UploadFileUseCase(CrudPartUseCase(repository), MatchPartUseCase(repository),
+                                       backup_to_s3=False, ingest_mode="gremlin", delta=True)
+    with open(path, "rb") as f:
+        first = asyncio.run(usecase.execute(f, "upload.csv"))
+    rows = path.read_text().splitlines()
+    rows[2] = rows[2].rsplit(",", 1)[0] + ",No Match"
+    path.write_text("\n".join(rows) + "\n")
+    with open(path, "rb") as f:
+        second = asyncio.run(usecase.execute(f, "upload.csv"))
+
+    assert first["edges_updated"] == 0
+    assert (second["edges_created"], second["edges_updated"]) == (0, 1)